@@ -7,7 +7,7 @@ Automatically starts Node.js backend and Prometheus on startup.
 import sys
 import os
 import argparse
-from flask import Flask, render_template, jsonify, request
+from flask import Flask, render_template, jsonify, request, abort, Response
 import requests
 import logging
 from datetime import datetime
@@ -16,10 +16,24 @@ import atexit
 import time
 import socket
 import platform
+import threading
+import urllib3
+from werkzeug.serving import is_running_from_reloader
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
 
 # Add backend directory to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'backend'))
-from database import get_datastore
+from database import get_datastore, UnknownFieldError
+from assets import AssetManifest
+from health import BackendHealthTracker
+from metrics import RequestMetrics, mark_process_dead
+from circuit_breaker import CircuitBreaker, CircuitOpenError
+from admission import AdmissionController, AdmissionRejected
+from hedging import Hedger
+from response_cache import ResponseCache, cache_key
+from log_queue import RequestLogQueue, LogQueueFull, validate_request_record
+from columnar import dicts_to_columnar
+from compression import ResponseCompressor
 
 # Configure logging
 logging.basicConfig(
@@ -33,9 +47,18 @@ db = get_datastore()
 
 app = Flask(__name__)
 
+# Per-route latency, in-flight and upstream call metrics
+request_metrics = RequestMetrics()
+request_metrics.init_app(app)
+
+# gzip/deflate for large API responses (levels and threshold set in main())
+compressor = ResponseCompressor(min_size=1024, gzip_level=6, deflate_level=6, metrics=request_metrics)
+compressor.init_app(app)
+
 # Configuration
 BACKEND_URL = "http://localhost:3000"
 DEFAULT_PORT = 8080
+AI_SERVICES = ['gemini', 'cohere', 'huggingface']
 
 # Global process tracking
 monitoring_processes = {
@@ -43,30 +66,125 @@ monitoring_processes = {
     'backend': None
 }  # type: dict
 
+# PID of the process that owns monitoring_processes
+MAIN_PID = os.getpid()
+
+# Fail fast while the backend is unreachable instead of waiting out timeouts.
+# Only transport errors (connection refused, timeouts) count as failures;
+# HTTP 5xx from the backend is a normal answer (e.g. chaos-induced AI errors).
+backend_breaker = CircuitBreaker('backend', failure_threshold=3, success_threshold=1, timeout=10.0)
+
+# Per-service concurrency limits and bounded wait queues for the /ai proxy
+# (reconfigured from the command line in main())
+ai_admission = AdmissionController(AI_SERVICES, max_concurrent=8, max_queue=16, max_wait=5.0,
+                                   metrics=request_metrics)
+
+# Hedged /ai requests: opt-in per request ("hedge": true or ?hedge=1), or for
+# every request with --ai-hedging. Attempts run on their own pool so a slow
+# primary never blocks the thread that fires the hedge.
+hedge_pool = ThreadPoolExecutor(max_workers=32, thread_name_prefix='hedge')
+ai_hedger = Hedger(AI_SERVICES, hedge_pool, metrics=request_metrics)
+AI_HEDGING_DEFAULT = False
+
+# Cache of successful /ai responses: opt-in per request ("cache": true), or for
+# every request with --ai-cache. "cache": false or Cache-Control: no-cache
+# always bypasses it, for callers that need real provider behaviour.
+ai_cache = ResponseCache(max_entries=512, ttl=300.0, stale_ttl=60.0, metrics=request_metrics)
+AI_CACHE_DEFAULT = False
+# Stale entries are refreshed on their own small pool, so 30s refresh calls
+# never take threads from the /api/dashboard fan-out.
+cache_refresh_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix='cache-refresh')
+
+# Relay /ai response bytes as they arrive instead of decoding and re-encoding
+# the JSON: per request with ?stream=1, or for every request with --ai-stream.
+# Only used when the body needs no rewriting (no cache fill, no hedge).
+AI_STREAM_DEFAULT = False
+STREAM_CHUNK_SIZE = 16 * 1024
+
+# /api/log-request answers 202 and leaves the SQLite write to a background thread
+# (limits and overflow policy are reconfigured from the command line in main())
+request_log_queue = RequestLogQueue(db, max_size=10000, policy='block', block_timeout=1.0,
+                                    metrics=request_metrics)
+atexit.register(request_log_queue.close)
+
+# Last successful JSON payload per backend GET path, served while the breaker is open
+last_known_good = {}
+
+def call_backend(method, path, session=None, base_url=None, **kwargs):
+    """
+    Send a request to the Node.js backend through the circuit breaker and
+    record its duration. Raises requests.exceptions.RequestException like
+    requests itself (CircuitOpenError when rejected without a network call).
+    """
+    backend_breaker.before_call()
+    start = time.perf_counter()
+    try:
+        response = (session or requests).request(method, f"{base_url or BACKEND_URL}{path}", **kwargs)
+    except requests.exceptions.RequestException:
+        request_metrics.observe_upstream(path, 'error', time.perf_counter() - start)
+        backend_breaker.on_failure()
+        raise
+    request_metrics.observe_upstream(path, f"{response.status_code // 100}xx", time.perf_counter() - start)
+    backend_breaker.on_success()
+    return response
+
+def remember_payload(path, payload):
+    """Store a successful backend payload for serving while the breaker is open."""
+    last_known_good[path] = (payload, datetime.now().isoformat())
+
+def stale_payload(path):
+    """Return the last-known-good payload for a path, marked stale, or None."""
+    entry = last_known_good.get(path)
+    if entry is None:
+        return None
+    payload, fetched_at = entry
+    if isinstance(payload, dict):
+        return dict(payload, stale=True, fetchedAt=fetched_at)
+    return payload
+
 class DashboardAPI:
     """Handle all backend API interactions with error handling."""
     
-    def __init__(self, backend_url):
+    def __init__(self, backend_url, health_tracker=None):
         self.backend_url = backend_url
         self.session = requests.Session()
         self.timeout = 10
+        self.health_tracker = health_tracker
+    
+    def backend_down(self):
+        """True when the background health tracker last saw the backend unreachable."""
+        return self.health_tracker is not None and self.health_tracker.is_down()
     
     def get_metrics(self):
         """Fetch metrics from the backend API."""
+        if self.backend_down():
+            return stale_payload('/metrics') or self._get_fallback_metrics()
         try:
-            response = self.session.get(f"{self.backend_url}/metrics", timeout=self.timeout)
+            response = call_backend('GET', '/metrics', session=self.session,
+                                    base_url=self.backend_url, timeout=self.timeout)
             response.raise_for_status()
-            return response.json()
+            metrics = response.json()
+            remember_payload('/metrics', metrics)
+            return metrics
+        except CircuitOpenError:
+            return stale_payload('/metrics') or self._get_fallback_metrics()
         except requests.exceptions.RequestException as e:
             logger.error(f"Failed to fetch metrics: {e}")
             return self._get_fallback_metrics()
     
     def get_health_status(self):
         """Fetch AI services health status."""
+        if self.backend_down():
+            return stale_payload('/ai/health') or self._get_fallback_health()
         try:
-            response = self.session.get(f"{self.backend_url}/ai/health", timeout=self.timeout)
+            response = call_backend('GET', '/ai/health', session=self.session,
+                                    base_url=self.backend_url, timeout=self.timeout)
             response.raise_for_status()
-            return response.json()
+            health = response.json()
+            remember_payload('/ai/health', health)
+            return health
+        except CircuitOpenError:
+            return stale_payload('/ai/health') or self._get_fallback_health()
         except requests.exceptions.RequestException as e:
             logger.error(f"Failed to fetch health status: {e}")
             return self._get_fallback_health()
@@ -100,19 +218,50 @@ class DashboardAPI:
             "error": "Backend unavailable"
         }
 
+# Background backend health probe (started lazily in each process)
+health_tracker = BackendHealthTracker(BACKEND_URL)
+
 # Initialize API client
-api_client = DashboardAPI(BACKEND_URL)
+api_client = DashboardAPI(BACKEND_URL, health_tracker=health_tracker)
+
+# Fingerprinted static assets (built once per process, before workers fork)
+assets = AssetManifest(app.static_folder).build()
+
+@app.context_processor
+def inject_asset_url():
+    """Expose asset_url() to templates."""
+    return {'asset_url': assets.url_for}
 
 @app.route('/')
 def dashboard():
     """Serve the main dashboard page."""
-    # Disable caching to ensure fresh content
+    if app.debug:
+        # Pick up edited CSS/JS without restarting
+        assets.build()
+    # Disable caching on the HTML shell so it always references current bundles
     response = app.make_response(render_template('dashboard.html'))
     response.headers['Cache-Control'] = 'no-cache, no-store, must-revalidate'
     response.headers['Pragma'] = 'no-cache'
     response.headers['Expires'] = '0'
     return response
 
+@app.route('/assets/<path:filename>')
+def fingerprinted_asset(filename):
+    """Serve a content-hashed static bundle with long-lived caching."""
+    asset = assets.get(filename)
+    if asset is None:
+        abort(404)
+
+    use_gzip = asset.gzip_data is not None and request.accept_encodings.quality('gzip') > 0
+    response = app.response_class(asset.gzip_data if use_gzip else asset.data, mimetype=asset.mimetype)
+    if use_gzip:
+        response.headers['Content-Encoding'] = 'gzip'
+    response.headers['Vary'] = 'Accept-Encoding'
+    response.headers['Cache-Control'] = 'public, max-age=31536000, immutable'
+    # Each encoding is its own representation, so it needs its own strong validator
+    response.set_etag(f'{asset.etag}-gzip' if use_gzip else asset.etag)
+    return response.make_conditional(request)
+
 @app.route('/api/metrics')
 def api_metrics():
     """API endpoint to get current metrics."""
@@ -125,50 +274,278 @@ def api_health():
     health = api_client.get_health_status()
     return jsonify(health)
 
+# Backend routes merged by /api/dashboard, keyed by response section
+DASHBOARD_SECTIONS = {
+    'metrics': '/metrics',
+    'circuitBreakers': '/circuit-breaker/status',
+    'chaos': '/chaos/status',
+}
+DASHBOARD_DEADLINE_SEC = 3.0
+DASHBOARD_MAX_DEADLINE_SEC = 10.0
+# Per-call timeout matches the individual proxies; the deadline only bounds how
+# long the aggregate waits, so a slow section does not count as a breaker failure.
+DASHBOARD_UPSTREAM_TIMEOUT_SEC = 10
+
+# Shared pool for concurrent upstream fan-out
+upstream_pool = ThreadPoolExecutor(max_workers=16, thread_name_prefix='upstream')
+
+def fetch_backend_json(path, timeout):
+    """GET a backend path and return (status_code, payload, elapsed_ms)."""
+    start = time.perf_counter()
+    response = call_backend('GET', path, timeout=timeout)
+    payload = response.json()
+    if response.status_code == 200:
+        remember_payload(path, payload)
+    return response.status_code, payload, round((time.perf_counter() - start) * 1000, 2)
+
+@app.route('/api/dashboard')
+def api_dashboard():
+    """
+    Fetch every dashboard panel from the backend concurrently under one
+    shared deadline and merge the results. Sections that fail or miss the
+    deadline fall back to their last-known-good payload (or null) and are
+    listed in `errors`, so one slow upstream never holds up the others.
+    """
+    try:
+        deadline_sec = min(float(request.args.get('timeout', DASHBOARD_DEADLINE_SEC)), DASHBOARD_MAX_DEADLINE_SEC)
+    except ValueError:
+        return jsonify({"error": "timeout must be a number", "success": False}), 400
+
+    start = time.perf_counter()
+    deadline = start + deadline_sec
+    futures = {
+        name: upstream_pool.submit(fetch_backend_json, path, DASHBOARD_UPSTREAM_TIMEOUT_SEC)
+        for name, path in DASHBOARD_SECTIONS.items()
+    }
+
+    result = {}
+    errors = {}
+    timings = {}
+    for name, future in futures.items():
+        path = DASHBOARD_SECTIONS[name]
+        try:
+            status, payload, elapsed_ms = future.result(timeout=max(0.0, deadline - time.perf_counter()))
+            result[name] = payload
+            timings[name] = elapsed_ms
+            if status != 200:
+                errors[name] = f"HTTP {status}"
+        except FuturesTimeoutError:
+            future.cancel()
+            errors[name] = f"Timed out after {deadline_sec}s"
+            result[name] = stale_payload(path)
+        except (requests.exceptions.RequestException, ValueError) as e:
+            errors[name] = str(e)
+            result[name] = stale_payload(path)
+
+    result.update({
+        "success": len(errors) < len(DASHBOARD_SECTIONS),
+        "partial": bool(errors),
+        "errors": errors,
+        "timings": timings,
+        "elapsedMs": round((time.perf_counter() - start) * 1000, 2),
+        "deadlineMs": deadline_sec * 1000,
+        "timestamp": datetime.now().isoformat()
+    })
+    return jsonify(result)
+
 @app.route('/api/status')
 def api_status():
     """Get dashboard status including backend connectivity."""
-    try:
-        # Test backend connectivity
-        response = requests.get(f"{BACKEND_URL}/test", timeout=5)
-        backend_status = "connected" if response.status_code == 200 else "error"
-    except requests.exceptions.RequestException:
-        backend_status = "disconnected"
+    # Read the background tracker's state instead of probing per request
+    health = health_tracker.snapshot()
     
     return jsonify({
         "status": "running",
-        "backend_status": backend_status,
+        "backend_status": health['state'],
+        "backend_health": health,
+        "backend_breaker": backend_breaker.get_status(),
+        "ai_admission": ai_admission.snapshot(),
+        "ai_hedging": ai_hedger.snapshot(),
+        "ai_cache": ai_cache.snapshot(),
+        "request_log": request_log_queue.snapshot(),
+        "compression": compressor.snapshot(),
         "timestamp": datetime.now().isoformat(),
         "backend_url": BACKEND_URL
     })
 
+def proxy_get(path, unavailable_body, failure_message, timeout=10):
+    """
+    Proxy a GET to the backend. While the backend breaker is open, answer
+    immediately with the last-known-good payload (marked stale) if any.
+    """
+    try:
+        response = call_backend('GET', path, timeout=timeout)
+        payload = response.json()
+        if response.status_code == 200:
+            remember_payload(path, payload)
+        return jsonify(payload), response.status_code
+    except CircuitOpenError:
+        stale = stale_payload(path)
+        if stale is not None:
+            return jsonify(stale), 200
+        return jsonify(unavailable_body), 503
+    except requests.exceptions.RequestException as e:
+        logger.error(f"{failure_message}: {e}")
+        return jsonify(unavailable_body), 503
+
 @app.route('/metrics')
 def proxy_metrics():
     """Proxy metrics request to backend."""
+    return proxy_get('/metrics', {"error": "Backend unavailable"}, "Failed to proxy metrics")
+
+def request_flag(data, name):
+    """Pop an opt-in flag from the /ai body (or read ?name=); None when not given."""
+    flag = data.pop(name, None) if isinstance(data, dict) else None
+    if flag is None:
+        flag = request.args.get(name)
+    if flag is None:
+        return None
+    return flag is True or str(flag).lower() in ('1', 'true', 'yes')
+
+def ai_cache_key(data):
+    """Key an /ai request by service, normalized prompt and any remaining options."""
+    options = {k: v for k, v in data.items() if k not in ('service', 'prompt')}
+    return cache_key(data.get('service', 'gemini'), data.get('prompt'), options)
+
+def refresh_ai_cache(key, data):
+    """Re-fetch a stale cache entry in the background if the service has a free slot."""
+    gate = ai_admission.gate(data.get('service', 'gemini'))
+    if not gate.try_acquire():
+        ai_cache.end_refresh(key)
+        return
+    start = time.perf_counter()
     try:
-        response = requests.get(f"{BACKEND_URL}/metrics", timeout=10)
-        return jsonify(response.json()), response.status_code
-    except requests.exceptions.RequestException as e:
-        logger.error(f"Failed to proxy metrics: {e}")
-        return jsonify({"error": "Backend unavailable"}), 503
+        response = call_backend('POST', '/ai', json=data, timeout=30)
+        payload = response.json()
+        if response.status_code == 200 and payload.get('success') is not False:
+            ai_cache.put(key, payload)
+    except (requests.exceptions.RequestException, ValueError) as e:
+        logger.error(f"Failed to refresh cached AI response: {e}")
+    finally:
+        gate.release(time.perf_counter() - start)
+        ai_cache.end_refresh(key)
+
+def relay_backend_response(response, on_close):
+    """
+    Stream an upstream response through unchanged (chunked transfer).
+    Bytes are relayed still encoded; `on_close` runs exactly once, when the
+    body is done or the server closes the response, even if it never started.
+    """
+    closed = threading.Lock()
+
+    def close():
+        if closed.acquire(blocking=False):
+            response.close()
+            on_close()
+
+    def generate():
+        try:
+            for chunk in response.raw.stream(STREAM_CHUNK_SIZE, decode_content=False):
+                yield chunk
+        except (requests.exceptions.RequestException, urllib3.exceptions.HTTPError) as e:
+            logger.error(f"Upstream stream interrupted: {e}")
+        finally:
+            close()
+
+    relayed = Response(generate(), status=response.status_code, direct_passthrough=True,
+                       content_type=response.headers.get('Content-Type', 'application/json'))
+    relayed.call_on_close(close)
+    if 'Content-Encoding' in response.headers:
+        relayed.headers['Content-Encoding'] = response.headers['Content-Encoding']
+    return relayed
+
+def acquire_hedge_slot(service):
+    """Admit a hedge only if its service has a free slot right now."""
+    gate = ai_admission.gate(service)
+    if not gate.try_acquire():
+        return None
+    start = time.perf_counter()
+    return lambda: gate.release(time.perf_counter() - start)
 
 @app.route('/ai', methods=['POST'])
 def proxy_ai():
     """Proxy AI request to backend."""
+    data = request.get_json()
+    service = data.get('service', 'gemini') if isinstance(data, dict) else 'gemini'
+    hedge = request_flag(data, 'hedge')
+    hedge = AI_HEDGING_DEFAULT if hedge is None else hedge
+    # Hedges rewrite the body's service; anything but a JSON object goes to the backend as-is
+    hedge = hedge and isinstance(data, dict)
+    use_cache = request_flag(data, 'cache')
+    if 'no-cache' in request.headers.get('Cache-Control', ''):
+        use_cache = False
+
+    key = None
+    if use_cache is False:
+        ai_cache.record(service, 'bypass')
+    elif (use_cache or AI_CACHE_DEFAULT) and isinstance(data, dict):
+        key = ai_cache_key(data)
+        payload, status_code, state = ai_cache.get(key)
+        ai_cache.record(service, state)
+        if state == 'stale' and ai_cache.begin_refresh(key):
+            cache_refresh_pool.submit(refresh_ai_cache, key, dict(data))
+        if payload is not None:
+            result = jsonify(payload)
+            result.headers['X-Cache'] = 'HIT' if state == 'hit' else 'STALE'
+            return result, status_code
+
+    # Shed load before tying up a thread on the backend call
     try:
-        data = request.get_json()
-        response = requests.post(f"{BACKEND_URL}/ai", json=data, timeout=30)
-        return jsonify(response.json()), response.status_code
+        gate = ai_admission.acquire(service)
+    except AdmissionRejected as e:
+        response = jsonify({"error": str(e), "success": False, "service": service, "reason": e.reason})
+        response.headers['Retry-After'] = str(e.retry_after)
+        return response, 429
+
+    start = time.perf_counter()
+    # Set once something else (the stream relay, the hedger) is responsible for releasing the slot
+    slot_handed_off = False
+    try:
+        if not hedge and key is None and (AI_STREAM_DEFAULT or request.args.get('stream') in ('1', 'true')):
+            response = call_backend('POST', '/ai', json=data, timeout=30, stream=True)
+            # The slot is held until the last byte has been relayed
+            result = relay_backend_response(response, lambda: gate.release(time.perf_counter() - start))
+            slot_handed_off = True
+            result.headers['X-Served-By'] = service
+            result.headers['X-Hedged'] = 'false'
+            result.headers['X-Cache'] = 'BYPASS'
+            return result
+
+        if hedge:
+            def send(svc):
+                return call_backend('POST', '/ai', json=dict(data, service=svc), timeout=30)
+            # The primary's slot is held until its call finishes, even if the hedge wins first
+            slot_handed_off = True
+            response, served_by, hedged = ai_hedger.run(
+                service, send, acquire_secondary=acquire_hedge_slot,
+                release_primary=lambda: gate.release(time.perf_counter() - start))
+        else:
+            response = call_backend('POST', '/ai', json=data, timeout=30)
+            served_by, hedged = service, False
+            if response.status_code == 200:
+                # Keep the p95 hedge trigger current for requests that opt in
+                ai_hedger.window.record(service, time.perf_counter() - start)
+        payload = response.json()
+        if key is not None and response.status_code == 200 and payload.get('success') is not False:
+            ai_cache.put(key, payload)
+        result = jsonify(payload)
+        result.headers['X-Served-By'] = served_by
+        result.headers['X-Hedged'] = 'true' if hedged else 'false'
+        result.headers['X-Cache'] = 'MISS' if key is not None else 'BYPASS'
+        return result, response.status_code
     except requests.exceptions.RequestException as e:
         logger.error(f"Failed to proxy AI request: {e}")
         return jsonify({"error": "Backend unavailable"}), 503
+    finally:
+        if not slot_handed_off:
+            gate.release(time.perf_counter() - start)
 
 @app.route('/chaos/inject', methods=['POST'])
 def proxy_chaos_inject():
     """Proxy chaos injection request to backend."""
     try:
         data = request.get_json()
-        response = requests.post(f"{BACKEND_URL}/chaos/inject", json=data, timeout=10)
+        response = call_backend('POST', '/chaos/inject', json=data, timeout=10)
         return jsonify(response.json()), response.status_code
     except requests.exceptions.RequestException as e:
         logger.error(f"Failed to inject chaos: {e}")
@@ -179,7 +556,7 @@ def proxy_chaos_stop():
     """Proxy chaos stop request to backend."""
     try:
         data = request.get_json()
-        response = requests.post(f"{BACKEND_URL}/chaos/stop", json=data, timeout=10)
+        response = call_backend('POST', '/chaos/stop', json=data, timeout=10)
         return jsonify(response.json()), response.status_code
     except requests.exceptions.RequestException as e:
         logger.error(f"Failed to stop chaos: {e}")
@@ -188,29 +565,20 @@ def proxy_chaos_stop():
 @app.route('/chaos/status', methods=['GET'])
 def proxy_chaos_status():
     """Proxy chaos status request to backend."""
-    try:
-        response = requests.get(f"{BACKEND_URL}/chaos/status", timeout=10)
-        return jsonify(response.json()), response.status_code
-    except requests.exceptions.RequestException as e:
-        logger.error(f"Failed to get chaos status: {e}")
-        return jsonify({"experiments": []}), 503
+    return proxy_get('/chaos/status', {"experiments": []}, "Failed to get chaos status")
 
 @app.route('/circuit-breaker/status', methods=['GET'])
 def proxy_circuit_breaker_status():
     """Proxy circuit breaker status request to backend."""
-    try:
-        response = requests.get(f"{BACKEND_URL}/circuit-breaker/status", timeout=10)
-        return jsonify(response.json()), response.status_code
-    except requests.exceptions.RequestException as e:
-        logger.error(f"Failed to get circuit breaker status: {e}")
-        return jsonify({"error": str(e)}), 503
+    return proxy_get('/circuit-breaker/status', {"error": "Backend unavailable"},
+                     "Failed to get circuit breaker status")
 
 @app.route('/circuit-breaker/reset', methods=['POST'])
 def proxy_circuit_breaker_reset():
     """Proxy circuit breaker reset request to backend."""
     try:
         data = request.get_json() or {}
-        response = requests.post(f"{BACKEND_URL}/circuit-breaker/reset", json=data, timeout=10)
+        response = call_backend('POST', '/circuit-breaker/reset', json=data, timeout=10)
         return jsonify(response.json()), response.status_code
     except requests.exceptions.RequestException as e:
         logger.error(f"Failed to reset circuit breaker: {e}")
@@ -220,20 +588,41 @@ def proxy_circuit_breaker_reset():
 # HISTORICAL DATA & ANALYTICS ENDPOINTS
 # ============================================================================
 
+def wants_columnar():
+    """True when a history endpoint was called with ?format=columnar."""
+    return request.args.get('format') == 'columnar'
+
+def requested_fields():
+    """Column projection from ?fields=a,b,c, or None for every column."""
+    fields = [field.strip() for field in request.args.get('fields', '').split(',') if field.strip()]
+    return fields or None
+
 @app.route('/api/history/requests', methods=['GET'])
 def get_request_history():
     """Get historical request logs."""
     try:
         limit = int(request.args.get('limit', 100))
         service = request.args.get('service', None)
+        fields = requested_fields()
         
-        requests_data = db.get_recent_requests(limit=limit, service=service)
+        if wants_columnar():
+            requests_data = db.get_recent_requests(limit=limit, service=service, columnar=True, fields=fields)
+            return jsonify({
+                "success": True,
+                "format": "columnar",
+                "count": requests_data['length'],
+                "requests": requests_data
+            })
+
+        requests_data = db.get_recent_requests(limit=limit, service=service, fields=fields)
         
         return jsonify({
             "success": True,
             "count": len(requests_data),
             "requests": requests_data
         })
+    except UnknownFieldError as e:
+        return jsonify({"error": str(e), "success": False}), 400
     except Exception as e:
         logger.error(f"Failed to get request history: {e}")
         return jsonify({"error": str(e), "success": False}), 500
@@ -279,14 +668,26 @@ def get_circuit_breaker_history():
     try:
         limit = int(request.args.get('limit', 50))
         service = request.args.get('service', None)
+        fields = requested_fields()
         
-        events = db.get_circuit_breaker_history(service=service, limit=limit)
+        if wants_columnar():
+            events = db.get_circuit_breaker_history(service=service, limit=limit, columnar=True, fields=fields)
+            return jsonify({
+                "success": True,
+                "format": "columnar",
+                "count": events['length'],
+                "events": events
+            })
+
+        events = db.get_circuit_breaker_history(service=service, limit=limit, fields=fields)
         
         return jsonify({
             "success": True,
             "count": len(events),
             "events": events
         })
+    except UnknownFieldError as e:
+        return jsonify({"error": str(e), "success": False}), 400
     except Exception as e:
         logger.error(f"Failed to get circuit breaker history: {e}")
         return jsonify({"error": str(e), "success": False}), 500
@@ -296,14 +697,26 @@ def get_chaos_history():
     """Get chaos experiment history."""
     try:
         limit = int(request.args.get('limit', 20))
+        fields = requested_fields()
         
-        experiments = db.get_chaos_experiments(limit=limit)
+        if wants_columnar():
+            experiments = db.get_chaos_experiments(limit=limit, columnar=True, fields=fields)
+            return jsonify({
+                "success": True,
+                "format": "columnar",
+                "count": experiments['length'],
+                "experiments": experiments
+            })
+
+        experiments = db.get_chaos_experiments(limit=limit, fields=fields)
         
         return jsonify({
             "success": True,
             "count": len(experiments),
             "experiments": experiments
         })
+    except UnknownFieldError as e:
+        return jsonify({"error": str(e), "success": False}), 400
     except Exception as e:
         logger.error(f"Failed to get chaos history: {e}")
         return jsonify({"error": str(e), "success": False}), 500
@@ -318,12 +731,16 @@ def get_performance_trends():
         
         trends = db.get_performance_trends(service=service, hours=hours, interval_minutes=interval)
         
-        return jsonify({
+        response = {
             "success": True,
             "time_range_hours": hours,
             "interval_minutes": interval,
             "trends": trends
-        })
+        }
+        if wants_columnar():
+            response["format"] = "columnar"
+            response["trends"] = dicts_to_columnar(trends)
+        return jsonify(response)
     except Exception as e:
         logger.error(f"Failed to get performance trends: {e}")
         return jsonify({"error": str(e), "success": False}), 500
@@ -362,31 +779,30 @@ def get_database_stats():
 
 @app.route('/api/log-request', methods=['POST'])
 def log_request_to_db():
-    """Log a request to the database."""
+    """Validate a request record and queue it for the background writer."""
+    record, errors = validate_request_record(request.get_json(silent=True))
+    if errors:
+        return jsonify({"success": False, "error": "Invalid request record", "details": errors}), 400
+
     try:
-        data = request.get_json()
-        
-        request_id = db.log_request(
-            service=data.get('service'),
-            success=data.get('success'),
-            latency=data.get('latency'),
-            response_size=data.get('responseSize', 0),
-            error_type=data.get('errorType'),
-            error_message=data.get('errorMessage'),
-            prompt=data.get('prompt'),
-            circuit_breaker_state=data.get('circuitBreakerState'),
-            chaos_active=data.get('chaosActive', False),
-            automated=data.get('automated', False)
-        )
-        
-        return jsonify({
-            "success": True,
-            "request_id": request_id,
-            "message": "Request logged successfully"
-        })
-    except Exception as e:
+        accepted = request_log_queue.put(record)
+    except LogQueueFull as e:
         logger.error(f"Failed to log request: {e}")
-        return jsonify({"error": str(e), "success": False}), 500
+        response = jsonify({"error": str(e), "success": False})
+        response.headers['Retry-After'] = '1'
+        return response, 503
+
+    return jsonify({
+        "success": True,
+        "accepted": accepted,
+        "message": "Request queued for logging" if accepted else "Request dropped by sampling"
+    }), 202
+
+@app.route('/prometheus')
+def prometheus_metrics():
+    """Expose dashboard metrics in Prometheus text exposition format."""
+    body, content_type = request_metrics.exposition()
+    return Response(body, content_type=content_type)
 
 @app.errorhandler(404)
 def not_found_error(error):
@@ -399,6 +815,9 @@ def internal_error(error):
     logger.error(f"Internal server error: {error}")
     return jsonify({"error": "Internal server error"}), 500
 
+# Create metric label children for every route registered above
+request_metrics.prewarm(app.url_map)
+
 def is_port_open(host: str, port: int, timeout: float = 1.0) -> bool:
     """Check if a TCP port is open."""
     try:
@@ -407,10 +826,47 @@ def is_port_open(host: str, port: int, timeout: float = 1.0) -> bool:
     except OSError:
         return False
 
-def start_prometheus(project_dir):
-    """Start Prometheus if not already running."""
+class StartupTimeline:
+    """Record when each startup component was launched and became ready."""
+
+    def __init__(self):
+        self.started_at = time.monotonic()
+        self.events = []
+        self._lock = threading.Lock()
+
+    def mark(self, component, event, detail=''):
+        elapsed = time.monotonic() - self.started_at
+        with self._lock:
+            self.events.append((elapsed, component, event, detail))
+        logger.info('⏱️  +%6.2fs  %-11s %s%s', elapsed, component, event, f' ({detail})' if detail else '')
+
+    def log_summary(self):
+        logger.info('=' * 70)
+        logger.info('⏱️  STARTUP TIMELINE:')
+        with self._lock:
+            events = sorted(self.events)
+        for elapsed, component, event, detail in events:
+            logger.info('   +%6.2fs  %-11s %s%s', elapsed, component, event, f' ({detail})' if detail else '')
+        logger.info('=' * 70)
+
+def wait_for_port(host, port, timeout, process=None, interval=0.1):
+    """
+    Poll until a TCP port accepts connections.
+    Returns 'ready', 'exited' (process died first) or 'timeout'.
+    """
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process is not None and process.poll() is not None:
+            return 'exited'
+        if is_port_open(host, port, timeout=interval):
+            return 'ready'
+        time.sleep(interval)
+    return 'timeout'
+
+def start_prometheus(project_dir, timeline, ready_timeout=15):
+    """Start Prometheus if not already running and wait for it to listen."""
     if is_port_open('localhost', 9090):
-        logger.info('✅ Prometheus already running on port 9090')
+        timeline.mark('prometheus', 'ready', 'already running on port 9090')
         return None
     
     prometheus_exe = os.path.join(project_dir, 'monitoring', 'prometheus', 'prometheus.exe')
@@ -418,15 +874,16 @@ def start_prometheus(project_dir):
     
     if not os.path.exists(prometheus_exe):
         logger.warning('⚠️  Prometheus not installed. Run: .\\scripts\\setup-prometheus.ps1')
+        timeline.mark('prometheus', 'skipped', 'not installed')
         return None
     
     try:
-        logger.info('🚀 Starting Prometheus on http://localhost:9090...')
+        command = [prometheus_exe, f'--config.file={prometheus_yml}',
+                   f'--storage.tsdb.path={os.path.join(project_dir, "monitoring", "prometheus", "data")}']
         if platform.system() == 'Windows':
             # Windows: CREATE_NO_WINDOW flag
             process = subprocess.Popen(
-                [prometheus_exe, f'--config.file={prometheus_yml}', 
-                 f'--storage.tsdb.path={os.path.join(project_dir, "monitoring", "prometheus", "data")}'],
+                command,
                 cwd=project_dir,
                 stdout=subprocess.DEVNULL,
                 stderr=subprocess.DEVNULL,
@@ -434,27 +891,145 @@ def start_prometheus(project_dir):
             )
         else:
             process = subprocess.Popen(
-                [prometheus_exe, f'--config.file={prometheus_yml}',
-                 f'--storage.tsdb.path={os.path.join(project_dir, "monitoring", "prometheus", "data")}'],
+                command,
                 cwd=project_dir,
                 stdout=subprocess.DEVNULL,
                 stderr=subprocess.DEVNULL
             )
+        monitoring_processes['prometheus'] = process
+        timeline.mark('prometheus', 'launched', f'pid={process.pid}')
         
-        # Wait for Prometheus to start
-        time.sleep(3)
-        if is_port_open('localhost', 9090):
-            logger.info('✅ Prometheus started successfully on port 9090')
-            return process
+        # Wait for Prometheus to listen instead of sleeping a fixed time
+        state = wait_for_port('localhost', 9090, ready_timeout, process=process)
+        if state == 'ready':
+            timeline.mark('prometheus', 'ready', 'http://localhost:9090')
+        elif state == 'exited':
+            logger.error('❌ Prometheus exited with code %s', process.returncode)
+            monitoring_processes['prometheus'] = None
+            timeline.mark('prometheus', 'failed', f'exit code {process.returncode}')
         else:
             logger.warning('⚠️  Prometheus started but not responding on port 9090')
-            return process
+            timeline.mark('prometheus', 'not ready', f'no response after {ready_timeout}s')
+        return process
     except Exception as e:
         logger.error(f'❌ Failed to start Prometheus: {e}')
+        timeline.mark('prometheus', 'failed', str(e))
+        return None
+
+def start_backend(project_dir, timeline, host='localhost', backend_port=3000, ready_timeout=30):
+    """Start the Node.js backend if it is not listening and wait for readiness."""
+    if is_port_open(host, backend_port):
+        timeline.mark('backend', 'ready', f'already running on port {backend_port}')
+        return None
+
+    node_cmd = [
+        'node',
+        os.path.join('src', 'index.js')
+    ]
+
+    # Start Node.js backend as a child process
+    # CRITICAL: Do NOT use PIPE for stdout/stderr - it causes blocking when buffer fills!
+    # Let backend output go directly to console
+    try:
+        backend_process = subprocess.Popen(
+            node_cmd,
+            cwd=project_dir,
+            # Don't pipe - prevents pipe buffer deadlock
+            stdout=None,  # Inherit parent's stdout
+            stderr=None   # Inherit parent's stderr
+        )
+    except FileNotFoundError:
+        logger.error('❌ Node.js executable not found. Ensure Node is installed and available in PATH.')
+        timeline.mark('backend', 'failed', 'node not found')
         return None
+    except Exception as e:
+        logger.error('❌ Failed to start Node.js backend: %s', e)
+        timeline.mark('backend', 'failed', str(e))
+        return None
+
+    monitoring_processes['backend'] = backend_process
+    timeline.mark('backend', 'launched', f'pid={backend_process.pid}')
+
+    state = wait_for_port(host, backend_port, ready_timeout, process=backend_process)
+    if state == 'ready':
+        timeline.mark('backend', 'ready', f'http://{host}:{backend_port}')
+    elif state == 'exited':
+        logger.error('❌ Backend process exited with code %s', backend_process.returncode)
+        logger.error('💡 Backend failed to start. Check if port %s is already in use.', backend_port)
+        monitoring_processes['backend'] = None
+        timeline.mark('backend', 'failed', f'exit code {backend_process.returncode}')
+    else:
+        logger.warning('⚠️  Backend did not start within %ss; dashboard keeps serving fallback data.', ready_timeout)
+        timeline.mark('backend', 'not ready', f'no response after {ready_timeout}s')
+    return backend_process
+
+def start_services_in_background(project_dir, args, timeline):
+    """
+    Launch Prometheus, the Node.js backend and a dashboard readiness probe
+    concurrently. Returns immediately; the timeline summary is logged once
+    every component has settled.
+    """
+    launchers = [threading.Thread(target=start_backend, args=(project_dir, timeline),
+                                  name='startup-backend', daemon=True)]
+    if not args.no_monitoring:
+        launchers.append(threading.Thread(target=start_prometheus, args=(project_dir, timeline),
+                                          name='startup-prometheus', daemon=True))
+
+    def probe_dashboard():
+        host = 'localhost' if args.host in ('0.0.0.0', '') else args.host
+        if wait_for_port(host, args.port, timeout=30) == 'ready':
+            timeline.mark('dashboard', 'ready', f'http://{host}:{args.port}')
+        else:
+            timeline.mark('dashboard', 'not ready', 'port never opened')
+
+    launchers.append(threading.Thread(target=probe_dashboard, name='startup-dashboard', daemon=True))
+
+    def supervise():
+        for thread in launchers:
+            thread.start()
+        for thread in launchers:
+            thread.join()
+        timeline.log_summary()
+
+    threading.Thread(target=supervise, name='startup-supervisor', daemon=True).start()
+
+def start_services_detached(project_dir, args, timeline):
+    """
+    Launch the dependencies from a double-forked supervisor process. gunicorn's
+    arbiter reaps every child on SIGCHLD (and halts on exit codes 3 and 4), so
+    Node.js and Prometheus must not be its children. The supervisor is
+    reparented to init and stops them once the dashboard process is gone.
+    """
+    dashboard_pid = os.getpid()
+    pid = os.fork()
+    if pid:
+        # The intermediate child exits straight away; reap it before gunicorn installs its handlers
+        os.waitpid(pid, 0)
+        return
+    try:
+        if os.fork():
+            os._exit(0)
+        start_services_in_background(project_dir, args, timeline)
+        try:
+            while True:
+                time.sleep(1)
+                os.kill(dashboard_pid, 0)
+        except (OSError, KeyboardInterrupt):
+            pass  # dashboard gone (or its pid already reused)
+        stop_monitoring_processes()
+    finally:
+        os._exit(0)
 
 def cleanup_processes():
     """Clean up all monitoring processes on exit."""
+    # Forked server workers inherit this atexit hook; only the process that
+    # launched the services may stop them (a recycled worker must not).
+    if os.getpid() != MAIN_PID:
+        return
+    stop_monitoring_processes()
+
+def stop_monitoring_processes():
+    """Terminate the Prometheus and Node.js processes this process launched."""
     logger.info('🧹 Cleaning up monitoring processes...')
     for name, process in monitoring_processes.items():
         if process and process.poll() is None:
@@ -468,8 +1043,63 @@ def cleanup_processes():
             except Exception as e:
                 logger.debug(f'Error cleaning up {name}: {e}')
 
+def run_production_server(args, project_dir, timeline):
+    """
+    Serve the dashboard with a prefork WSGI server (gunicorn).
+
+    Each worker runs `args.threads` request threads. Workers are recycled
+    gracefully after `args.max_requests` requests (plus jitter) so memory
+    growth is bounded. Falls back to the threaded development server where
+    gunicorn is unavailable (e.g. Windows).
+    """
+    try:
+        from gunicorn.app.base import BaseApplication
+    except ImportError:
+        logger.warning('⚠️  gunicorn not installed (pip install gunicorn); '
+                       'falling back to the threaded development server')
+        start_services_in_background(project_dir, args, timeline)
+        app.run(host=args.host, port=args.port, debug=False, threaded=True)
+        return
+
+    # Keep the dependencies out of the arbiter's process tree
+    start_services_detached(project_dir, args, timeline)
+
+    def post_fork(server, worker):
+        # Never share pooled sockets across processes; the datastore reopens
+        # its SQLite connection per process on its own.
+        api_client.session = requests.Session()
+
+    def child_exit(server, worker):
+        mark_process_dead(worker.pid)
+
+    options = {
+        'bind': f'{args.host}:{args.port}',
+        'workers': args.workers,
+        'threads': args.threads,
+        'worker_class': 'gthread' if args.threads > 1 else 'sync',
+        'max_requests': args.max_requests,
+        'max_requests_jitter': args.max_requests_jitter,
+        'graceful_timeout': args.graceful_timeout,
+        'timeout': args.worker_timeout,
+        'post_fork': post_fork,
+        'child_exit': child_exit,
+    }
+
+    class DashboardServer(BaseApplication):
+        def load_config(self):
+            for key, value in options.items():
+                self.cfg.set(key, value)
+
+        def load(self):
+            return app
+
+    logger.info('🏭 Production server: %s worker(s) x %s thread(s), recycle after %s requests (+%s jitter)',
+                args.workers, args.threads, args.max_requests or 'unlimited', args.max_requests_jitter)
+    DashboardServer().run()
+
 def main():
     """Main function to run the Flask app with all monitoring services."""
+    global AI_HEDGING_DEFAULT, AI_CACHE_DEFAULT, AI_STREAM_DEFAULT
     parser = argparse.ArgumentParser(description='AI Resilience Monitor Dashboard')
     parser.add_argument('--port', type=int, default=DEFAULT_PORT, 
                        help=f'Port to run the dashboard on (default: {DEFAULT_PORT})')
@@ -479,9 +1109,62 @@ def main():
                        help='Run in debug mode')
     parser.add_argument('--no-monitoring', action='store_true',
                        help='Skip starting Prometheus')
+    parser.add_argument('--workers', type=int, default=1,
+                       help='Worker processes; >1 serves with gunicorn (default: 1)')
+    parser.add_argument('--threads', type=int, default=1,
+                       help='Request threads per worker; >1 serves with gunicorn (default: 1)')
+    parser.add_argument('--max-requests', type=int, default=0,
+                       help='Gracefully recycle a worker after this many requests, 0 disables (default: 0)')
+    parser.add_argument('--max-requests-jitter', type=int, default=0,
+                       help='Random jitter added to --max-requests to stagger recycling (default: 0)')
+    parser.add_argument('--graceful-timeout', type=int, default=30,
+                       help='Seconds a recycled worker gets to finish in-flight requests (default: 30)')
+    parser.add_argument('--worker-timeout', type=int, default=60,
+                       help='Seconds before a silent worker is killed and replaced (default: 60)')
+    parser.add_argument('--ai-max-concurrent', type=int, default=8,
+                       help='Max in-flight /ai proxy requests per service, per worker (default: 8)')
+    parser.add_argument('--ai-max-queue', type=int, default=16,
+                       help='Max /ai requests waiting for a slot per service before 429 (default: 16)')
+    parser.add_argument('--ai-queue-timeout', type=float, default=5.0,
+                       help='Seconds an /ai request may wait for a slot before 429 (default: 5)')
+    parser.add_argument('--log-queue-size', type=int, default=10000,
+                       help='Max request records waiting for the database writer, per worker (default: 10000)')
+    parser.add_argument('--log-overflow', choices=['block', 'drop-oldest', 'sample'], default='block',
+                       help='What /api/log-request does when the queue is full (default: block)')
+    parser.add_argument('--log-block-timeout', type=float, default=1.0,
+                       help='Seconds the block policy waits for queue space before 503 (default: 1)')
+    parser.add_argument('--compress-min-size', type=int, default=1024,
+                       help='Smallest response body in bytes to gzip/deflate on the fly (default: 1024)')
+    parser.add_argument('--gzip-level', type=int, default=6, choices=range(1, 10), metavar='1-9',
+                       help='gzip compression level for API responses (default: 6)')
+    parser.add_argument('--deflate-level', type=int, default=6, choices=range(1, 10), metavar='1-9',
+                       help='deflate compression level for API responses (default: 6)')
+    parser.add_argument('--no-compression', action='store_true',
+                       help='Never compress API responses')
+    parser.add_argument('--ai-cache', action='store_true',
+                       help='Cache successful /ai responses for repeated prompts (requests can still opt out)')
+    parser.add_argument('--ai-cache-size', type=int, default=512,
+                       help='Max cached /ai responses per worker, LRU-evicted (default: 512)')
+    parser.add_argument('--ai-cache-ttl', type=float, default=300.0,
+                       help='Seconds a cached /ai response is fresh (default: 300)')
+    parser.add_argument('--ai-cache-stale', type=float, default=60.0,
+                       help='Extra seconds a stale entry is served while it is refreshed (default: 60)')
+    parser.add_argument('--ai-stream', action='store_true',
+                       help='Relay /ai responses byte-for-byte as they arrive instead of re-encoding them')
+    parser.add_argument('--ai-hedging', action='store_true',
+                       help='Hedge every /ai request to a second provider after the primary\'s p95 latency')
     
     args = parser.parse_args()
     
+    ai_admission.configure(AI_SERVICES, args.ai_max_concurrent, args.ai_max_queue, args.ai_queue_timeout)
+    AI_HEDGING_DEFAULT = args.ai_hedging
+    AI_CACHE_DEFAULT = args.ai_cache
+    AI_STREAM_DEFAULT = args.ai_stream
+    ai_cache.configure(args.ai_cache_size, args.ai_cache_ttl, args.ai_cache_stale)
+    request_log_queue.configure(args.log_queue_size, args.log_overflow, args.log_block_timeout)
+    compressor.configure(args.compress_min_size, args.gzip_level, args.deflate_level,
+                         enabled=not args.no_compression)
+    
     logger.info('=' * 70)
     logger.info('🤖 AI RESILIENCE MONITOR - FULL STACK STARTUP')
     logger.info('=' * 70)
@@ -492,84 +1175,28 @@ def main():
     atexit.register(cleanup_processes)
     
     try:
-        # Start Prometheus if not disabled
-        if not args.no_monitoring:
-            monitoring_processes['prometheus'] = start_prometheus(project_dir)
-        
         logger.info(f"🚀 Starting AI Resilience Dashboard on http://{args.host}:{args.port}")
         logger.info(f"📊 Backend URL: {BACKEND_URL}")
-
-        backend_process = None
-
-        # If backend not listening on expected port, try to start it from repo
-        host = 'localhost'
-        backend_port = 3000
-
-        if not is_port_open(host, backend_port):
-            logger.info('🔌 Backend not detected on port %s — attempting to start Node.js backend...', backend_port)
-
-            node_cmd = [
-                'node',
-                os.path.join('src', 'index.js')
-            ]
-
-            # Start Node.js backend as a child process
-            # CRITICAL: Do NOT use PIPE for stdout/stderr - it causes blocking when buffer fills!
-            # Let backend output go directly to console
-            try:
-                backend_process = subprocess.Popen(
-                    node_cmd,
-                    cwd=project_dir,
-                    # Don't pipe - prevents pipe buffer deadlock
-                    stdout=None,  # Inherit parent's stdout
-                    stderr=None   # Inherit parent's stderr
-                )
-                monitoring_processes['backend'] = backend_process
-
-                logger.info('Started Node.js backend (pid=%s), waiting for it to listen on port %s...', backend_process.pid, backend_port)
-
-                # Wait up to 12 seconds for backend to come up
-                wait_until = time.time() + 12
-                backend_started = False
-                while time.time() < wait_until:
-                    # Check if process crashed
-                    if backend_process.poll() is not None:
-                        logger.error('❌ Backend process exited with code %s', backend_process.returncode)
-                        logger.error('💡 Backend failed to start. Check if port %s is already in use.', backend_port)
-                        monitoring_processes['backend'] = None
-                        break
-                    
-                    if is_port_open(host, backend_port):
-                        logger.info('✅ Backend is now listening on port %s', backend_port)
-                        backend_started = True
-                        break
-                    
-                    time.sleep(0.25)
-                
-                if not backend_started and backend_process.poll() is None:
-                    logger.warning('⚠️  Backend did not start within timeout; continuing to launch dashboard frontend only.')
-
-            except FileNotFoundError:
-                logger.error('❌ Node.js executable not found. Ensure Node is installed and available in PATH.')
-            except Exception as e:
-                logger.error('❌ Failed to start Node.js backend: %s', e)
-        else:
-            logger.info('✅ Backend already running on port %s — will not start a new Node process.', backend_port)
-
-        # Print service status summary
-        logger.info('=' * 70)
-        logger.info('📊 SERVICE STATUS:')
         logger.info('   • Main Dashboard:  http://localhost:%s', args.port)
         logger.info('   • Backend API:     http://localhost:3000')
         if not args.no_monitoring:
-            if monitoring_processes.get('prometheus'):
-                logger.info('   • Prometheus:      http://localhost:9090')
-        logger.info('=' * 70)
+            logger.info('   • Prometheus:      http://localhost:9090')
+        logger.info('Dependencies start in the background; the dashboard serves fallback data until they are ready.')
         logger.info('Press Ctrl+C to stop all services')
         logger.info('=' * 70)
 
+        # Launch dependencies concurrently so the dashboard binds its port right away
+        timeline = StartupTimeline()
+        timeline.mark('dashboard', 'launched', f'pid={os.getpid()}')
+
         # Run Flask app (blocking). When it stops, cleanup will run via atexit.
-        app.run(host=args.host, port=args.port, debug=args.debug)
+        if args.workers > 1 or args.threads > 1:
+            run_production_server(args, project_dir, timeline)
+        else:
+            # With --debug the reloader parent only watches files; the child it runs does the work
+            if not args.debug or is_running_from_reloader():
+                start_services_in_background(project_dir, args, timeline)
+            app.run(host=args.host, port=args.port, debug=args.debug)
 
     except KeyboardInterrupt:
         logger.info('')
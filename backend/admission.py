@@ -0,0 +1,152 @@
+"""
+Admission control for the dashboard's /ai proxy
+Bounds in-flight requests per AI service with a bounded wait queue and a
+queue-time deadline, so bursts are shed early instead of piling up threads.
+"""
+import math
+import threading
+import time
+from collections import deque
+
+
+class AdmissionRejected(Exception):
+    """Raised when a request is shed; `retry_after` is in whole seconds."""
+
+    def __init__(self, service, reason, retry_after):
+        super().__init__(f"{service} overloaded ({reason}), retry after {retry_after}s")
+        self.service = service
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+class ServiceGate:
+    """Concurrency limit plus bounded FIFO wait queue for one service."""
+
+    def __init__(self, service, max_concurrent, max_queue, max_wait, on_change=None):
+        self.service = service
+        self.on_change = on_change
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.max_wait = max_wait
+
+        self.active = 0
+        self.waiting = 0
+        self.admitted = 0
+        self.rejected = {'queue_full': 0, 'queue_timeout': 0}
+        # Exponentially weighted average service time, seeds Retry-After
+        self.avg_service_time = 1.0
+
+        self._cond = threading.Condition()
+        self._queue = deque()
+
+    def _changed(self):
+        if self.on_change is not None:
+            self.on_change(self.service, self.active, self.waiting)
+
+    def _retry_after(self):
+        backlog = (self.waiting + 1) / max(1, self.max_concurrent)
+        return max(1, math.ceil(backlog * self.avg_service_time))
+
+    def acquire(self):
+        """Wait for a slot; returns seconds spent queued or raises AdmissionRejected."""
+        with self._cond:
+            if self.active < self.max_concurrent and not self._queue:
+                self.active += 1
+                self.admitted += 1
+                self._changed()
+                return 0.0
+
+            if len(self._queue) >= self.max_queue:
+                self.rejected['queue_full'] += 1
+                raise AdmissionRejected(self.service, 'queue_full', self._retry_after())
+
+            # FIFO: only the head of the queue may take a freed slot
+            token = object()
+            self._queue.append(token)
+            self.waiting = len(self._queue)
+            self._changed()
+            start = time.monotonic()
+            deadline = start + self.max_wait
+            try:
+                while not (self._queue[0] is token and self.active < self.max_concurrent):
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self.rejected['queue_timeout'] += 1
+                        raise AdmissionRejected(self.service, 'queue_timeout', self._retry_after())
+                    self._cond.wait(remaining)
+                self.active += 1
+                self.admitted += 1
+                return time.monotonic() - start
+            finally:
+                self._queue.remove(token)
+                self.waiting = len(self._queue)
+                self._changed()
+                self._cond.notify_all()
+
+    def try_acquire(self):
+        """Take a slot only if one is free right now; never queues."""
+        with self._cond:
+            if self.active < self.max_concurrent and not self._queue:
+                self.active += 1
+                self.admitted += 1
+                self._changed()
+                return True
+            return False
+
+    def release(self, service_time):
+        """Free a slot and fold the request's duration into the average."""
+        with self._cond:
+            self.active -= 1
+            self.avg_service_time = 0.8 * self.avg_service_time + 0.2 * service_time
+            self._changed()
+            self._cond.notify_all()
+
+    def snapshot(self):
+        with self._cond:
+            return {
+                'active': self.active,
+                'waiting': self.waiting,
+                'max_concurrent': self.max_concurrent,
+                'max_queue': self.max_queue,
+                'max_wait_sec': self.max_wait,
+                'admitted': self.admitted,
+                'rejected': dict(self.rejected),
+                'avg_service_time_sec': round(self.avg_service_time, 3),
+            }
+
+
+class AdmissionController:
+    """Per-service ServiceGates sharing one configuration."""
+
+    def __init__(self, services, max_concurrent=8, max_queue=16, max_wait=5.0, metrics=None):
+        self.metrics = metrics
+        self.gates = {}
+        self.configure(services, max_concurrent, max_queue, max_wait)
+
+    def configure(self, services, max_concurrent, max_queue, max_wait):
+        """(Re)create the gates; call before serving traffic."""
+        on_change = self.metrics.set_admission_state if self.metrics is not None else None
+        self.gates = {
+            service: ServiceGate(service, max_concurrent, max_queue, max_wait, on_change=on_change)
+            for service in list(services) + ['other']
+        }
+
+    def gate(self, service):
+        return self.gates.get(service) or self.gates['other']
+
+    def acquire(self, service):
+        """Admit a request for `service`; returns its ServiceGate."""
+        gate = self.gate(service)
+        try:
+            waited = gate.acquire()
+        except AdmissionRejected as e:
+            if self.metrics is not None:
+                waited = gate.max_wait if e.reason == 'queue_timeout' else 0.0
+                self.metrics.observe_admission(gate.service, e.reason, waited)
+            raise
+        if self.metrics is not None:
+            self.metrics.observe_admission(gate.service, 'admitted', waited)
+        return gate
+
+    def snapshot(self):
+        return {service: gate.snapshot() for service, gate in self.gates.items()}
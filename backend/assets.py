@@ -0,0 +1,69 @@
+"""
+Static asset fingerprinting for the AI Resilience Monitor dashboard
+Builds content-hashed names and precompressed gzip variants for static files
+"""
+import gzip
+import hashlib
+import mimetypes
+import os
+from collections import namedtuple
+
+Asset = namedtuple('Asset', ['data', 'gzip_data', 'mimetype', 'etag'])
+
+# Files smaller than this are not worth a Content-Encoding round trip
+GZIP_MIN_SIZE = 1024
+
+
+class AssetManifest:
+    """
+    In-memory manifest mapping logical static paths (e.g. 'js/dashboard.js')
+    to fingerprinted names (e.g. 'js/dashboard.3f2a9c1b7d4e.js').
+
+    Fingerprinted URLs change whenever the content changes, so they can be
+    served with an immutable, year-long Cache-Control header.
+    """
+
+    def __init__(self, static_dir, url_prefix='/assets', compress_level=9):
+        self.static_dir = static_dir
+        self.url_prefix = url_prefix
+        self.compress_level = compress_level
+        self._urls = {}
+        self._assets = {}
+
+    def build(self):
+        """Hash and precompress every file under the static directory."""
+        urls = {}
+        assets = {}
+        for root, _, files in os.walk(self.static_dir):
+            for filename in files:
+                path = os.path.join(root, filename)
+                logical = os.path.relpath(path, self.static_dir).replace(os.sep, '/')
+                with open(path, 'rb') as f:
+                    data = f.read()
+
+                digest = hashlib.sha256(data).hexdigest()[:12]
+                stem, ext = os.path.splitext(logical)
+                fingerprinted = f'{stem}.{digest}{ext}'
+
+                gzip_data = None
+                if len(data) >= GZIP_MIN_SIZE:
+                    # mtime=0 keeps the compressed bytes deterministic across workers
+                    compressed = gzip.compress(data, compresslevel=self.compress_level, mtime=0)
+                    if len(compressed) < len(data):
+                        gzip_data = compressed
+
+                mimetype = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+                assets[fingerprinted] = Asset(data, gzip_data, mimetype, digest)
+                urls[logical] = f'{self.url_prefix}/{fingerprinted}'
+
+        self._urls = urls
+        self._assets = assets
+        return self
+
+    def url_for(self, logical):
+        """Return the fingerprinted URL for a logical static path."""
+        return self._urls.get(logical, f'/static/{logical}')
+
+    def get(self, fingerprinted):
+        """Return the Asset for a fingerprinted name, or None."""
+        return self._assets.get(fingerprinted)
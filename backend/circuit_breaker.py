@@ -0,0 +1,144 @@
+"""
+Client-side circuit breaker for calls from the dashboard to the Node.js backend
+Mirrors the backend's CLOSED -> OPEN -> HALF_OPEN state machine so that a
+hung or dead backend fails fast instead of tying up Flask threads.
+"""
+import threading
+import time
+from datetime import datetime
+
+import requests
+
+
+class CircuitOpenError(requests.exceptions.RequestException):
+    """Raised instead of calling the backend while the breaker is open."""
+
+
+class CircuitBreaker:
+    """
+    Thread-safe three-state circuit breaker.
+
+    CLOSED:    calls pass through; `failure_threshold` consecutive failures open it.
+    OPEN:      calls are rejected immediately until `timeout` seconds have passed.
+    HALF_OPEN: up to `half_open_max_calls` trial calls pass through; `success_threshold`
+               successes close the breaker, any failure reopens it.
+    """
+
+    def __init__(self, name, failure_threshold=3, success_threshold=1, timeout=10.0,
+                 half_open_max_calls=1, max_history=10):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.success_threshold = success_threshold
+        self.timeout = timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.max_history = max_history
+
+        self.state = 'CLOSED'
+        self.failure_count = 0
+        self.consecutive_successes = 0
+        self.opened_at = None
+        self.last_state_change = time.time()
+        self.state_history = []
+        self.metrics = {
+            'totalCalls': 0,
+            'successfulCalls': 0,
+            'failedCalls': 0,
+            'rejectedCalls': 0,
+        }
+
+        self._half_open_in_flight = 0
+        self._lock = threading.Lock()
+
+    def before_call(self):
+        """Admit or reject a call. Raises CircuitOpenError when rejected."""
+        with self._lock:
+            self.metrics['totalCalls'] += 1
+            if self.state == 'OPEN':
+                if time.monotonic() - self.opened_at >= self.timeout:
+                    self._transition_to('HALF_OPEN')
+                else:
+                    self.metrics['rejectedCalls'] += 1
+                    retry_in = self.timeout - (time.monotonic() - self.opened_at)
+                    raise CircuitOpenError(f"Circuit breaker [{self.name}] is OPEN. Retry in {retry_in:.0f}s")
+
+            if self.state == 'HALF_OPEN':
+                if self._half_open_in_flight >= self.half_open_max_calls:
+                    self.metrics['rejectedCalls'] += 1
+                    raise CircuitOpenError(f"Circuit breaker [{self.name}] is HALF_OPEN, trial call in progress")
+                self._half_open_in_flight += 1
+
+    def on_success(self):
+        with self._lock:
+            self.metrics['successfulCalls'] += 1
+            self.consecutive_successes += 1
+            if self.state == 'HALF_OPEN':
+                self._half_open_in_flight = max(0, self._half_open_in_flight - 1)
+                if self.consecutive_successes >= self.success_threshold:
+                    self._transition_to('CLOSED')
+                    self.failure_count = 0
+                    self.consecutive_successes = 0
+            elif self.state == 'CLOSED':
+                self.failure_count = 0
+
+    def on_failure(self):
+        with self._lock:
+            self.metrics['failedCalls'] += 1
+            self.failure_count += 1
+            self.consecutive_successes = 0
+            if self.state == 'HALF_OPEN':
+                self._half_open_in_flight = max(0, self._half_open_in_flight - 1)
+                self._open()
+            elif self.state == 'CLOSED' and self.failure_count >= self.failure_threshold:
+                self._open()
+
+    def call(self, fn, *args, **kwargs):
+        """Run `fn` through the breaker; RequestExceptions count as failures."""
+        self.before_call()
+        try:
+            result = fn(*args, **kwargs)
+        except requests.exceptions.RequestException:
+            self.on_failure()
+            raise
+        self.on_success()
+        return result
+
+    def is_open(self):
+        return self.state == 'OPEN'
+
+    def _open(self):
+        self.opened_at = time.monotonic()
+        self._transition_to('OPEN')
+
+    def _transition_to(self, new_state):
+        old_state = self.state
+        if old_state == new_state:
+            return
+        self.state = new_state
+        self.last_state_change = time.time()
+        self.state_history.append({
+            'from': old_state,
+            'to': new_state,
+            'timestamp': datetime.now().isoformat(),
+        })
+        del self.state_history[:-self.max_history]
+
+    def reset(self):
+        with self._lock:
+            self._transition_to('CLOSED')
+            self.failure_count = 0
+            self.consecutive_successes = 0
+            self._half_open_in_flight = 0
+
+    def get_status(self):
+        with self._lock:
+            return {
+                'name': self.name,
+                'state': self.state,
+                'failureCount': self.failure_count,
+                'failureThreshold': self.failure_threshold,
+                'successThreshold': self.success_threshold,
+                'timeoutSec': self.timeout,
+                'timeInCurrentStateSec': round(time.time() - self.last_state_change, 2),
+                'metrics': dict(self.metrics),
+                'stateHistory': list(self.state_history),
+            }
@@ -0,0 +1,59 @@
+"""
+Columnar JSON encoding for AI Resilience Monitor history endpoints
+Turns row sets into {columns, data: {column: [values...]}} with low-cardinality
+string columns dictionary-encoded, so large windows don't repeat key names.
+"""
+
+# String columns with few distinct values; sent as integer codes into a dictionary
+DICTIONARY_COLUMNS = frozenset({
+    'service', 'error_type', 'circuit_breaker_state', 'from_state', 'to_state', 'chaos_type',
+})
+
+
+def encode_dictionary(values):
+    """Return (codes, dictionary); None stays None."""
+    lookup = {}
+    dictionary = []
+    codes = []
+    for value in values:
+        if value is None:
+            codes.append(None)
+            continue
+        code = lookup.get(value)
+        if code is None:
+            code = lookup[value] = len(dictionary)
+            dictionary.append(value)
+        codes.append(code)
+    return codes, dictionary
+
+
+def to_columnar(columns, rows):
+    """
+    Build the columnar payload from `rows`, a sequence of tuples in `columns` order.
+
+    Decoding a dictionary-encoded column:
+        value = dictionaries[name][code]  (code is null for NULL)
+    """
+    columns = list(columns)
+    values = list(zip(*rows)) if rows else [()] * len(columns)
+    data = {}
+    dictionaries = {}
+    for name, column in zip(columns, values):
+        if name in DICTIONARY_COLUMNS:
+            data[name], dictionaries[name] = encode_dictionary(column)
+        else:
+            data[name] = list(column)
+    return {
+        'columns': columns,
+        'length': len(rows),
+        'data': data,
+        'dictionaries': dictionaries,
+    }
+
+
+def dicts_to_columnar(records):
+    """Columnar payload from a list of dicts that all share the same keys."""
+    if not records:
+        return to_columnar([], [])
+    columns = list(records[0].keys())
+    return to_columnar(columns, [tuple(record[name] for name in columns) for record in records])
@@ -0,0 +1,166 @@
+"""
+Response compression for the AI Resilience Monitor dashboard
+Negotiates gzip/deflate from Accept-Encoding and compresses large or streamed
+responses, recording bytes saved against CPU spent for every route.
+"""
+import threading
+import time
+import zlib
+
+# wbits for zlib.compressobj: gzip container, and zlib container for HTTP "deflate"
+WBITS = {'gzip': 16 + zlib.MAX_WBITS, 'deflate': zlib.MAX_WBITS}
+
+COMPRESSIBLE_MIMETYPES = frozenset({
+    'application/json', 'application/javascript', 'application/xml', 'image/svg+xml',
+})
+
+# Endpoints whose bodies are compressed ahead of time
+PRECOMPRESSED_ENDPOINTS = frozenset({'fingerprinted_asset', 'static'})
+
+
+def is_compressible(mimetype):
+    return mimetype is not None and (mimetype.startswith('text/') or mimetype in COMPRESSIBLE_MIMETYPES)
+
+
+class ResponseCompressor:
+    """
+    Flask after_request hook that compresses responses on the fly.
+
+    Buffered responses smaller than `min_size` bytes are left alone.
+    Streamed responses are compressed chunk by chunk with a sync flush after
+    each chunk, so every chunk still reaches the client as soon as it is produced.
+    Server-sent events, responses that already carry a Content-Encoding and
+    PRECOMPRESSED_ENDPOINTS are never touched.
+    """
+
+    def __init__(self, min_size=1024, gzip_level=6, deflate_level=6, enabled=True, metrics=None):
+        self.metrics = metrics
+        self.configure(min_size, gzip_level, deflate_level, enabled)
+        self._lock = threading.Lock()
+        self._routes = {}
+
+    def configure(self, min_size, gzip_level, deflate_level, enabled=True):
+        self.min_size = min_size
+        self.levels = {'gzip': gzip_level, 'deflate': deflate_level}
+        self.enabled = enabled
+
+    def init_app(self, app):
+        from flask import request
+
+        def compress(response):
+            if not self.enabled:
+                return response
+            encoding = self._negotiate(request, response)
+            if encoding is None:
+                return response
+            route = request.url_rule.rule if request.url_rule is not None else 'unmatched'
+            if response.is_streamed:
+                self._compress_stream(response, encoding, route)
+            else:
+                self._compress_buffered(response, encoding, route)
+            return response
+
+        app.after_request(compress)
+
+    def _negotiate(self, request, response):
+        """Return 'gzip', 'deflate' or None for this request/response pair."""
+        if request.method == 'HEAD' or request.endpoint in PRECOMPRESSED_ENDPOINTS:
+            return None
+        if response.status_code < 200 or response.status_code in (204, 304):
+            return None
+        if 'Content-Encoding' in response.headers or response.mimetype == 'text/event-stream':
+            return None
+        if 'no-transform' in response.headers.get('Cache-Control', ''):
+            return None
+        if not is_compressible(response.mimetype):
+            return None
+        if not response.is_streamed and response.calculate_content_length() < self.min_size:
+            return None
+        encoding = request.accept_encodings.best_match(['gzip', 'deflate'])
+        return encoding if encoding in WBITS else None
+
+    def _compressor(self, encoding):
+        return zlib.compressobj(self.levels[encoding], zlib.DEFLATED, WBITS[encoding])
+
+    def _set_headers(self, response, encoding):
+        response.headers['Content-Encoding'] = encoding
+        response.vary.add('Accept-Encoding')
+        etag, weak = response.get_etag()
+        if etag:
+            # A compressed body is a different representation
+            response.set_etag(f'{etag}-{encoding}', weak=weak)
+
+    def _compress_buffered(self, response, encoding, route):
+        data = response.get_data()
+        cpu_start = time.thread_time()
+        compressor = self._compressor(encoding)
+        compressed = compressor.compress(data) + compressor.flush()
+        cpu = time.thread_time() - cpu_start
+        response.set_data(compressed)
+        self._set_headers(response, encoding)
+        self._record(route, encoding, len(data), len(compressed), cpu)
+
+    def _compress_stream(self, response, encoding, route):
+        source = response.response
+        compressor = self._compressor(encoding)
+
+        def generate():
+            bytes_in = bytes_out = 0
+            cpu = 0.0
+            try:
+                for chunk in source:
+                    if isinstance(chunk, str):
+                        chunk = chunk.encode('utf-8')
+                    if not chunk:
+                        continue
+                    cpu_start = time.thread_time()
+                    out = compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+                    cpu += time.thread_time() - cpu_start
+                    bytes_in += len(chunk)
+                    bytes_out += len(out)
+                    yield out
+                cpu_start = time.thread_time()
+                tail = compressor.flush()
+                cpu += time.thread_time() - cpu_start
+                bytes_out += len(tail)
+                yield tail
+            finally:
+                close = getattr(source, 'close', None)
+                if close is not None:
+                    close()
+                self._record(route, encoding, bytes_in, bytes_out, cpu)
+
+        response.response = generate()
+        response.headers.pop('Content-Length', None)
+        self._set_headers(response, encoding)
+
+    def _record(self, route, encoding, bytes_in, bytes_out, cpu_seconds):
+        with self._lock:
+            stats = self._routes.setdefault((route, encoding), [0, 0, 0, 0.0])
+            stats[0] += 1
+            stats[1] += bytes_in
+            stats[2] += bytes_out
+            stats[3] += cpu_seconds
+        if self.metrics is not None:
+            self.metrics.observe_compression(route, encoding, bytes_in, bytes_out, cpu_seconds)
+
+    def snapshot(self):
+        """Per-route bytes in/out, compression ratio and CPU cost per KB saved."""
+        with self._lock:
+            routes = {}
+            for (route, encoding), (count, bytes_in, bytes_out, cpu) in sorted(self._routes.items()):
+                saved = bytes_in - bytes_out
+                routes.setdefault(route, {})[encoding] = {
+                    'responses': count,
+                    'bytes_in': bytes_in,
+                    'bytes_out': bytes_out,
+                    'ratio': round(bytes_out / bytes_in, 4) if bytes_in else None,
+                    'cpu_ms': round(cpu * 1000, 3),
+                    'cpu_us_per_kb_saved': round(cpu * 1e6 / (saved / 1024), 2) if saved > 0 else None,
+                }
+            return {
+                'enabled': self.enabled,
+                'min_size': self.min_size,
+                'levels': dict(self.levels),
+                'routes': routes,
+            }
@@ -4,48 +4,374 @@ Provides SQLite connection and database operations
 """
 import sqlite3
 import os
+import json
+import threading
+from datetime import datetime
 
-def get_datastore():
+from columnar import to_columnar
+
+DEFAULT_DB_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'monitoring.db')
+
+SCHEMA = [
+    '''
+    CREATE TABLE IF NOT EXISTS metrics (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
+        metric_name TEXT NOT NULL,
+        metric_value REAL,
+        labels TEXT
+    )
+    ''',
+    '''
+    CREATE TABLE IF NOT EXISTS chaos_tests (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
+        test_type TEXT,
+        service TEXT,
+        status TEXT,
+        details TEXT
+    )
+    ''',
+    '''
+    CREATE TABLE IF NOT EXISTS requests (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
+        service TEXT,
+        prompt TEXT,
+        success BOOLEAN,
+        latency INTEGER,
+        response_size INTEGER,
+        error_type TEXT,
+        error_message TEXT,
+        circuit_breaker_state TEXT,
+        chaos_active BOOLEAN,
+        automated BOOLEAN
+    )
+    ''',
+    '''
+    CREATE TABLE IF NOT EXISTS circuit_breaker_events (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
+        service TEXT,
+        from_state TEXT,
+        to_state TEXT,
+        reason TEXT,
+        failure_count INTEGER,
+        success_count INTEGER
+    )
+    ''',
+    '''
+    CREATE TABLE IF NOT EXISTS chaos_experiments (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        start_time DATETIME DEFAULT CURRENT_TIMESTAMP,
+        end_time DATETIME,
+        chaos_type TEXT,
+        intensity REAL,
+        duration INTEGER,
+        affected_services TEXT,
+        total_requests INTEGER,
+        failed_requests INTEGER,
+        notes TEXT
+    )
+    ''',
+    'CREATE INDEX IF NOT EXISTS idx_requests_timestamp ON requests(timestamp)',
+    'CREATE INDEX IF NOT EXISTS idx_requests_service ON requests(service)',
+    'CREATE INDEX IF NOT EXISTS idx_requests_success ON requests(success)',
+    'CREATE INDEX IF NOT EXISTS idx_cb_events_service ON circuit_breaker_events(service)',
+]
+
+
+class UnknownFieldError(ValueError):
+    """Raised when a field projection names a column the table does not have."""
+
+
+class MonitoringDatastore:
     """
-    Get SQLite database connection with WAL mode enabled.
-    Returns a connection object.
+    SQLite datastore shared by every thread and worker process of the dashboard.
+
+    Connections are opened lazily per (process, thread). A connection inherited
+    through fork() is never reused, so the datastore can be created before the
+    production server forks its workers.
     """
-    db_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'monitoring.db')
-    
-    # Ensure data directory exists
-    os.makedirs(os.path.dirname(db_path), exist_ok=True)
-    
-    # Create connection
-    conn = sqlite3.connect(db_path, check_same_thread=False)
-    
-    # Enable WAL mode for better concurrent access
-    conn.execute('PRAGMA journal_mode=WAL')
-    
-    # Set busy timeout
-    conn.execute('PRAGMA busy_timeout=5000')
-    
-    # Create tables if they don't exist
-    conn.execute('''
-        CREATE TABLE IF NOT EXISTS metrics (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
-            metric_name TEXT NOT NULL,
-            metric_value REAL,
-            labels TEXT
+
+    def __init__(self, db_path=DEFAULT_DB_PATH):
+        self.db_path = db_path
+        self._local = threading.local()
+        self._schema_lock = threading.Lock()
+        self._schema_pid = None
+        self._table_columns = {}
+
+        # Ensure data directory exists
+        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+
+    def connection(self):
+        """Return the connection owned by the calling process and thread."""
+        pid = os.getpid()
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None and self._local.pid == pid:
+            return conn
+
+        conn = sqlite3.connect(self.db_path, timeout=5)
+        conn.row_factory = sqlite3.Row
+
+        # Enable WAL mode for better concurrent access
+        conn.execute('PRAGMA journal_mode=WAL')
+
+        # Set busy timeout
+        conn.execute('PRAGMA busy_timeout=5000')
+
+        self._local.conn = conn
+        self._local.pid = pid
+        self._ensure_schema(conn, pid)
+        return conn
+
+    def _ensure_schema(self, conn, pid):
+        """Create tables once per process."""
+        with self._schema_lock:
+            if self._schema_pid == pid:
+                return
+            for statement in SCHEMA:
+                conn.execute(statement)
+            conn.commit()
+            self._schema_pid = pid
+
+    def close(self):
+        """Close the calling thread's connection, if it owns one."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None and self._local.pid == os.getpid():
+            conn.close()
+        self._local.conn = None
+
+    def _query(self, sql, params=()):
+        rows = self.connection().execute(sql, params).fetchall()
+        return [dict(row) for row in rows]
+
+    def _select_list(self, table, fields=None):
+        """
+        Validate a field projection against the table's columns and return
+        the SELECT list for it ('*' when no projection is requested).
+        """
+        if not fields:
+            return '*'
+        columns = self._table_columns.get(table)
+        if columns is None:
+            rows = self.connection().execute(f'PRAGMA table_info({table})').fetchall()
+            columns = self._table_columns[table] = [row['name'] for row in rows]
+        unknown = [field for field in fields if field not in columns]
+        if unknown:
+            raise UnknownFieldError(
+                f"Unknown field(s) for {table}: {', '.join(unknown)}. Available: {', '.join(columns)}")
+        # Identifiers are whitelisted above, so they are safe to interpolate
+        return ', '.join(dict.fromkeys(fields))
+
+    def _query_columnar(self, sql, params=()):
+        """Run a query and return its result in columnar form (see columnar.py)."""
+        cursor = self.connection().execute(sql, params)
+        columns = [description[0] for description in cursor.description]
+        return to_columnar(columns, cursor.fetchall())
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def log_request(self, service, success, latency, response_size=0, error_type=None,
+                    error_message=None, prompt=None, circuit_breaker_state=None,
+                    chaos_active=False, automated=False):
+        """Insert a request record and return its row id."""
+        conn = self.connection()
+        cursor = conn.execute(
+            '''
+            INSERT INTO requests (service, prompt, success, latency, response_size,
+                                  error_type, error_message, circuit_breaker_state,
+                                  chaos_active, automated)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''',
+            (service, prompt, bool(success), latency, response_size, error_type,
+             error_message, circuit_breaker_state, bool(chaos_active), bool(automated))
         )
-    ''')
-    
-    conn.execute('''
-        CREATE TABLE IF NOT EXISTS chaos_tests (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
-            test_type TEXT,
-            service TEXT,
-            status TEXT,
-            details TEXT
+        conn.commit()
+        return cursor.lastrowid
+
+    def log_requests(self, records):
+        """
+        Insert many request records in one transaction. Each record holds
+        log_request() keyword arguments plus an optional UTC 'timestamp'.
+        """
+        conn = self.connection()
+        with conn:
+            conn.executemany(
+                '''
+                INSERT INTO requests (timestamp, service, prompt, success, latency, response_size,
+                                      error_type, error_message, circuit_breaker_state,
+                                      chaos_active, automated)
+                VALUES (COALESCE(?, CURRENT_TIMESTAMP), ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ''',
+                [(r.get('timestamp'), r['service'], r.get('prompt'), bool(r['success']), r.get('latency'),
+                  r.get('response_size', 0), r.get('error_type'), r.get('error_message'),
+                  r.get('circuit_breaker_state'), bool(r.get('chaos_active')), bool(r.get('automated')))
+                 for r in records]
+            )
+        return len(records)
+
+    def cleanup_old_data(self, days=30):
+        """Remove data older than the given number of days."""
+        conn = self.connection()
+        window = f'-{int(days)} days'
+        deleted = 0
+        deleted += conn.execute("DELETE FROM requests WHERE timestamp < datetime('now', ?)", (window,)).rowcount
+        deleted += conn.execute("DELETE FROM circuit_breaker_events WHERE timestamp < datetime('now', ?)", (window,)).rowcount
+        deleted += conn.execute("DELETE FROM chaos_experiments WHERE start_time < datetime('now', ?)", (window,)).rowcount
+        conn.commit()
+        return deleted
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def get_recent_requests(self, limit=100, service=None, columnar=False, fields=None):
+        """Return the most recent requests, newest first, optionally only `fields`."""
+        query = self._query_columnar if columnar else self._query
+        select = self._select_list('requests', fields)
+        if service:
+            return query(
+                f'SELECT {select} FROM requests WHERE service = ? ORDER BY timestamp DESC, id DESC LIMIT ?',
+                (service, limit)
+            )
+        return query(f'SELECT {select} FROM requests ORDER BY timestamp DESC, id DESC LIMIT ?', (limit,))
+
+    def get_service_statistics(self, service=None, hours=24):
+        """Aggregate request statistics over the last `hours`."""
+        sql = '''
+            SELECT service,
+                   COUNT(*) AS total_requests,
+                   SUM(CASE WHEN success THEN 1 ELSE 0 END) AS successful_requests,
+                   AVG(latency) AS avg_latency,
+                   MIN(latency) AS min_latency,
+                   MAX(latency) AS max_latency
+            FROM requests
+            WHERE timestamp >= datetime('now', ?)
+        '''
+        params = [f'-{int(hours)} hours']
+        if service:
+            sql += ' AND service = ?'
+            params.append(service)
+        sql += ' GROUP BY service'
+
+        services = {}
+        for row in self._query(sql, params):
+            total = row['total_requests'] or 0
+            successful = row['successful_requests'] or 0
+            services[row['service']] = {
+                'total_requests': total,
+                'successful_requests': successful,
+                'failed_requests': total - successful,
+                'success_rate': round(successful / total * 100, 2) if total else 0,
+                'avg_latency': round(row['avg_latency'] or 0, 2),
+                'min_latency': row['min_latency'] or 0,
+                'max_latency': row['max_latency'] or 0,
+            }
+
+        if service:
+            return services.get(service, {
+                'total_requests': 0, 'successful_requests': 0, 'failed_requests': 0,
+                'success_rate': 0, 'avg_latency': 0, 'min_latency': 0, 'max_latency': 0,
+            })
+        return services
+
+    def get_error_patterns(self, hours=24):
+        """Count failed requests by error type."""
+        rows = self._query(
+            '''
+            SELECT COALESCE(error_type, 'Unknown') AS error_type, COUNT(*) AS count
+            FROM requests
+            WHERE NOT success AND timestamp >= datetime('now', ?)
+            GROUP BY COALESCE(error_type, 'Unknown')
+            ORDER BY count DESC
+            ''',
+            (f'-{int(hours)} hours',)
         )
-    ''')
-    
-    conn.commit()
-    
-    return conn
+        return {row['error_type']: row['count'] for row in rows}
+
+    def get_circuit_breaker_history(self, service=None, limit=50, columnar=False, fields=None):
+        """Return circuit breaker transitions, newest first, optionally only `fields`."""
+        query = self._query_columnar if columnar else self._query
+        select = self._select_list('circuit_breaker_events', fields)
+        if service:
+            return query(
+                f'SELECT {select} FROM circuit_breaker_events WHERE service = ? ORDER BY timestamp DESC, id DESC LIMIT ?',
+                (service, limit)
+            )
+        return query(f'SELECT {select} FROM circuit_breaker_events ORDER BY timestamp DESC, id DESC LIMIT ?', (limit,))
+
+    def get_chaos_experiments(self, limit=20, columnar=False, fields=None):
+        """Return chaos experiments, newest first, optionally only `fields`."""
+        query = self._query_columnar if columnar else self._query
+        select = self._select_list('chaos_experiments', fields)
+        return query(f'SELECT {select} FROM chaos_experiments ORDER BY start_time DESC, id DESC LIMIT ?', (limit,))
+
+    def get_performance_trends(self, service=None, hours=24, interval_minutes=30):
+        """Bucket requests into fixed intervals and aggregate each bucket."""
+        bucket_seconds = max(1, int(interval_minutes)) * 60
+        sql = '''
+            SELECT (CAST(strftime('%s', timestamp) AS INTEGER) / ?) * ? AS bucket,
+                   COUNT(*) AS total_requests,
+                   SUM(CASE WHEN success THEN 1 ELSE 0 END) AS successful_requests,
+                   AVG(latency) AS avg_latency
+            FROM requests
+            WHERE timestamp >= datetime('now', ?)
+        '''
+        params = [bucket_seconds, bucket_seconds, f'-{int(hours)} hours']
+        if service:
+            sql += ' AND service = ?'
+            params.append(service)
+        sql += ' GROUP BY bucket ORDER BY bucket'
+
+        trends = []
+        for row in self._query(sql, params):
+            total = row['total_requests'] or 0
+            successful = row['successful_requests'] or 0
+            trends.append({
+                'period': datetime.utcfromtimestamp(row['bucket']).isoformat(),
+                'total_requests': total,
+                'successful_requests': successful,
+                'success_rate': round(successful / total * 100, 2) if total else 0,
+                'avg_latency': round(row['avg_latency'] or 0, 2),
+            })
+        return trends
+
+    def get_database_stats(self):
+        """Return row counts per table and the database file size."""
+        stats = {}
+        for table in ('requests', 'circuit_breaker_events', 'chaos_experiments', 'metrics', 'chaos_tests'):
+            stats[f'{table}_count'] = self.connection().execute(f'SELECT COUNT(*) FROM {table}').fetchone()[0]
+        stats['database_size_bytes'] = os.path.getsize(self.db_path) if os.path.exists(self.db_path) else 0
+        stats['database_path'] = self.db_path
+        return stats
+
+    def export_to_json(self, output_file, hours=24):
+        """Export the last `hours` of data to a JSON file and return its path."""
+        window = f'-{int(hours)} hours'
+        payload = {
+            'exported_at': datetime.now().isoformat(),
+            'time_range_hours': hours,
+            'requests': self._query(
+                "SELECT * FROM requests WHERE timestamp >= datetime('now', ?) ORDER BY timestamp", (window,)),
+            'circuit_breaker_events': self._query(
+                "SELECT * FROM circuit_breaker_events WHERE timestamp >= datetime('now', ?) ORDER BY timestamp", (window,)),
+            'chaos_experiments': self._query(
+                "SELECT * FROM chaos_experiments WHERE start_time >= datetime('now', ?) ORDER BY start_time", (window,)),
+            'statistics': self.get_service_statistics(hours=hours),
+        }
+
+        os.makedirs(os.path.dirname(os.path.abspath(output_file)), exist_ok=True)
+        with open(output_file, 'w') as f:
+            json.dump(payload, f, indent=2, default=str)
+        return output_file
+
+
+def get_datastore(db_path=None):
+    """
+    Get the SQLite datastore with WAL mode enabled.
+    Connections are created per process and thread on first use.
+    """
+    return MonitoringDatastore(db_path or DEFAULT_DB_PATH)
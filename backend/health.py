@@ -0,0 +1,139 @@
+"""
+Backend health tracking for AI Resilience Monitor
+Probes the Node.js backend from a background thread so request handlers
+can read connectivity state without making their own network calls.
+"""
+import bisect
+import logging
+import os
+import threading
+import time
+from collections import deque
+from datetime import datetime
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+# Probe latency histogram bucket upper bounds (milliseconds)
+LATENCY_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+
+class BackendHealthTracker:
+    """
+    Probe `<backend_url>/test` at a fixed cadence and keep the latest state.
+
+    State is one of 'unknown' (no probe yet), 'connected', 'error' (non-200
+    response) or 'disconnected' (request failed). Reads never block on the
+    network. The probe thread is started lazily and restarted after fork(),
+    so every worker process tracks health on its own.
+    """
+
+    def __init__(self, backend_url, interval=2.0, timeout=2.0, max_transitions=50):
+        self.backend_url = backend_url
+        self.interval = interval
+        self.timeout = timeout
+
+        self.state = 'unknown'
+        self.last_probe_at = None
+        self.last_latency_ms = None
+        self.last_error = None
+        self.last_change_at = None
+        self.consecutive_failures = 0
+        self.transitions = deque(maxlen=max_transitions)
+
+        self._bucket_counts = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self._latency_sum_ms = 0.0
+        self._probe_count = 0
+
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self._pid = None
+
+    def ensure_started(self):
+        """Start the probe thread if it is not running in this process."""
+        pid = os.getpid()
+        if self._pid == pid and self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._pid == pid and self._thread is not None and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._pid = pid
+            self._thread = threading.Thread(target=self._run, name='backend-health', daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def _run(self):
+        session = requests.Session()
+        while not self._stop.is_set():
+            self.probe(session)
+            self._stop.wait(self.interval)
+
+    def probe(self, session=None):
+        """Run one probe and record the result."""
+        start = time.perf_counter()
+        error = None
+        try:
+            response = (session or requests).get(f"{self.backend_url}/test", timeout=self.timeout)
+            state = 'connected' if response.status_code == 200 else 'error'
+            if state == 'error':
+                error = f"HTTP {response.status_code}"
+        except requests.exceptions.RequestException as e:
+            state = 'disconnected'
+            error = str(e)
+        latency_ms = (time.perf_counter() - start) * 1000
+        self._record(state, latency_ms, error)
+        return state
+
+    def _record(self, state, latency_ms, error):
+        now = datetime.now().isoformat()
+        with self._lock:
+            if state != self.state:
+                self.transitions.append({'from': self.state, 'to': state, 'timestamp': now})
+                self.last_change_at = now
+                logger.info(f"Backend health: {self.state} -> {state}")
+                self.state = state
+
+            self.consecutive_failures = 0 if state == 'connected' else self.consecutive_failures + 1
+            self.last_probe_at = now
+            self.last_latency_ms = round(latency_ms, 2)
+            self.last_error = error
+
+            self._bucket_counts[bisect.bisect_left(LATENCY_BUCKETS_MS, latency_ms)] += 1
+            self._latency_sum_ms += latency_ms
+            self._probe_count += 1
+
+    def is_down(self):
+        """True when the last probe could not reach the backend."""
+        self.ensure_started()
+        return self.state == 'disconnected'
+
+    def snapshot(self):
+        """Return the current health state as a JSON-serializable dict."""
+        self.ensure_started()
+        with self._lock:
+            cumulative = 0
+            histogram = []
+            for bound, count in zip(LATENCY_BUCKETS_MS + ('+Inf',), self._bucket_counts):
+                cumulative += count
+                histogram.append({'le': bound, 'count': cumulative})
+
+            return {
+                'state': self.state,
+                'last_probe_at': self.last_probe_at,
+                'last_latency_ms': self.last_latency_ms,
+                'last_error': self.last_error,
+                'last_change_at': self.last_change_at,
+                'consecutive_failures': self.consecutive_failures,
+                'probe_interval_sec': self.interval,
+                'probe_latency_histogram': {
+                    'buckets': histogram,
+                    'count': self._probe_count,
+                    'sum_ms': round(self._latency_sum_ms, 2),
+                },
+                'transitions': list(self.transitions),
+            }
@@ -0,0 +1,189 @@
+"""
+Hedged requests for the dashboard's /ai proxy
+If the primary provider has not answered within its observed p95 latency,
+a duplicate request goes to a secondary provider and the first success wins.
+"""
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, wait
+
+import requests
+
+from stats import percentile
+
+
+class LatencyWindow:
+    """Rolling window of recent successful latencies (seconds) per service."""
+
+    def __init__(self, size=200):
+        self.size = size
+        self._samples = {}
+        self._lock = threading.Lock()
+
+    def record(self, service, seconds):
+        with self._lock:
+            window = self._samples.get(service)
+            if window is None:
+                window = self._samples[service] = deque(maxlen=self.size)
+            window.append(seconds)
+
+    def percentile(self, service, q, min_samples=1):
+        with self._lock:
+            window = self._samples.get(service)
+            if not window or len(window) < min_samples:
+                return None
+            values = sorted(window)
+        return percentile(values, q)
+
+
+class Hedger:
+    """
+    Run /ai attempts with an optional hedge to a secondary provider.
+
+    `send(service)` performs one blocking backend call and returns a
+    requests.Response. The hedge fires after the primary's observed p95
+    (or `default_delay` until `min_samples` latencies are known). The first
+    200 response wins; the losing attempt is abandoned: its result is
+    discarded and, if it has not started yet, it is cancelled. requests
+    cannot abort a call mid-flight, so a started loser runs to completion
+    in the background (bounded by its own timeout).
+    """
+
+    def __init__(self, services, executor, window=None, min_samples=20,
+                 default_delay=1.0, min_delay=0.05, max_delay=10.0, metrics=None):
+        self.services = list(services)
+        self.executor = executor
+        self.window = window or LatencyWindow()
+        self.min_samples = min_samples
+        self.default_delay = default_delay
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.metrics = metrics
+
+        self._lock = threading.Lock()
+        self.stats = {'requests': 0, 'hedged': 0, 'hedge_wins': 0, 'primary_wins': 0, 'skipped': 0}
+        # 'actual': end-to-end latency served to clients.
+        # 'primary': what the primary alone took (abandoned primaries keep
+        # running, so their true latency is still measured) - the latency
+        # these requests would have had without hedging.
+        self._served = LatencyWindow(size=1000)
+
+    def hedge_delay(self, service):
+        p95 = self.window.percentile(service, 95, min_samples=self.min_samples)
+        if p95 is None:
+            return self.default_delay
+        return min(self.max_delay, max(self.min_delay, p95))
+
+    def pick_secondary(self, primary):
+        """Choose the other provider with the lowest observed p95."""
+        candidates = [s for s in self.services if s != primary]
+        if not candidates:
+            return None
+
+        def score(service):
+            p95 = self.window.percentile(service, 95, min_samples=self.min_samples)
+            return p95 if p95 is not None else self.default_delay
+
+        return min(candidates, key=score)
+
+    def _count(self, key):
+        with self._lock:
+            self.stats[key] += 1
+
+    def _attempt(self, service, send):
+        start = time.perf_counter()
+        response = send(service)
+        elapsed = time.perf_counter() - start
+        if response.status_code == 200:
+            self.window.record(service, elapsed)
+        return service, response, elapsed
+
+    def run(self, primary, send, acquire_secondary=None, release_primary=None):
+        """
+        Serve one request. `acquire_secondary(service)` returns a release
+        callable if the secondary has spare capacity, else None (no hedge).
+        `release_primary()`, if given, is called exactly once when the primary
+        call has finished, which may be after run() returns if the hedge won.
+        Returns (response, served_by, hedged).
+        """
+        self._count('requests')
+        start = time.perf_counter()
+        delay = self.hedge_delay(primary)
+        try:
+            primary_future = self.executor.submit(self._attempt, primary, send)
+        except BaseException:
+            if release_primary is not None:
+                release_primary()
+            raise
+        if release_primary is not None:
+            primary_future.add_done_callback(lambda f: release_primary())
+        primary_future.add_done_callback(lambda f: self._served.record('primary', time.perf_counter() - start))
+
+        done, _ = wait([primary_future], timeout=delay)
+        secondary = None if done else self.pick_secondary(primary)
+        release = acquire_secondary(secondary) if secondary and acquire_secondary else None
+        if secondary and release is None:
+            self._count('skipped')
+        if release is None:
+            _, response, _ = primary_future.result()
+            total = time.perf_counter() - start
+            self._served.record('actual', total)
+            self._observe(primary, 'unhedged', total)
+            return response, primary, False
+
+        self._count('hedged')
+        secondary_future = self.executor.submit(self._attempt, secondary, send)
+        secondary_future.add_done_callback(lambda f: release())
+
+        futures = {primary_future: primary, secondary_future: secondary}
+        pending = set(futures)
+        fallback = None
+        last_error = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                try:
+                    service, response, _ = future.result()
+                except requests.exceptions.RequestException as e:
+                    last_error = e
+                    continue
+                if response.status_code == 200:
+                    for loser in pending:
+                        loser.cancel()
+                    total = time.perf_counter() - start
+                    winner = 'primary' if service == primary else 'hedge'
+                    self._count('primary_wins' if winner == 'primary' else 'hedge_wins')
+                    self._served.record('actual', total)
+                    self._observe(primary, winner, total)
+                    return response, service, True
+                if fallback is None or service == primary:
+                    fallback = (response, service)
+
+        self._served.record('actual', time.perf_counter() - start)
+        self._observe(primary, 'failed', time.perf_counter() - start)
+        if fallback is not None:
+            return fallback[0], fallback[1], True
+        raise last_error
+
+    def _observe(self, service, outcome, seconds):
+        if self.metrics is not None:
+            self.metrics.observe_hedge(service, outcome, seconds)
+
+    def snapshot(self):
+        """Hedge rate, win rate and served vs. primary-only tail latency."""
+        with self._lock:
+            stats = dict(self.stats)
+        hedged = stats['hedged']
+        stats['hedge_rate'] = round(hedged / stats['requests'], 4) if stats['requests'] else 0
+        stats['hedge_win_rate'] = round(stats['hedge_wins'] / hedged, 4) if hedged else 0
+        stats['latency_sec'] = {
+            kind: {f'p{q}': self._served.percentile(kind, q) for q in (50, 95, 99)}
+            for kind in ('actual', 'primary')
+        }
+        actual_p99 = stats['latency_sec']['actual']['p99']
+        primary_p99 = stats['latency_sec']['primary']['p99']
+        stats['p99_improvement_sec'] = (round(primary_p99 - actual_p99, 4)
+                                        if actual_p99 is not None and primary_p99 is not None else None)
+        stats['hedge_delay_sec'] = {service: round(self.hedge_delay(service), 3) for service in self.services}
+        return stats
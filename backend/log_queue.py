@@ -0,0 +1,255 @@
+"""
+Asynchronous request logging for AI Resilience Monitor
+Validated records are queued in memory and written to SQLite in batches by a
+background thread, so /api/log-request never waits on the database.
+"""
+import logging
+import os
+import random
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+
+from stats import percentile
+
+logger = logging.getLogger(__name__)
+
+OVERFLOW_POLICIES = ('block', 'drop-oldest', 'sample')
+
+# Optional text fields of a request record: JSON name -> log_request() argument
+TEXT_FIELDS = {
+    'errorType': 'error_type',
+    'errorMessage': 'error_message',
+    'prompt': 'prompt',
+    'circuitBreakerState': 'circuit_breaker_state',
+}
+
+
+class LogQueueFull(Exception):
+    """Raised by the 'block' policy when no space frees up in time."""
+
+
+def validate_request_record(data):
+    """
+    Turn an /api/log-request body into log_request() keyword arguments.
+    Returns (record, errors); record is None when there are errors.
+    """
+    if not isinstance(data, dict):
+        return None, ['body must be a JSON object']
+
+    errors = []
+    service = data.get('service')
+    if not isinstance(service, str) or not service:
+        errors.append('service must be a non-empty string')
+    if not isinstance(data.get('success'), bool):
+        errors.append('success must be a boolean')
+
+    latency = data.get('latency')
+    if latency is not None and (isinstance(latency, bool) or not isinstance(latency, (int, float)) or latency < 0):
+        errors.append('latency must be a non-negative number')
+    response_size = data.get('responseSize', 0)
+    if response_size is None:
+        response_size = 0
+    if isinstance(response_size, bool) or not isinstance(response_size, int) or response_size < 0:
+        errors.append('responseSize must be a non-negative integer')
+
+    for name in TEXT_FIELDS:
+        if data.get(name) is not None and not isinstance(data[name], str):
+            errors.append(f'{name} must be a string or null')
+    for name in ('chaosActive', 'automated'):
+        if not isinstance(data.get(name, False), bool):
+            errors.append(f'{name} must be a boolean')
+
+    if errors:
+        return None, errors
+
+    record = {
+        'service': service,
+        'success': data['success'],
+        'latency': latency,
+        'response_size': response_size,
+        'chaos_active': data.get('chaosActive', False),
+        'automated': data.get('automated', False),
+    }
+    for name, arg in TEXT_FIELDS.items():
+        record[arg] = data.get(name)
+    return record, []
+
+
+class RequestLogQueue:
+    """
+    Bounded in-memory queue drained into the datastore by a writer thread.
+
+    When the queue is full, `policy` decides what happens to a new record:
+      block:       wait up to `block_timeout` seconds for space, then raise LogQueueFull
+      drop-oldest: discard the oldest queued record to make room
+      sample:      above half full, keep new records with a probability that
+                   falls linearly to zero as the queue fills
+    The writer thread is started lazily and restarted after fork(), like
+    BackendHealthTracker, so every worker process drains its own queue.
+    """
+
+    def __init__(self, datastore, max_size=10000, policy='block', block_timeout=1.0,
+                 batch_size=200, flush_interval=0.05, metrics=None):
+        self.datastore = datastore
+        self.metrics = metrics
+        self.configure(max_size, policy, block_timeout)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+
+        self.enqueued = 0
+        self.committed = 0
+        self.dropped = {'block_timeout': 0, 'drop_oldest': 0, 'sampled_out': 0, 'write_error': 0}
+        self.last_commit_at = None
+        self._lags = deque(maxlen=1000)
+        self._max_lag = 0.0
+
+        self._queue = deque()
+        self._cond = threading.Condition()
+        self._in_progress = 0
+        self._closed = False
+        self._thread = None
+        self._pid = None
+
+    def configure(self, max_size, policy, block_timeout):
+        if policy not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy '{policy}', expected one of {OVERFLOW_POLICIES}")
+        self.max_size = max_size
+        self.policy = policy
+        self.block_timeout = block_timeout
+
+    def ensure_started(self):
+        """Start the writer thread if it is not running in this process."""
+        pid = os.getpid()
+        if self._pid == pid and self._thread is not None and self._thread.is_alive():
+            return
+        with self._cond:
+            if self._pid == pid and self._thread is not None and self._thread.is_alive():
+                return
+            if self._pid != pid:
+                # Records queued by the parent belong to the parent
+                self._queue.clear()
+                self._in_progress = 0
+            self._closed = False
+            self._pid = pid
+            self._thread = threading.Thread(target=self._run, name='request-log-writer', daemon=True)
+            self._thread.start()
+
+    def put(self, record):
+        """Queue a record. Returns False if it was dropped; raises LogQueueFull under 'block'."""
+        self.ensure_started()
+        with self._cond:
+            if len(self._queue) >= self.max_size:
+                if self.policy == 'block':
+                    deadline = time.monotonic() + self.block_timeout
+                    while len(self._queue) >= self.max_size:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            self._drop('block_timeout')
+                            raise LogQueueFull(f"Request log queue full ({self.max_size} records)")
+                        self._cond.wait(remaining)
+                elif self.policy == 'drop-oldest':
+                    self._queue.popleft()
+                    self._drop('drop_oldest')
+                else:
+                    self._drop('sampled_out')
+                    return False
+            elif self.policy == 'sample' and len(self._queue) > self.max_size // 2:
+                keep = (self.max_size - len(self._queue)) / (self.max_size - self.max_size // 2)
+                if random.random() >= keep:
+                    self._drop('sampled_out')
+                    return False
+
+            self._queue.append((time.monotonic(), datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S'), record))
+            self.enqueued += 1
+            self._publish_depth()
+            self._cond.notify_all()
+            return True
+
+    def _drop(self, reason, count=1):
+        self.dropped[reason] += count
+        if self.metrics is not None:
+            self.metrics.observe_log_drop(reason, count)
+
+    def _publish_depth(self):
+        if self.metrics is not None:
+            self.metrics.set_log_queue_depth(len(self._queue))
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._queue and not self._closed:
+                    self._cond.wait()
+                if not self._queue and self._closed:
+                    return
+                # Give a burst a moment to accumulate into one transaction
+                if len(self._queue) < self.batch_size and not self._closed:
+                    self._cond.wait(self.flush_interval)
+                batch = [self._queue.popleft() for _ in range(min(self.batch_size, len(self._queue)))]
+                self._in_progress = len(batch)
+                self._publish_depth()
+                self._cond.notify_all()
+            self._write(batch)
+
+    def _write(self, batch):
+        try:
+            self.datastore.log_requests([dict(record, timestamp=accepted_at) for _, accepted_at, record in batch])
+        except Exception as e:
+            logger.error(f"Failed to write {len(batch)} queued request records: {e}")
+            with self._cond:
+                self._drop('write_error', len(batch))
+                self._in_progress = 0
+                self._cond.notify_all()
+            return
+
+        now = time.monotonic()
+        lags = [now - enqueued_at for enqueued_at, _, _ in batch]
+        with self._cond:
+            self.committed += len(batch)
+            self.last_commit_at = datetime.now().isoformat()
+            self._lags.extend(lags)
+            self._max_lag = max(self._max_lag, max(lags))
+            self._in_progress = 0
+            self._cond.notify_all()
+        if self.metrics is not None:
+            self.metrics.observe_log_commit(lags)
+
+    def flush(self, timeout=5.0):
+        """Wait until everything queued so far has been written. Returns True if drained."""
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            while self._queue or self._in_progress:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+            return True
+
+    def close(self, timeout=5.0):
+        """Drain the queue and stop the writer thread (registered with atexit)."""
+        if self._thread is None or self._pid != os.getpid():
+            return
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join(timeout)
+
+    def snapshot(self):
+        with self._cond:
+            lags = sorted(self._lags)
+            return {
+                'policy': self.policy,
+                'depth': len(self._queue),
+                'max_size': self.max_size,
+                'enqueued': self.enqueued,
+                'committed': self.committed,
+                'dropped': dict(self.dropped),
+                'last_commit_at': self.last_commit_at,
+                'lag_ms': {
+                    'p50': round(percentile(lags, 50) * 1000, 2) if lags else None,
+                    'p95': round(percentile(lags, 95) * 1000, 2) if lags else None,
+                    'p99': round(percentile(lags, 99) * 1000, 2) if lags else None,
+                    'max': round(self._max_lag * 1000, 2),
+                },
+            }
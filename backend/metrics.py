@@ -0,0 +1,304 @@
+"""
+Prometheus instrumentation for the AI Resilience Monitor dashboard
+Per-route latency histograms, in-flight gauges and upstream call durations
+for the Flask process, exposed in Prometheus text format.
+
+Set PROMETHEUS_MULTIPROC_DIR to an empty directory before starting the
+dashboard with --workers > 1 to aggregate metrics across worker processes.
+"""
+import os
+import time
+
+from prometheus_client import (
+    CollectorRegistry, Counter, Gauge, Histogram, generate_latest, CONTENT_TYPE_LATEST
+)
+from prometheus_client import multiprocess
+
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+
+# Statuses whose label children are created up front for every route
+PREWARM_STATUSES = ('200', '500', '503')
+
+MULTIPROCESS = bool(os.environ.get('PROMETHEUS_MULTIPROC_DIR'))
+
+
+class RequestMetrics:
+    """
+    Request-timing instrumentation for a Flask app.
+
+    Label children are cached per label tuple so the hot path is a dict
+    lookup plus observe(); no label validation or allocation per request.
+    """
+
+    def __init__(self, registry=None):
+        self.registry = registry or CollectorRegistry()
+
+        self.request_duration = Histogram(
+            'dashboard_http_request_duration_seconds',
+            'Dashboard HTTP request latency by route, method and status',
+            ['route', 'method', 'status'],
+            buckets=LATENCY_BUCKETS,
+            registry=self.registry
+        )
+        self.in_flight = Gauge(
+            'dashboard_http_requests_in_flight',
+            'Dashboard HTTP requests currently being served, by route',
+            ['route'],
+            multiprocess_mode='livesum',
+            registry=self.registry
+        )
+        self.upstream_duration = Histogram(
+            'dashboard_upstream_request_duration_seconds',
+            'Duration of calls from the dashboard to the Node.js backend',
+            ['target', 'outcome'],
+            buckets=LATENCY_BUCKETS,
+            registry=self.registry
+        )
+
+        self.ai_active = Gauge(
+            'dashboard_ai_requests_active',
+            'Admitted /ai proxy requests currently in flight, by service',
+            ['service'],
+            multiprocess_mode='livesum',
+            registry=self.registry
+        )
+        self.ai_queue_depth = Gauge(
+            'dashboard_ai_queue_depth',
+            'Requests waiting for an /ai proxy slot, by service',
+            ['service'],
+            multiprocess_mode='livesum',
+            registry=self.registry
+        )
+        self.ai_queue_wait = Histogram(
+            'dashboard_ai_queue_wait_seconds',
+            'Time /ai proxy requests spent queued, by service and outcome',
+            ['service', 'outcome'],
+            buckets=LATENCY_BUCKETS,
+            registry=self.registry
+        )
+        self.ai_shed = Counter(
+            'dashboard_ai_requests_shed_total',
+            'Requests rejected by /ai admission control, by service and reason',
+            ['service', 'reason'],
+            registry=self.registry
+        )
+
+        self.ai_hedge_duration = Histogram(
+            'dashboard_ai_hedging_request_duration_seconds',
+            'End-to-end latency of hedging-enabled /ai requests, by primary service and outcome',
+            ['service', 'outcome'],
+            buckets=LATENCY_BUCKETS,
+            registry=self.registry
+        )
+
+        self.ai_cache_lookups = Counter(
+            'dashboard_ai_cache_requests_total',
+            '/ai response cache lookups by service and result (hit, stale, miss, bypass)',
+            ['service', 'result'],
+            registry=self.registry
+        )
+
+        self.log_queue_depth = Gauge(
+            'dashboard_request_log_queue_depth',
+            'Request records waiting to be written to SQLite',
+            multiprocess_mode='livesum',
+            registry=self.registry
+        )
+        self.log_lag = Histogram(
+            'dashboard_request_log_lag_seconds',
+            'Time from /api/log-request accepting a record to its commit',
+            buckets=LATENCY_BUCKETS,
+            registry=self.registry
+        )
+        self.log_dropped = Counter(
+            'dashboard_request_log_dropped_total',
+            'Request records dropped before reaching SQLite, by reason',
+            ['reason'],
+            registry=self.registry
+        )
+
+        self.compression_bytes = Counter(
+            'dashboard_compression_bytes_total',
+            'Response bytes before (in) and after (out) on-the-fly compression, by route and encoding',
+            ['route', 'encoding', 'direction'],
+            registry=self.registry
+        )
+        self.compression_cpu = Histogram(
+            'dashboard_compression_cpu_seconds',
+            'CPU time spent compressing one response, by route and encoding',
+            ['route', 'encoding'],
+            buckets=(0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25),
+            registry=self.registry
+        )
+
+        self._duration_children = {}
+        self._in_flight_children = {}
+        self._upstream_children = {}
+        self._admission_children = {}
+        self._queue_wait_children = {}
+        self._shed_children = {}
+        self._hedge_children = {}
+        self._cache_children = {}
+        self._compression_children = {}
+
+    # ------------------------------------------------------------------
+    # Label child caches
+    # ------------------------------------------------------------------
+
+    def _duration_child(self, route, method, status):
+        key = (route, method, status)
+        child = self._duration_children.get(key)
+        if child is None:
+            child = self._duration_children[key] = self.request_duration.labels(route, method, status)
+        return child
+
+    def _in_flight_child(self, route):
+        child = self._in_flight_children.get(route)
+        if child is None:
+            child = self._in_flight_children[route] = self.in_flight.labels(route)
+        return child
+
+    def _upstream_child(self, target, outcome):
+        key = (target, outcome)
+        child = self._upstream_children.get(key)
+        if child is None:
+            child = self._upstream_children[key] = self.upstream_duration.labels(target, outcome)
+        return child
+
+    def _admission_child(self, service):
+        children = self._admission_children.get(service)
+        if children is None:
+            children = self._admission_children[service] = (
+                self.ai_active.labels(service), self.ai_queue_depth.labels(service))
+        return children
+
+    def _queue_wait_child(self, service, outcome):
+        key = (service, outcome)
+        child = self._queue_wait_children.get(key)
+        if child is None:
+            child = self._queue_wait_children[key] = self.ai_queue_wait.labels(service, outcome)
+        return child
+
+    def _shed_child(self, service, outcome):
+        key = (service, outcome)
+        child = self._shed_children.get(key)
+        if child is None:
+            child = self._shed_children[key] = self.ai_shed.labels(service, outcome)
+        return child
+
+    def _hedge_child(self, service, outcome):
+        key = (service, outcome)
+        child = self._hedge_children.get(key)
+        if child is None:
+            child = self._hedge_children[key] = self.ai_hedge_duration.labels(service, outcome)
+        return child
+
+    def _cache_child(self, service, result):
+        key = (service, result)
+        child = self._cache_children.get(key)
+        if child is None:
+            child = self._cache_children[key] = self.ai_cache_lookups.labels(service, result)
+        return child
+
+    def _compression_child(self, route, encoding):
+        key = (route, encoding)
+        children = self._compression_children.get(key)
+        if children is None:
+            children = self._compression_children[key] = (
+                self.compression_bytes.labels(route, encoding, 'in'),
+                self.compression_bytes.labels(route, encoding, 'out'),
+                self.compression_cpu.labels(route, encoding))
+        return children
+
+    def prewarm(self, url_map):
+        """Create label children for every registered route up front."""
+        for rule in url_map.iter_rules():
+            self._in_flight_child(rule.rule)
+            for method in rule.methods - {'HEAD', 'OPTIONS'}:
+                for status in PREWARM_STATUSES:
+                    self._duration_child(rule.rule, method, status)
+
+    # ------------------------------------------------------------------
+    # Flask integration
+    # ------------------------------------------------------------------
+
+    def init_app(self, app):
+        from flask import g, request
+
+        def start_timer():
+            rule = request.url_rule
+            g._metrics_route = rule.rule if rule is not None else 'unmatched'
+            g._metrics_start = time.perf_counter()
+            self._in_flight_child(g._metrics_route).inc()
+
+        def record(response):
+            start = g.get('_metrics_start')
+            if start is not None:
+                self._duration_child(g._metrics_route, request.method, str(response.status_code)).observe(
+                    time.perf_counter() - start)
+            return response
+
+        def finish(exc):
+            route = g.pop('_metrics_route', None)
+            if route is not None:
+                self._in_flight_child(route).dec()
+
+        app.before_request(start_timer)
+        app.after_request(record)
+        app.teardown_request(finish)
+
+    def observe_upstream(self, target, outcome, seconds):
+        """Record one call to the backend; outcome is e.g. '2xx', '5xx' or 'error'."""
+        self._upstream_child(target, outcome).observe(seconds)
+
+    def set_admission_state(self, service, active, waiting):
+        """Publish a service gate's in-flight count and queue depth."""
+        active_child, queue_child = self._admission_child(service)
+        active_child.set(active)
+        queue_child.set(waiting)
+
+    def observe_admission(self, service, outcome, waited_seconds):
+        """Record queue wait; outcome is 'admitted', 'queue_full' or 'queue_timeout'."""
+        self._queue_wait_child(service, outcome).observe(waited_seconds)
+        if outcome != 'admitted':
+            self._shed_child(service, outcome).inc()
+
+    def observe_hedge(self, service, outcome, seconds):
+        """Record a hedging-enabled request; outcome is 'unhedged', 'primary', 'hedge' or 'failed'."""
+        self._hedge_child(service, outcome).observe(seconds)
+
+    def observe_cache(self, service, result):
+        """Count an /ai cache lookup; hit ratio is (hit + stale) / (hit + stale + miss)."""
+        self._cache_child(service, result).inc()
+
+    def set_log_queue_depth(self, depth):
+        self.log_queue_depth.set(depth)
+
+    def observe_log_commit(self, lags):
+        """Record enqueue-to-commit lag (seconds) for each record in a written batch."""
+        for lag in lags:
+            self.log_lag.observe(lag)
+
+    def observe_log_drop(self, reason, count=1):
+        self.log_dropped.labels(reason).inc(count)
+
+    def observe_compression(self, route, encoding, bytes_in, bytes_out, cpu_seconds):
+        """Record one compressed response: bytes saved vs. CPU spent."""
+        in_child, out_child, cpu_child = self._compression_child(route, encoding)
+        in_child.inc(bytes_in)
+        out_child.inc(bytes_out)
+        cpu_child.observe(cpu_seconds)
+
+    def exposition(self):
+        """Return (body, content_type) in Prometheus text exposition format."""
+        if MULTIPROCESS:
+            registry = CollectorRegistry()
+            multiprocess.MultiProcessCollector(registry)
+            return generate_latest(registry), CONTENT_TYPE_LATEST
+        return generate_latest(self.registry), CONTENT_TYPE_LATEST
+
+
+def mark_process_dead(pid):
+    """Clean up a dead worker's live gauges in multiprocess mode."""
+    if MULTIPROCESS:
+        multiprocess.mark_process_dead(pid)
@@ -0,0 +1,109 @@
+"""
+Response cache for the dashboard's /ai proxy
+Size-bounded LRU with a TTL and a stale-while-revalidate window, keyed by
+(service, normalized prompt, options), so repeated prompts skip the provider.
+"""
+import json
+import threading
+import time
+from collections import OrderedDict
+
+
+def normalize_prompt(prompt):
+    """Collapse runs of whitespace so trivially different prompts share an entry."""
+    return ' '.join(str(prompt or '').split())
+
+
+def cache_key(service, prompt, options=None):
+    """Build a hashable key; `options` are any other request fields that affect the answer."""
+    return (service, normalize_prompt(prompt), json.dumps(options or {}, sort_keys=True, default=str))
+
+
+class ResponseCache:
+    """
+    Thread-safe LRU + TTL cache of successful /ai responses.
+
+    An entry is fresh for `ttl` seconds and may then be served stale for
+    another `stale_ttl` seconds while a single background refresh runs
+    (`begin_refresh` / `end_refresh`). Older entries count as misses.
+    """
+
+    def __init__(self, max_entries=512, ttl=300.0, stale_ttl=60.0, metrics=None):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.metrics = metrics
+
+        self._entries = OrderedDict()
+        self._refreshing = set()
+        self._lock = threading.Lock()
+        self.stats = {}
+        self.evictions = 0
+
+    def configure(self, max_entries, ttl, stale_ttl):
+        """Apply new limits and drop all entries; call before serving traffic."""
+        with self._lock:
+            self.max_entries = max_entries
+            self.ttl = ttl
+            self.stale_ttl = stale_ttl
+            self._entries.clear()
+
+    def get(self, key):
+        """Return (payload, status_code, state); state is 'hit', 'stale' or 'miss'."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None, None, 'miss'
+            payload, status_code, stored_at = entry
+            age = now - stored_at
+            if age > self.ttl + self.stale_ttl:
+                del self._entries[key]
+                return None, None, 'miss'
+            self._entries.move_to_end(key)
+            return payload, status_code, 'hit' if age <= self.ttl else 'stale'
+
+    def put(self, key, payload, status_code=200):
+        with self._lock:
+            self._entries[key] = (payload, status_code, time.monotonic())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def begin_refresh(self, key):
+        """Claim the background refresh for a stale key; False if one is already running."""
+        with self._lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+            return True
+
+    def end_refresh(self, key):
+        with self._lock:
+            self._refreshing.discard(key)
+
+    def record(self, service, result):
+        """Count a lookup outcome: 'hit', 'stale', 'miss' or 'bypass'."""
+        with self._lock:
+            counts = self.stats.setdefault(service, {'hit': 0, 'stale': 0, 'miss': 0, 'bypass': 0})
+            counts[result] += 1
+        if self.metrics is not None:
+            self.metrics.observe_cache(service, result)
+
+    def snapshot(self):
+        with self._lock:
+            services = {}
+            for service, counts in self.stats.items():
+                lookups = counts['hit'] + counts['stale'] + counts['miss']
+                services[service] = dict(counts, hit_ratio=round(
+                    (counts['hit'] + counts['stale']) / lookups, 4) if lookups else 0)
+            return {
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'ttl_sec': self.ttl,
+                'stale_ttl_sec': self.stale_ttl,
+                'evictions': self.evictions,
+                'refreshing': len(self._refreshing),
+                'services': services,
+            }
@@ -0,0 +1,22 @@
+"""
+Small statistics helpers shared by the AI Resilience Monitor backend modules
+"""
+import math
+
+
+def percentile(sorted_values, q):
+    """
+    Nearest-rank percentile of an already sorted list (q in 0..100).
+
+    >>> values = list(range(1, 101))
+    >>> percentile(values, 50), percentile(values, 95), percentile(values, 99), percentile(values, 100)
+    (50, 95, 99, 100)
+    >>> percentile([1, 2], 50), percentile(list(range(1, 11)), 50), percentile([7], 0)
+    (1, 5, 7)
+    >>> percentile([], 50) is None
+    True
+    """
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, max(0, math.ceil(q / 100.0 * len(sorted_values)) - 1))
+    return sorted_values[index]
@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+AI Resilience Monitor - Circuit Breaker Sampler
+Polls /circuit-breaker/status on a background thread at a fixed cadence and
+keeps a timestamped timeline of every breaker state transition.
+
+Transitions are taken from the breaker's own stateHistory when the backend
+reports it, so OPEN -> HALF_OPEN -> CLOSED sequences that complete between two
+polls keep their real timestamps. Any state change the history doesn't
+explain (a manual reset, or more transitions than the history holds) is
+recorded at the time of the poll that noticed it.
+"""
+
+import bisect
+import threading
+import time
+
+import requests
+
+
+class CircuitBreakerSampler:
+    """
+    Shared circuit breaker timeline for all services.
+
+    Times are epoch seconds. Each transition is a dict:
+        {'time', 'service', 'from', 'to', 'source'}  (source: 'backend' or 'sample')
+    `on_transition` is called from the sampler thread for every new transition.
+    """
+
+    def __init__(self, base_url, services, interval=0.25, timeout=2, on_transition=None):
+        self.base_url = base_url
+        self.services = list(services)
+        self.interval = interval
+        self.timeout = timeout
+        self.on_transition = on_transition
+
+        self.samples = 0
+        self.errors = 0
+        self.last_sample_at = None
+
+        self._lock = threading.Lock()
+        self._poll_lock = threading.Lock()
+        self._timeline = []
+        self._initial = {}          # service -> (time, state) of the first reading
+        self._states = {}           # service -> current state
+        self._readings = {}         # service -> last raw status entry
+        self._history_seen = {}     # service -> (timestamp, from, to) of stateHistory entries consumed
+
+        self._session = requests.Session()
+        self._stop = threading.Event()
+        self._thread = None
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def start(self):
+        """Take a first reading, then keep polling in the background."""
+        if self._thread is not None:
+            return self
+        self.sample()
+        self._thread = threading.Thread(target=self._run, name='breaker-sampler', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.timeout + self.interval + 1)
+            self._thread = None
+        self._session.close()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.sample()
+
+    # ------------------------------------------------------------------
+    # Sampling
+    # ------------------------------------------------------------------
+
+    def sample(self):
+        """
+        Poll the backend once and extend the timeline. Returns False if the poll failed.
+        Safe to call from other threads when a reading is needed right away.
+        """
+        # One poll at a time, so an older response is never applied after a newer one
+        with self._poll_lock:
+            return self._sample()
+
+    def _sample(self):
+        try:
+            response = self._session.get(f"{self.base_url}/circuit-breaker/status", timeout=self.timeout)
+            status = response.json() if response.status_code == 200 else None
+        except (requests.exceptions.RequestException, ValueError):
+            status = None
+        now = time.time()
+        if not isinstance(status, dict):
+            with self._lock:
+                self.errors += 1
+            return False
+
+        new_transitions = []
+        with self._lock:
+            self.samples += 1
+            self.last_sample_at = now
+            for service in self.services:
+                reading = status.get(service)
+                if not isinstance(reading, dict) or reading.get('state') is None:
+                    continue
+                self._readings[service] = reading
+                new_transitions.extend(self._update(service, reading, now))
+
+        if self.on_transition is not None:
+            for transition in new_transitions:
+                self.on_transition(transition)
+        return True
+
+    def _update(self, service, reading, now):
+        state = reading['state']
+        history = sorted((entry for entry in reading.get('stateHistory') or []
+                          if isinstance(entry, dict) and entry.get('timestamp') is not None),
+                         key=lambda entry: entry['timestamp'])
+
+        if service not in self._states:
+            # History from before we started watching is not part of this run
+            self._initial[service] = (now, state)
+            self._states[service] = state
+            self._history_seen[service] = {self._history_key(entry) for entry in history}
+            return []
+
+        # Keyed on more than the timestamp: several transitions can share a millisecond
+        seen = self._history_seen[service]
+        added = []
+        for entry in history:
+            if self._history_key(entry) in seen:
+                continue
+            at = entry['timestamp'] / 1000
+            added.append(self._add(min(at, now), service, entry.get('from'), entry.get('to'), 'backend'))
+            self._states[service] = entry.get('to')
+        # The backend's history is bounded; forget entries it no longer returns
+        self._history_seen[service] = {self._history_key(entry) for entry in history}
+
+        if self._states[service] != state:
+            added.append(self._add(now, service, self._states[service], state, 'sample'))
+            self._states[service] = state
+        return added
+
+    @staticmethod
+    def _history_key(entry):
+        return entry['timestamp'], entry.get('from'), entry.get('to')
+
+    def _add(self, at, service, from_state, to_state, source):
+        transition = {'time': at, 'service': service, 'from': from_state, 'to': to_state, 'source': source}
+        # Backend timestamps can land slightly before the last poll; keep the timeline ordered
+        index = bisect.bisect_right([t['time'] for t in self._timeline], at)
+        self._timeline.insert(index, transition)
+        return transition
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def state(self, service):
+        """Most recently sampled state, or 'UNKNOWN' before the first reading."""
+        with self._lock:
+            return self._states.get(service, 'UNKNOWN')
+
+    def reading(self, service):
+        """Last raw /circuit-breaker/status entry for `service` ({} if none)."""
+        with self._lock:
+            return dict(self._readings.get(service, {}))
+
+    def transitions(self, service=None, since=None, until=None):
+        with self._lock:
+            return [dict(t) for t in self._timeline
+                    if (service is None or t['service'] == service)
+                    and (since is None or t['time'] >= since)
+                    and (until is None or t['time'] <= until)]
+
+    def state_at(self, service, at):
+        """Breaker state at time `at` according to the timeline."""
+        with self._lock:
+            if service not in self._initial:
+                return 'UNKNOWN'
+            state = self._initial[service][1]
+            for t in self._timeline:
+                if t['time'] > at:
+                    break
+                if t['service'] == service:
+                    state = t['to']
+            return state
+
+    def trips(self, service, since=None, until=None):
+        """Number of times the breaker opened (from CLOSED or HALF_OPEN) in the window."""
+        return sum(1 for t in self.transitions(service, since, until) if t['to'] == 'OPEN')
+
+    def recovered_at(self, service, since, until=None):
+        """
+        When the breaker last became CLOSED after `since`, provided it is still
+        CLOSED at `until` (default: now). Returns `since` if it never left
+        CLOSED, or None if it is not CLOSED at the end of the window.
+        """
+        end = until if until is not None else time.time()
+        if self.state_at(service, end) != 'CLOSED':
+            return None
+        closings = [t['time'] for t in self.transitions(service, since, end) if t['to'] == 'CLOSED']
+        return closings[-1] if closings else since
@@ -16,9 +16,17 @@ from datetime import datetime, timedelta
 from pathlib import Path
 import argparse
 import signal
+import threading
 from typing import Dict, List, Any
 import random
 
+from breaker_sampler import CircuitBreakerSampler
+from csv_writer import CsvWriterThread
+from distributed_load import DEFAULT_AUTHKEY, WorkerPool, parse_address, run_worker
+from latency_histogram import LatencyHistogram, LatencyRecorder, PERCENTILES, percentile_label
+from load_engine import LoadEngine, RequestMix
+import mock_backend
+
 # Force UTF-8 encoding for Windows console
 if sys.platform == 'win32':
     import io
@@ -70,10 +78,22 @@ TEST_PROMPTS = [
     "What is the Internet of Things?"
 ]
 
+# Short prompt for recovery probes after chaos stops
+RECOVERY_PROBE_PROMPT = "ping"
+
+# Capacity search multiplies the offered rate by this much per ramp step
+CAPACITY_RAMP_FACTOR = 2
+
 class ChaosTestRunner:
     def __init__(self, duration_hours=24, requests_per_cycle=10, 
                  chaos_duration=300, normal_duration=180,
-                 output_dir="chaos-test-results"):
+                 output_dir="chaos-test-results", concurrency=1,
+                 max_in_flight=1000, quiet=False, rate=None, arrival='uniform',
+                 fsync='never', log_flush_interval=1.0, parallel_services=False,
+                 breaker_sample_interval=0.25, recovery_successes=3, recovery_probe_interval=1.0,
+                 workers=0, remote_workers=0, worker_listen=None, worker_authkey=DEFAULT_AUTHKEY,
+                 slo_p99_ms=2000, slo_error_rate=1.0, capacity_step_duration=30,
+                 capacity_start_rate=1.0, capacity_max_rate=1000.0, capacity_tolerance=0.05):
         self.duration_hours = duration_hours
         self.requests_per_cycle = requests_per_cycle
         self.chaos_duration = chaos_duration  # seconds
@@ -85,12 +105,53 @@ class ChaosTestRunner:
         self.min_request_delay = 2  # Minimum 2 seconds between requests
         self.request_timeout = 30  # Timeout for AI requests
         
+        # Virtual users per scenario; each follows the scenario's pacing
+        self.concurrency = max(1, concurrency)
+        # Open-loop arrival rate (requests/second); replaces the virtual users when set
+        self.rate = rate
+        self.arrival = arrival
+        self.engine = LoadEngine(BACKEND_URL, timeout=self.request_timeout,
+                                 max_in_flight=max_in_flight, verbose=not quiet).start()
+        
+        # Controller mode: scenario load is generated by worker processes and streamed back
+        self.workers = None
+        if workers or remote_workers:
+            self.workers = WorkerPool(self.engine, BACKEND_URL, local_workers=workers,
+                                      remote_workers=remote_workers,
+                                      listen=worker_listen or ('127.0.0.1', 0),
+                                      authkey=worker_authkey, timeout=self.request_timeout,
+                                      max_in_flight=max_in_flight,
+                                      log=lambda message: self.log(message, level='INFO'))
+        
+        # Recovery ends after this many consecutive probe successes with the breaker CLOSED
+        # (at most normal_duration seconds after chaos stops)
+        self.recovery_successes = max(1, recovery_successes)
+        self.recovery_probe_interval = recovery_probe_interval
+        
+        # Run experiments on different services at the same time
+        self.parallel_services = parallel_services
+        self._results_lock = threading.Lock()
+        
+        # Capacity search: highest open-loop rate that keeps p99 and error rate (%) within the SLO
+        self.slo_p99_ms = slo_p99_ms
+        self.slo_error_rate = slo_error_rate
+        self.capacity_step_duration = capacity_step_duration
+        self.capacity_start_rate = capacity_start_rate
+        self.capacity_max_rate = capacity_max_rate
+        self.capacity_tolerance = capacity_tolerance
+        self.capacity_log = None
+        self.capacity_results = []
+        
         # Statistics
         self.total_requests = 0
         self.total_chaos_experiments = 0
         self.experiment_results = []
         self.service_performance = {service: [] for service in SERVICES}
         
+        # CSV logs are written in batches by one writer thread per file
+        self.fsync = fsync
+        self.log_flush_interval = log_flush_interval
+        
         # Create output directory
         self.output_dir.mkdir(exist_ok=True)
         
@@ -100,6 +161,10 @@ class ChaosTestRunner:
         
         # Initialize CSV files
         self.init_csv_files()
+        
+        # Circuit breaker states come from one background poller, not a status call per request
+        self.breaker_sampler = CircuitBreakerSampler(BACKEND_URL, SERVICES, interval=breaker_sample_interval,
+                                                     on_transition=self.record_breaker_transition).start()
     
     def signal_handler(self, signum, frame):
         """Handle shutdown gracefully"""
@@ -112,27 +177,33 @@ class ChaosTestRunner:
     def init_csv_files(self):
         """Initialize CSV files for data collection"""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self.log_timestamp = timestamp
         
         # Experiment log
         self.experiment_log_file = self.output_dir / f"experiment_log_{timestamp}.csv"
-        with open(self.experiment_log_file, 'w', newline='') as f:
-            writer = csv.writer(f)
-            writer.writerow([
-                'Timestamp', 'Experiment_ID', 'Chaos_Type', 'Intensity', 
-                'Service', 'Duration_Sec', 'Total_Requests', 'Successful_Requests',
-                'Failed_Requests', 'Avg_Latency_Ms', 'Min_Latency_Ms', 'Max_Latency_Ms',
-                'Success_Rate_%', 'Circuit_Breaker_Trips', 'Recovery_Time_Sec'
-            ])
+        self.experiment_log = CsvWriterThread(self.experiment_log_file, header=[
+            'Timestamp', 'Experiment_ID', 'Chaos_Type', 'Intensity', 
+            'Service', 'Duration_Sec', 'Total_Requests', 'Successful_Requests',
+            'Failed_Requests', 'Avg_Latency_Ms', 'Min_Latency_Ms', 'Max_Latency_Ms',
+            'Success_Rate_%', 'Circuit_Breaker_Trips', 'Recovery_Time_Sec'
+        ] + [f'{outcome}_{percentile_label(p).upper()}_Ms'
+             for outcome in ('Success', 'Failure') for p in PERCENTILES] + ['Attribution_Errors', 'Recovered'],
+            flush_interval=self.log_flush_interval, fsync=self.fsync)
         
         # Request log
         self.request_log_file = self.output_dir / f"request_log_{timestamp}.csv"
-        with open(self.request_log_file, 'w', newline='') as f:
-            writer = csv.writer(f)
-            writer.writerow([
-                'Timestamp', 'Experiment_ID', 'Service', 'Chaos_Type', 
-                'Chaos_Active', 'Success', 'Latency_Ms', 'Error_Type',
-                'Circuit_Breaker_State', 'Response_Size'
-            ])
+        self.request_log = CsvWriterThread(self.request_log_file, header=[
+            'Timestamp', 'Experiment_ID', 'Service', 'Chaos_Type', 
+            'Chaos_Active', 'Success', 'Latency_Ms', 'Error_Type',
+            'Circuit_Breaker_State', 'Response_Size',
+            'Intended_Send_Time', 'Actual_Send_Time', 'Send_Lag_Ms'
+        ], flush_interval=self.log_flush_interval, fsync=self.fsync)
+        
+        # Circuit breaker timeline
+        self.breaker_timeline_file = self.output_dir / f"breaker_timeline_{timestamp}.csv"
+        self.breaker_timeline = CsvWriterThread(self.breaker_timeline_file, header=[
+            'Timestamp', 'Service', 'From_State', 'To_State', 'Source'
+        ], flush_interval=self.log_flush_interval, fsync=self.fsync)
         
         # Service comparison log
         self.service_comparison_file = self.output_dir / f"service_comparison_{timestamp}.csv"
@@ -221,56 +292,77 @@ class ChaosTestRunner:
             self.log(f"Error stopping chaos: {e}", level='ERROR')
             return False
     
+    def close(self):
+        """Stop sampling and load workers, write out queued log rows and release the load engine"""
+        self.breaker_sampler.stop()
+        if self.workers:
+            self.workers.close()
+        self.request_log.close()
+        self.experiment_log.close()
+        self.breaker_timeline.close()
+        if self.capacity_log:
+            self.capacity_log.close()
+        self.engine.close()
+    
     def send_ai_request(self, service, prompt):
         """Send request to AI service via backend"""
-        try:
-            start_time = time.time()
-            
-            payload = {
-                'service': service,
-                'prompt': prompt
-            }
-            
-            # Log the request
-            print(f"🔵 Request #{self.total_requests + 1} → {service.upper()} | Prompt: '{prompt[:50]}...'", flush=True)
-            
-            response = requests.post(f"{BACKEND_URL}/ai", json=payload, timeout=self.request_timeout)
-            
-            latency = int((time.time() - start_time) * 1000)  # milliseconds
-            
-            success = response.status_code == 200
-            error_type = None if success else response.json().get('error', 'Unknown')
-            
-            # Log the result
-            if success:
-                print(f"✅ SUCCESS | {service.upper()} | Latency: {latency}ms | Response: {len(response.content)} bytes", flush=True)
-            else:
-                print(f"❌ FAILED | {service.upper()} | Latency: {latency}ms | Error: {error_type}", flush=True)
-            
-            return {
-                'success': success,
-                'latency': latency,
-                'error_type': error_type,
-                'response_size': len(response.content) if success else 0
-            }
-            
-        except requests.exceptions.Timeout:
-            latency = self.request_timeout * 1000  # timeout value in ms
-            print(f"⏱️ TIMEOUT | {service.upper()} | Request exceeded {self.request_timeout}s", flush=True)
-            return {
-                'success': False,
-                'latency': latency,
-                'error_type': 'Timeout',
-                'response_size': 0
-            }
-        except Exception as e:
-            print(f"❌ EXCEPTION | {service.upper()} | Error: {str(e)}", flush=True)
-            return {
-                'success': False,
-                'latency': 0,
-                'error_type': str(e),
-                'response_size': 0
-            }
+        return self.engine.run(self.engine.send_ai_request(service, prompt))
+    
+    def append_request_log(self, row, result):
+        """Queue one row for the request log CSV, followed by the result's send timing"""
+        self.request_log.writerow(row + [
+            datetime.fromtimestamp(result['intended_send']).isoformat(),
+            datetime.fromtimestamp(result['actual_send']).isoformat(),
+            result['send_lag_ms']
+        ])
+    
+    def drive_load(self, duration, next_request, on_result, think_time=0, rate=None):
+        """
+        Run a scenario's requests for `duration` seconds. With --rate (or `rate`),
+        requests arrive on an open-loop schedule regardless of response time;
+        otherwise --concurrency virtual users each wait think_time after every
+        response. With load workers, the same load is split across them instead.
+        """
+        rate = rate or self.rate
+        if self.workers:
+            self.workers.run_load(
+                duration, next_request, on_result,
+                rate=rate,
+                arrival=self.arrival,
+                users=self.concurrency,
+                think_time=think_time,
+                should_continue=lambda: self.running
+            )
+            return
+        if rate:
+            load = self.engine.open_loop(
+                duration, rate, next_request, on_result,
+                arrival=self.arrival,
+                should_continue=lambda: self.running
+            )
+        else:
+            load = self.engine.closed_loop(
+                duration, next_request, on_result,
+                think_time=think_time,
+                users=self.concurrency,
+                should_continue=lambda: self.running
+            )
+        self.engine.run(load)
+    
+    def record_breaker_transition(self, transition):
+        """Log a circuit breaker transition seen by the sampler and add it to the timeline CSV"""
+        service = transition['service']
+        if transition['to'] == 'OPEN':
+            self.log(f"⚡ Circuit breaker OPENED for {service.upper()}", level='WARNING')
+        else:
+            self.log(f"🔄 Circuit breaker {service.upper()}: {transition['from']} → {transition['to']}", level='INFO')
+        self.breaker_timeline.writerow([
+            datetime.fromtimestamp(transition['time']).isoformat(),
+            service,
+            transition['from'],
+            transition['to'],
+            transition['source']
+        ])
     
     def get_circuit_breaker_status(self):
         """Get circuit breaker status for all services"""
@@ -282,6 +374,24 @@ class ChaosTestRunner:
         except:
             return {}
     
+    def check_chaos_attribution(self, service, chaos_type):
+        """
+        Confirm /chaos/status shows `chaos_type` active on `service`, so results
+        aren't credited to the wrong experiment when several run at once.
+        Returns the number of mismatches found (0 or 1).
+        """
+        try:
+            response = requests.get(f"{BACKEND_URL}/chaos/status", timeout=5)
+            active = {e['service']: e['type'] for e in response.json().get('active', [])}
+        except Exception as e:
+            self.log(f"⚠️  Could not read chaos status for {service.upper()}: {e}", level='WARNING')
+            return 0
+        if active.get(service) != chaos_type:
+            self.log(f"⚠️  Attribution check: expected {chaos_type.upper()} on {service.upper()}, "
+                     f"backend reports {active.get(service, 'none')}", level='WARNING')
+            return 1
+        return 0
+    
     def run_experiment(self, experiment_id, chaos_type, intensity, service):
         """Run a single chaos experiment"""
         try:
@@ -302,39 +412,52 @@ class ChaosTestRunner:
             
             print(f"✅ Chaos injected successfully! Starting requests...\n", flush=True)
             
-            self.total_chaos_experiments += 1
+            with self._results_lock:
+                self.total_chaos_experiments += 1
             experiment_start = time.time()
             
             # Collect data during chaos
             requests_data = []
-            circuit_breaker_trips = 0
-            previous_cb_state = None
+            attribution_errors = self.check_chaos_attribution(service, chaos_type)
             
             # Run requests during chaos period
-            chaos_end_time = time.time() + self.chaos_duration
             request_count = 0
             
             print(f"📊 Running requests under chaos conditions...", flush=True)
             print(f"", flush=True)
             
-            while time.time() < chaos_end_time and self.running:
-                prompt = random.choice(TEST_PROMPTS)
+            # Target: requests_per_cycle requests over chaos_duration seconds (per virtual user)
+            target_delay = max(self.min_request_delay, self.chaos_duration / self.requests_per_cycle)
+            
+            # Latency from each request's intended send time; closed-loop users are
+            # also corrected for the requests a slow response held back
+            latency = LatencyRecorder(expected_interval_ms=None if self.rate else target_delay * 1000)
+            
+            def pace(user_request_count):
+                # Calculate dynamic delay based on actual request time and target rate
+                actual_request_time = time.time() - experiment_start
+                expected_time = user_request_count * target_delay
                 
-                # Send request
-                result = self.send_ai_request(service, prompt)
-                self.total_requests += 1
-                request_count += 1
+                # Adjust delay to stay on track
+                if actual_request_time < expected_time:
+                    return min(expected_time - actual_request_time, target_delay)
+                # We're behind schedule, use minimum delay
+                return self.min_request_delay
+            
+            def record(requested_service, result):
+                nonlocal request_count, attribution_errors
                 
-                # Get circuit breaker status
-                cb_status = self.get_circuit_breaker_status()
-                current_cb_state = cb_status.get(service, {}).get('state', 'UNKNOWN')
+                # Latest sampled circuit breaker state
+                cb_reading = self.breaker_sampler.reading(service)
+                current_cb_state = cb_reading.get('state', 'UNKNOWN')
                 
-                # Detect circuit breaker trips
-                if previous_cb_state == 'CLOSED' and current_cb_state == 'OPEN':
-                    circuit_breaker_trips += 1
-                    self.log(f"⚡ Circuit breaker OPENED for {service.upper()}", level='WARNING')
+                self.total_requests += 1
+                request_count += 1
+                latency.record(result)
                 
-                previous_cb_state = current_cb_state
+                # The reply and the breaker reading must both belong to this experiment's service
+                if result['served_by'] not in (None, service) or cb_reading.get('name', service).lower() != service:
+                    attribution_errors += 1
                 
                 # Log request
                 request_data = {
@@ -353,20 +476,18 @@ class ChaosTestRunner:
                 requests_data.append(request_data)
                 
                 # Write to CSV
-                with open(self.request_log_file, 'a', newline='') as f:
-                    writer = csv.writer(f)
-                    writer.writerow([
-                        request_data['timestamp'],
-                        request_data['experiment_id'],
-                        request_data['service'],
-                        request_data['chaos_type'],
-                        request_data['chaos_active'],
-                        request_data['success'],
-                        request_data['latency'],
-                        request_data['error_type'],
-                        request_data['circuit_breaker_state'],
-                        request_data['response_size']
-                    ])
+                self.append_request_log([
+                    request_data['timestamp'],
+                    request_data['experiment_id'],
+                    request_data['service'],
+                    request_data['chaos_type'],
+                    request_data['chaos_active'],
+                    request_data['success'],
+                    request_data['latency'],
+                    request_data['error_type'],
+                    request_data['circuit_breaker_state'],
+                    request_data['response_size']
+                ], result)
                 
                 # Status update
                 if request_count % 5 == 0:
@@ -374,39 +495,33 @@ class ChaosTestRunner:
                     success_rate = (success_count / len(requests_data)) * 100
                     self.log(f"   Progress: {request_count} requests, "
                             f"{success_rate:.1f}% success rate", level='INFO')
-                
-                # Calculate dynamic delay based on actual request time and target rate
-                # Target: requests_per_cycle requests over chaos_duration seconds
-                target_delay = max(self.min_request_delay, self.chaos_duration / self.requests_per_cycle)
-                actual_request_time = time.time() - experiment_start
-                expected_time = request_count * target_delay
-                
-                # Adjust delay to stay on track
-                if actual_request_time < expected_time:
-                    delay = expected_time - actual_request_time
-                    time.sleep(min(delay, target_delay))
-                else:
-                    # We're behind schedule, use minimum delay
-                    time.sleep(self.min_request_delay)
+            
+            self.drive_load(
+                self.chaos_duration,
+                RequestMix([service], TEST_PROMPTS),
+                record,
+                # Workers only take a fixed think time; pace() needs this process's clock
+                think_time=target_delay if self.workers else pace
+            )
             
             # Stop chaos
             self.stop_chaos(service)
+            chaos_end = time.time()
             print(f"🛑 Chaos stopped. Monitoring recovery...\n", flush=True)
             
-            # Wait for recovery
-            print(f"⏳ Recovery Period: Waiting {self.normal_duration}s for service to stabilize...", flush=True)
-            recovery_start = time.time()
-            
-            # Monitor recovery
-            recovery_checks = 0
-            while time.time() < recovery_start + self.normal_duration and self.running:
-                time.sleep(5)
-                recovery_checks += 1
-                remaining = int((recovery_start + self.normal_duration) - time.time())
-                print(f"   Recovery check #{recovery_checks} | {remaining}s remaining", flush=True)
+            # Trips come from the sampled breaker timeline, including ones between requests
+            circuit_breaker_trips = self.breaker_sampler.trips(service, experiment_start, chaos_end)
             
-            recovery_time = time.time() - recovery_start
-            print(f"✅ Recovery period complete!\n", flush=True)
+            # Probe until the service has recovered
+            print(f"⏳ Recovery Period: probing every {self.recovery_probe_interval:g}s until "
+                  f"{self.recovery_successes} consecutive successes with the breaker CLOSED "
+                  f"(max {self.normal_duration}s)...", flush=True)
+            recovery_time, recovered, probes = self.measure_recovery(experiment_id, chaos_type, service, chaos_end)
+            if recovered:
+                print(f"✅ Recovered after {recovery_time:.1f}s ({probes} probes)\n", flush=True)
+            else:
+                print(f"⚠️  Not recovered within {self.normal_duration}s, circuit breaker "
+                      f"{self.breaker_sampler.state(service)} ({probes} probes)\n", flush=True)
             
             # Calculate statistics
             successful_requests = sum(1 for r in requests_data if r['success'])
@@ -434,46 +549,55 @@ class ChaosTestRunner:
                 'max_latency': max_latency,
                 'success_rate': success_rate,
                 'circuit_breaker_trips': circuit_breaker_trips,
-                'recovery_time': recovery_time
+                'recovery_time': recovery_time,
+                'latency_success': latency.success.summary(),
+                'latency_failure': latency.failure.summary(),
+                'latency_histograms': latency,
+                'attribution_errors': attribution_errors,
+                'recovered': recovered
             }
             
-            self.experiment_results.append(experiment_result)
-            
             # Write to experiment log
-            with open(self.experiment_log_file, 'a', newline='') as f:
-                writer = csv.writer(f)
-                writer.writerow([
-                    experiment_result['timestamp'],
-                    experiment_result['experiment_id'],
-                    experiment_result['chaos_type'],
-                    experiment_result['intensity'],
-                    experiment_result['service'],
-                    experiment_result['duration'],
-                    experiment_result['total_requests'],
-                    experiment_result['successful_requests'],
-                    experiment_result['failed_requests'],
-                    f"{experiment_result['avg_latency']:.2f}",
-                    experiment_result['min_latency'],
-                    experiment_result['max_latency'],
-                    f"{experiment_result['success_rate']:.2f}",
-                    experiment_result['circuit_breaker_trips'],
-                    f"{experiment_result['recovery_time']:.2f}"
-                ])
-            
-            # Print detailed summary
-            print(f"\n{'='*70}", flush=True)
-            print(f"📊 EXPERIMENT #{experiment_id} RESULTS", flush=True)
-            print(f"{'='*70}", flush=True)
-            print(f"   📝 Service: {service.upper()}", flush=True)
-            print(f"   🔥 Chaos: {chaos_type.upper()} @ {intensity}", flush=True)
-            print(f"   📈 Total Requests: {len(requests_data)}", flush=True)
-            print(f"   ✅ Successful: {successful_requests} ({success_rate:.1f}%)", flush=True)
-            print(f"   ❌ Failed: {failed_requests} ({100-success_rate:.1f}%)", flush=True)
-            print(f"   ⚡ Avg Latency: {avg_latency:.0f}ms", flush=True)
-            print(f"   📊 Latency Range: {min_latency}ms - {max_latency}ms", flush=True)
-            print(f"   🔌 Circuit Breaker Trips: {circuit_breaker_trips}", flush=True)
-            self.log(f"   Recovery Time: {recovery_time:.1f}s", level='INFO')
-            self.log(f"{'='*60}\n", level='INFO')
+            self.experiment_log.writerow([
+                experiment_result['timestamp'],
+                experiment_result['experiment_id'],
+                experiment_result['chaos_type'],
+                experiment_result['intensity'],
+                experiment_result['service'],
+                experiment_result['duration'],
+                experiment_result['total_requests'],
+                experiment_result['successful_requests'],
+                experiment_result['failed_requests'],
+                f"{experiment_result['avg_latency']:.2f}",
+                experiment_result['min_latency'],
+                experiment_result['max_latency'],
+                f"{experiment_result['success_rate']:.2f}",
+                experiment_result['circuit_breaker_trips'],
+                f"{experiment_result['recovery_time']:.2f}"
+            ] + [experiment_result[f'latency_{outcome}'][percentile_label(p)]
+                 for outcome in ('success', 'failure') for p in PERCENTILES] + [attribution_errors, recovered])
+            
+            # Print detailed summary (in one piece when experiments run in parallel)
+            with self._results_lock:
+                self.experiment_results.append(experiment_result)
+                
+                print(f"\n{'='*70}", flush=True)
+                print(f"📊 EXPERIMENT #{experiment_id} RESULTS", flush=True)
+                print(f"{'='*70}", flush=True)
+                print(f"   📝 Service: {service.upper()}", flush=True)
+                print(f"   🔥 Chaos: {chaos_type.upper()} @ {intensity}", flush=True)
+                print(f"   📈 Total Requests: {len(requests_data)}", flush=True)
+                print(f"   ✅ Successful: {successful_requests} ({success_rate:.1f}%)", flush=True)
+                print(f"   ❌ Failed: {failed_requests} ({100-success_rate:.1f}%)", flush=True)
+                print(f"   ⚡ Avg Latency: {avg_latency:.0f}ms", flush=True)
+                print(f"   📊 Latency Range: {min_latency}ms - {max_latency}ms", flush=True)
+                print(f"   📐 Success Latency: {self.format_percentiles(experiment_result['latency_success'])}", flush=True)
+                print(f"   📐 Failure Latency: {self.format_percentiles(experiment_result['latency_failure'])}", flush=True)
+                print(f"   🔌 Circuit Breaker Trips: {circuit_breaker_trips}", flush=True)
+                if attribution_errors:
+                    print(f"   ⚠️  Attribution Errors: {attribution_errors}", flush=True)
+                self.log(f"   Recovery Time: {recovery_time:.1f}s{'' if recovered else ' (not recovered)'}", level='INFO')
+                self.log(f"{'='*60}\n", level='INFO')
             
         except KeyboardInterrupt:
             print("\n⚠️  Experiment interrupted by user", flush=True)
@@ -486,6 +610,84 @@ class ChaosTestRunner:
             self.stop_chaos(service)
             # Don't raise - continue with next experiment
     
+    def measure_recovery(self, experiment_id, chaos_type, service, chaos_end):
+        """
+        Probe `service` after chaos stops until recovery_successes consecutive
+        probes succeed and its circuit breaker is CLOSED, or normal_duration
+        runs out. Returns (recovery_time, recovered, probes); recovery_time is
+        measured from chaos_end to the moment both conditions held.
+        """
+        deadline = chaos_end + self.normal_duration
+        next_probe = time.time()
+        streak = 0
+        streak_complete_at = None
+        probes = 0
+        
+        async def probe():
+            result = await self.engine.send_ai_request(service, RECOVERY_PROBE_PROMPT)
+            self.total_requests += 1
+            return result
+        
+        while self.running and time.time() < deadline:
+            result = self.engine.run(probe())
+            probes += 1
+            
+            if result['success']:
+                streak += 1
+                if streak == self.recovery_successes:
+                    streak_complete_at = time.time()
+            else:
+                streak = 0
+                streak_complete_at = None
+            
+            breaker_state = self.breaker_sampler.state(service)
+            self.append_request_log([
+                datetime.now().isoformat(),
+                experiment_id,
+                service,
+                chaos_type,
+                False,
+                result['success'],
+                result['latency'],
+                result['error_type'],
+                breaker_state,
+                result['response_size']
+            ], result)
+            print(f"   Recovery probe #{probes} | {'✅' if result['success'] else '❌'} | "
+                  f"streak {streak}/{self.recovery_successes} | breaker {breaker_state}", flush=True)
+            
+            if streak >= self.recovery_successes:
+                if breaker_state != 'CLOSED':
+                    # Don't wait for the next poll to see the breaker close
+                    self.breaker_sampler.sample()
+                closed_at = self.breaker_sampler.recovered_at(service, chaos_end)
+                if closed_at is not None:
+                    return max(streak_complete_at, closed_at) - chaos_end, True, probes
+            
+            next_probe += self.recovery_probe_interval
+            time.sleep(max(0, min(next_probe, deadline) - time.time()))
+        
+        return time.time() - chaos_end, False, probes
+    
+    def run_parallel_experiments(self, experiments):
+        """Run (experiment_id, chaos_type, intensity, service) experiments on different services at once"""
+        services = [service for _, _, _, service in experiments]
+        if len(set(services)) != len(services):
+            raise ValueError("Parallel experiments must each target a different service")
+        
+        self.log(f"\n🧪 Running {len(experiments)} experiments in parallel: "
+                 f"{', '.join(service.upper() for service in services)}", level='INFO')
+        
+        threads = [threading.Thread(target=self.run_experiment, args=experiment,
+                                    name=f"experiment-{experiment[0]}", daemon=True)
+                   for experiment in experiments]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            # Join in short steps so Ctrl+C still reaches the signal handler
+            while thread.is_alive():
+                thread.join(timeout=1)
+    
     def run_load_test_normal(self, duration=300):
         """Test Scenario 1: Normal Load - 1 request every 5 seconds"""
         print(f"\n{'='*70}", flush=True)
@@ -500,32 +702,32 @@ class ChaosTestRunner:
         end_time = time.time() + duration
         request_count = 0
         
-        while time.time() < end_time and self.running:
-            service = random.choice(SERVICES)
-            prompt = random.choice(TEST_PROMPTS)
-            
-            print(f"[Normal Load] Request {request_count + 1} in {int(end_time - time.time())}s remaining...", flush=True)
-            result = self.send_ai_request(service, prompt)
+        def record(service, result):
+            nonlocal request_count
             self.total_requests += 1
             request_count += 1
             
             # Log request
-            with open(self.request_log_file, 'a', newline='') as f:
-                writer = csv.writer(f)
-                writer.writerow([
-                    datetime.now().isoformat(),
-                    'LOAD_NORMAL',
-                    service,
-                    'NONE',
-                    False,
-                    result['success'],
-                    result['latency'],
-                    result['error_type'],
-                    'UNKNOWN',
-                    result['response_size']
-                ])
-            
-            time.sleep(5)  # 1 request every 5 seconds
+            self.append_request_log([
+                datetime.now().isoformat(),
+                'LOAD_NORMAL',
+                service,
+                'NONE',
+                False,
+                result['success'],
+                result['latency'],
+                result['error_type'],
+                'UNKNOWN',
+                result['response_size']
+            ], result)
+            print(f"[Normal Load] Request {request_count} done, {max(0, int(end_time - time.time()))}s remaining...", flush=True)
+        
+        self.drive_load(
+            duration,
+            RequestMix(SERVICES, TEST_PROMPTS),
+            record,
+            think_time=5,  # 1 request every 5 seconds
+        )
         
         print(f"\n✅ Normal load test COMPLETE | Requests: {request_count} | Time: {duration}s\n", flush=True)
     
@@ -543,32 +745,32 @@ class ChaosTestRunner:
         end_time = time.time() + duration
         request_count = 0
         
-        while time.time() < end_time and self.running:
-            service = random.choice(SERVICES)
-            prompt = random.choice(TEST_PROMPTS)
-            
-            print(f"[High Load] Request {request_count + 1} in {int(end_time - time.time())}s remaining...", flush=True)
-            result = self.send_ai_request(service, prompt)
+        def record(service, result):
+            nonlocal request_count
             self.total_requests += 1
             request_count += 1
             
             # Log request
-            with open(self.request_log_file, 'a', newline='') as f:
-                writer = csv.writer(f)
-                writer.writerow([
-                    datetime.now().isoformat(),
-                    'LOAD_HIGH',
-                    service,
-                    'NONE',
-                    False,
-                    result['success'],
-                    result['latency'],
-                    result['error_type'],
-                    'UNKNOWN',
-                    result['response_size']
-                ])
-            
-            time.sleep(2)  # 1 request every 2 seconds
+            self.append_request_log([
+                datetime.now().isoformat(),
+                'LOAD_HIGH',
+                service,
+                'NONE',
+                False,
+                result['success'],
+                result['latency'],
+                result['error_type'],
+                'UNKNOWN',
+                result['response_size']
+            ], result)
+            print(f"[High Load] Request {request_count} done, {max(0, int(end_time - time.time()))}s remaining...", flush=True)
+        
+        self.drive_load(
+            duration,
+            RequestMix(SERVICES, TEST_PROMPTS),
+            record,
+            think_time=2,  # 1 request every 2 seconds
+        )
         
         print(f"\n✅ High load test COMPLETE | Requests: {request_count} | Time: {duration}s\n", flush=True)
     
@@ -576,54 +778,38 @@ class ChaosTestRunner:
         """Test Scenario 3: Burst Load - 10 requests simultaneously"""
         self.log(f"\n📊 LOAD TEST: Burst Load ({bursts} bursts of {burst_size} requests)", level='INFO')
         
-        import concurrent.futures
-        from threading import Lock
-        
-        request_lock = Lock()
         total_burst_requests = 0
         
-        def send_burst_request(service, prompt, burst_id, request_id):
-            nonlocal total_burst_requests
-            result = self.send_ai_request(service, prompt)
-            
-            with request_lock:
-                self.total_requests += 1
-                total_burst_requests += 1
-                
-                # Log request
-                with open(self.request_log_file, 'a', newline='') as f:
-                    writer = csv.writer(f)
-                    writer.writerow([
-                        datetime.now().isoformat(),
-                        f'LOAD_BURST_{burst_id}',
-                        service,
-                        'NONE',
-                        False,
-                        result['success'],
-                        result['latency'],
-                        result['error_type'],
-                        'UNKNOWN',
-                        result['response_size']
-                    ])
-            
-            return result
-        
         for burst_num in range(bursts):
             if not self.running:
                 break
                 
             self.log(f"   Burst {burst_num + 1}/{bursts}: Sending {burst_size} simultaneous requests...", level='INFO')
             
-            with concurrent.futures.ThreadPoolExecutor(max_workers=burst_size) as executor:
-                futures = []
-                for i in range(burst_size):
-                    service = random.choice(SERVICES)
-                    prompt = random.choice(TEST_PROMPTS)
-                    future = executor.submit(send_burst_request, service, prompt, burst_num + 1, i + 1)
-                    futures.append(future)
+            def record(service, result, burst_id=burst_num + 1):
+                nonlocal total_burst_requests
+                # Runs on the engine's event loop thread, one result at a time
+                self.total_requests += 1
+                total_burst_requests += 1
                 
-                # Wait for all requests to complete
-                concurrent.futures.wait(futures)
+                # Log request
+                self.append_request_log([
+                    datetime.now().isoformat(),
+                    f'LOAD_BURST_{burst_id}',
+                    service,
+                    'NONE',
+                    False,
+                    result['success'],
+                    result['latency'],
+                    result['error_type'],
+                    'UNKNOWN',
+                    result['response_size']
+                ], result)
+            
+            batch = [(random.choice(SERVICES), random.choice(TEST_PROMPTS)) for _ in range(burst_size)]
+            
+            # Wait for all requests to complete
+            self.engine.run(self.engine.burst(batch, record))
             
             # Wait between bursts
             if burst_num < bursts - 1:
@@ -635,38 +821,33 @@ class ChaosTestRunner:
         """Test Scenario 4: Mixed Providers - Round-robin across all services"""
         self.log(f"\n📊 LOAD TEST: Mixed Providers (Round-robin for {duration}s)", level='INFO')
         
-        end_time = time.time() + duration
         request_count = 0
-        service_index = 0
         
-        while time.time() < end_time and self.running:
-            # Round-robin through services
-            service = SERVICES[service_index % len(SERVICES)]
-            service_index += 1
-            
-            prompt = random.choice(TEST_PROMPTS)
-            
-            result = self.send_ai_request(service, prompt)
+        def record(service, result):
+            nonlocal request_count
             self.total_requests += 1
             request_count += 1
             
             # Log request
-            with open(self.request_log_file, 'a', newline='') as f:
-                writer = csv.writer(f)
-                writer.writerow([
-                    datetime.now().isoformat(),
-                    'LOAD_MIXED',
-                    service,
-                    'NONE',
-                    False,
-                    result['success'],
-                    result['latency'],
-                    result['error_type'],
-                    'UNKNOWN',
-                    result['response_size']
-                ])
-            
-            time.sleep(3)  # Even distribution
+            self.append_request_log([
+                datetime.now().isoformat(),
+                'LOAD_MIXED',
+                service,
+                'NONE',
+                False,
+                result['success'],
+                result['latency'],
+                result['error_type'],
+                'UNKNOWN',
+                result['response_size']
+            ], result)
+        
+        self.drive_load(
+            duration,
+            RequestMix(SERVICES, TEST_PROMPTS, order='round_robin'),  # Round-robin through services
+            record,
+            think_time=3,  # Even distribution
+        )
         
         self.log(f"✅ Mixed provider test complete ({request_count} requests across all services)", level='SUCCESS')
     
@@ -679,16 +860,13 @@ class ChaosTestRunner:
             self.log("Failed to inject chaos for load test", level='ERROR')
             return
         
-        end_time = time.time() + duration
         request_count = 0
         successes = 0
         failures = 0
         latencies = []
         
-        while time.time() < end_time and self.running:
-            prompt = random.choice(TEST_PROMPTS)
-            
-            result = self.send_ai_request(service, prompt)
+        def record(requested_service, result):
+            nonlocal request_count, successes, failures
             self.total_requests += 1
             request_count += 1
             
@@ -699,22 +877,25 @@ class ChaosTestRunner:
                 failures += 1
             
             # Log request
-            with open(self.request_log_file, 'a', newline='') as f:
-                writer = csv.writer(f)
-                writer.writerow([
-                    datetime.now().isoformat(),
-                    'CHAOS_CONTINUOUS',
-                    service,
-                    chaos_type,
-                    True,
-                    result['success'],
-                    result['latency'],
-                    result['error_type'],
-                    'UNKNOWN',
-                    result['response_size']
-                ])
-            
-            time.sleep(2)  # Continuous load
+            self.append_request_log([
+                datetime.now().isoformat(),
+                'CHAOS_CONTINUOUS',
+                service,
+                chaos_type,
+                True,
+                result['success'],
+                result['latency'],
+                result['error_type'],
+                'UNKNOWN',
+                result['response_size']
+            ], result)
+        
+        self.drive_load(
+            duration,
+            RequestMix([service], TEST_PROMPTS),
+            record,
+            think_time=2,  # Continuous load
+        )
         
         # Stop chaos
         self.stop_chaos(service)
@@ -771,43 +952,211 @@ class ChaosTestRunner:
         """Run normal testing without chaos"""
         self.log(f"\n✅ Running normal period ({duration}s)...", level='SUCCESS')
         
-        end_time = time.time() + duration
         request_count = 0
         
-        while time.time() < end_time and self.running:
-            service = random.choice(SERVICES)
-            prompt = random.choice(TEST_PROMPTS)
-            
-            result = self.send_ai_request(service, prompt)
+        def record(service, result):
+            nonlocal request_count
             self.total_requests += 1
             request_count += 1
             
             # Log request
-            with open(self.request_log_file, 'a', newline='') as f:
-                writer = csv.writer(f)
-                writer.writerow([
-                    datetime.now().isoformat(),
-                    'NORMAL',
-                    service,
-                    'NONE',
-                    False,
-                    result['success'],
-                    result['latency'],
-                    result['error_type'],
-                    'UNKNOWN',
-                    result['response_size']
-                ])
-            
-            time.sleep(duration / 20)  # Spread requests evenly
+            self.append_request_log([
+                datetime.now().isoformat(),
+                'NORMAL',
+                service,
+                'NONE',
+                False,
+                result['success'],
+                result['latency'],
+                result['error_type'],
+                'UNKNOWN',
+                result['response_size']
+            ], result)
+        
+        self.drive_load(
+            duration,
+            RequestMix(SERVICES, TEST_PROMPTS),
+            record,
+            think_time=duration / 20,  # Spread requests evenly
+        )
         
         self.log(f"✅ Normal period complete ({request_count} requests)", level='SUCCESS')
     
+    def run_capacity_step(self, service, chaos_type, intensity, rate, phase):
+        """
+        Offer `rate` requests/second to `service` for capacity_step_duration
+        seconds, with `chaos_type` injected if given, and record one point of
+        the throughput-latency curve. Returns the step, or None if chaos could
+        not be injected.
+        """
+        condition = chaos_type or 'NONE'
+        if chaos_type and not self.inject_chaos(service, chaos_type, intensity,
+                                                self.capacity_step_duration + self.request_timeout):
+            return None
+        
+        latency = LatencyRecorder()
+        completed = 0
+        successes = 0
+        
+        def record(requested_service, result):
+            nonlocal completed, successes
+            self.total_requests += 1
+            completed += 1
+            successes += 1 if result['success'] else 0
+            latency.record(result)
+            self.append_request_log([
+                datetime.now().isoformat(),
+                f'CAPACITY_{rate:g}',
+                service,
+                condition,
+                bool(chaos_type),
+                result['success'],
+                result['latency'],
+                result['error_type'],
+                self.breaker_sampler.state(service),
+                result['response_size']
+            ], result)
+        
+        step_start = time.time()
+        self.drive_load(self.capacity_step_duration, RequestMix([service], TEST_PROMPTS), record, rate=rate)
+        elapsed = time.time() - step_start
+        if chaos_type:
+            self.stop_chaos(service)
+        
+        # The SLO covers every response, measured from its intended send time
+        overall = LatencyHistogram().add(latency.success).add(latency.failure)
+        error_rate = (completed - successes) / completed * 100 if completed else 100.0
+        p99 = overall.value_at_percentile(99)
+        step = {
+            'service': service,
+            'chaos_type': condition,
+            'intensity': intensity if chaos_type else 0,
+            'phase': phase,
+            'offered_rate': rate,
+            'requests': completed,
+            'throughput': completed / elapsed if elapsed else 0,
+            'goodput': successes / elapsed if elapsed else 0,
+            'error_rate': error_rate,
+            'p50': overall.value_at_percentile(50),
+            'p99': p99,
+            'slo_met': completed > 0 and p99 <= self.slo_p99_ms and error_rate <= self.slo_error_rate,
+        }
+        self.capacity_log.writerow([
+            datetime.now().isoformat(), service, condition, step['intensity'], phase,
+            f"{rate:g}", completed, round(step['throughput'], 2), round(step['goodput'], 2),
+            round(error_rate, 2), step['p50'], p99, step['slo_met']
+        ])
+        self.log(f"   {phase.title()} {rate:g} req/s | {step['throughput']:.1f} req/s served | "
+                 f"p99 {p99}ms | errors {error_rate:.1f}% | SLO {'✅ met' if step['slo_met'] else '❌ missed'}",
+                 level='INFO')
+        
+        # Let the service (and its circuit breaker) recover before the next step
+        self.measure_recovery(f'CAPACITY_{rate:g}', condition, service, time.time())
+        return step
+    
+    def find_capacity(self, service, chaos_type=None, intensity=0):
+        """
+        Highest sustainable rate for one service and condition: double the
+        offered rate until the SLO is missed, then bisect between the last rate
+        that met it and the first that didn't until they are within
+        capacity_tolerance of each other. Returns None if even
+        capacity_start_rate misses the SLO.
+        """
+        condition = f"{chaos_type.upper()} @ {intensity}" if chaos_type else "no chaos"
+        self.log(f"\n📈 Capacity search: {service.upper()} with {condition}", level='CHAOS' if chaos_type else 'INFO')
+        
+        best, worst = None, None
+        rate = self.capacity_start_rate
+        while self.running:
+            step = self.run_capacity_step(service, chaos_type, intensity, rate, 'ramp')
+            if step is None:
+                return None
+            if not step['slo_met']:
+                worst = rate
+                break
+            best = rate
+            if rate >= self.capacity_max_rate:
+                break
+            rate = min(rate * CAPACITY_RAMP_FACTOR, self.capacity_max_rate)
+        
+        if best is not None and worst is not None:
+            while self.running and (worst - best) / best > self.capacity_tolerance:
+                rate = (best + worst) / 2
+                step = self.run_capacity_step(service, chaos_type, intensity, rate, 'bisect')
+                if step is None:
+                    break
+                if step['slo_met']:
+                    best = rate
+                else:
+                    worst = rate
+        
+        self.capacity_results.append({
+            'service': service,
+            'chaos_type': chaos_type or 'NONE',
+            'intensity': intensity,
+            'max_rate': best,
+            'limit_reached': best is not None and worst is None,
+        })
+        if best is None:
+            self.log(f"❌ {service.upper()} misses the SLO at {self.capacity_start_rate:g} req/s with {condition}",
+                     level='WARNING')
+        else:
+            self.log(f"✅ {service.upper()} sustains {best:g} req/s with {condition}"
+                     + (" (--capacity-max-rate reached)" if worst is None else ""), level='SUCCESS')
+        return best
+    
+    def run_capacity_search(self):
+        """
+        Find each service's saturation knee without chaos and under each chaos
+        type (at its mildest intensity), writing every step to the capacity curve CSV.
+        """
+        self.log("\n" + "="*80, level='INFO')
+        self.log("📈 CAPACITY SEARCH", level='INFO')
+        self.log(f"   SLO: p99 <= {self.slo_p99_ms}ms, errors <= {self.slo_error_rate:g}% | "
+                 f"{self.capacity_step_duration}s per step, {self.capacity_start_rate:g}-"
+                 f"{self.capacity_max_rate:g} req/s", level='INFO')
+        self.log("="*80, level='INFO')
+        
+        self.capacity_log_file = self.output_dir / f"capacity_curve_{self.log_timestamp}.csv"
+        self.capacity_log = CsvWriterThread(self.capacity_log_file, header=[
+            'Timestamp', 'Service', 'Chaos_Type', 'Intensity', 'Phase', 'Offered_Rate',
+            'Requests', 'Throughput_Rps', 'Goodput_Rps', 'Error_Rate_%', 'P50_Ms', 'P99_Ms', 'SLO_Met'
+        ], flush_interval=self.log_flush_interval, fsync=self.fsync)
+        
+        conditions = [(None, 0)] + [(chaos_type, info['intensities'][0]) for chaos_type, info in CHAOS_TYPES.items()]
+        for service in SERVICES:
+            for chaos_type, intensity in conditions:
+                if not self.running:
+                    return
+                self.find_capacity(service, chaos_type, intensity)
+    
+    def format_percentiles(self, summary):
+        """'p50 120ms | p90 340ms | ...' for a latency histogram summary"""
+        if not summary['count']:
+            return 'no samples'
+        return ' | '.join(f"{percentile_label(p).replace('_', '.')} {summary[percentile_label(p)]}ms"
+                          for p in PERCENTILES)
+    
+    def merged_latency(self, experiments):
+        """Success and failure histograms of several experiments combined"""
+        merged = LatencyRecorder()
+        for e in experiments:
+            merged.add(e['latency_histograms'])
+        return merged
+    
     def generate_final_report(self):
         """Generate comprehensive final analysis report"""
         self.log("\n\n" + "="*80, level='INFO')
         self.log("📊 GENERATING FINAL REPORT", level='INFO')
         self.log("="*80, level='INFO')
         
+        # Make sure the data files the report points to are complete
+        self.request_log.flush()
+        self.experiment_log.flush()
+        self.breaker_timeline.flush()
+        if self.capacity_log:
+            self.capacity_log.flush()
+        
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         report_file = self.output_dir / f"final_report_{timestamp}.txt"
         
@@ -819,6 +1168,18 @@ class ChaosTestRunner:
             f.write(f"Test Duration: {self.duration_hours} hours\n")
             f.write(f"Total Requests: {self.total_requests}\n")
             f.write(f"Total Chaos Experiments: {self.total_chaos_experiments}\n")
+            if self.rate:
+                load_model = f"open loop at {self.rate:g} req/s ({self.arrival} arrivals)"
+            else:
+                load_model = f"{self.concurrency} virtual user(s) per scenario"
+            f.write(f"Load Engine: {self.engine.backend}, {load_model}, "
+                    f"peak {self.engine.peak_in_flight} requests in flight\n")
+            if self.workers:
+                f.write(f"Load Workers: {len(self.workers)}, {self.workers.requests_completed} requests, "
+                        f"peak {self.workers.peak_in_flight} in flight on one worker\n")
+            f.write(f"Circuit Breaker Sampler: {self.breaker_sampler.samples} polls every "
+                    f"{self.breaker_sampler.interval:g}s, {len(self.breaker_sampler.transitions())} transitions, "
+                    f"{self.breaker_sampler.errors} failed polls\n")
             f.write(f"Report Generated: {datetime.now().isoformat()}\n\n")
             
             # Service comparison
@@ -836,6 +1197,7 @@ class ChaosTestRunner:
                     avg_latency = sum(e['avg_latency'] for e in service_experiments) / len(service_experiments)
                     total_cb_trips = sum(e['circuit_breaker_trips'] for e in service_experiments)
                     avg_recovery = sum(e['recovery_time'] for e in service_experiments) / len(service_experiments)
+                    recovered = sum(1 for e in service_experiments if e['recovered'])
                     
                     # Calculate resilience score (0-100)
                     resilience_score = (
@@ -849,8 +1211,12 @@ class ChaosTestRunner:
                     f.write(f"  Total Requests: {total_requests}\n")
                     f.write(f"  Success Rate: {avg_success_rate:.2f}%\n")
                     f.write(f"  Avg Latency: {avg_latency:.0f}ms\n")
+                    latency = self.merged_latency(service_experiments)
+                    f.write(f"  Success Latency: {self.format_percentiles(latency.success.summary())}\n")
+                    f.write(f"  Failure Latency: {self.format_percentiles(latency.failure.summary())}\n")
                     f.write(f"  Circuit Breaker Trips: {total_cb_trips}\n")
                     f.write(f"  Avg Recovery Time: {avg_recovery:.1f}s\n")
+                    f.write(f"  Recovered: {recovered}/{len(service_experiments)} experiments\n")
                     f.write(f"  Resilience Score: {resilience_score:.2f}/100\n\n")
             
             # Chaos type analysis
@@ -869,14 +1235,39 @@ class ChaosTestRunner:
                     f.write(f"  Experiments Run: {len(chaos_experiments)}\n")
                     f.write(f"  Avg Success Rate: {avg_success_rate:.2f}%\n")
                     f.write(f"  Avg Circuit Breaker Trips: {avg_cb_trips:.1f}\n")
+                    latency = self.merged_latency(chaos_experiments)
+                    f.write(f"  Success Latency: {self.format_percentiles(latency.success.summary())}\n")
+                    f.write(f"  Failure Latency: {self.format_percentiles(latency.failure.summary())}\n")
                     f.write(f"  Impact Level: {'High' if avg_success_rate < 50 else 'Medium' if avg_success_rate < 75 else 'Low'}\n\n")
             
+            if self.capacity_results:
+                f.write("\n" + "="*80 + "\n")
+                f.write("CAPACITY SEARCH\n")
+                f.write("="*80 + "\n\n")
+                f.write(f"SLO: p99 <= {self.slo_p99_ms}ms, error rate <= {self.slo_error_rate:g}%\n\n")
+                for service in SERVICES:
+                    results = [r for r in self.capacity_results if r['service'] == service]
+                    if not results:
+                        continue
+                    f.write(f"{service.upper()}\n")
+                    for r in results:
+                        condition = 'No chaos' if r['chaos_type'] == 'NONE' else f"{CHAOS_TYPES[r['chaos_type']]['name']} @ {r['intensity']}"
+                        if r['max_rate'] is None:
+                            capacity = f"below {self.capacity_start_rate:g} req/s"
+                        else:
+                            capacity = f"{r['max_rate']:g} req/s" + (" (search limit)" if r['limit_reached'] else "")
+                        f.write(f"  {condition}: {capacity}\n")
+                    f.write("\n")
+            
             f.write("\n" + "="*80 + "\n")
             f.write("DATA FILES GENERATED\n")
             f.write("="*80 + "\n\n")
             f.write(f"Experiment Log: {self.experiment_log_file.name}\n")
             f.write(f"Request Log: {self.request_log_file.name}\n")
+            f.write(f"Circuit Breaker Timeline: {self.breaker_timeline_file.name}\n")
             f.write(f"Service Comparison: {self.service_comparison_file.name}\n")
+            if self.capacity_log:
+                f.write(f"Capacity Curve: {self.capacity_log_file.name}\n")
             f.write(f"Final Report: {report_file.name}\n\n")
         
         self.log(f"\n✅ Final report saved to: {report_file}", level='SUCCESS')
@@ -892,6 +1283,7 @@ class ChaosTestRunner:
             self.log(f"Requests per cycle: {self.requests_per_cycle}", level='INFO')
             self.log(f"Chaos duration: {self.chaos_duration}s", level='INFO')
             self.log(f"Normal period: {self.normal_duration}s", level='INFO')
+            self.log(f"Experiments: {'parallel across services' if self.parallel_services else 'one at a time'}", level='INFO')
             self.log(f"Output directory: {self.output_dir}", level='INFO')
             self.log("="*80 + "\n", level='INFO')
             
@@ -933,6 +1325,26 @@ class ChaosTestRunner:
                             print(f"⚠️  Stopping: running={self.running}, time_left={end_time - time.time():.1f}s", flush=True)
                             break
                         
+                        if self.parallel_services:
+                            # Chaos is injected per service, so every service can run its experiment at once
+                            time_needed = self.chaos_duration + self.normal_duration + 60  # +60s buffer
+                            if time.time() + time_needed > end_time:
+                                self.log(f"\n⚠️  Skipping remaining experiments - not enough time (need {time_needed}s, have {end_time - time.time():.1f}s)", level='WARNING')
+                                continue
+                            
+                            batch = [(experiment_id + i, chaos_type, intensity, service)
+                                     for i, service in enumerate(SERVICES)]
+                            experiment_id += len(batch)
+                            self.run_parallel_experiments(batch)
+                            
+                            # Normal period between experiment batches
+                            if self.running and time.time() < end_time:
+                                try:
+                                    self.run_normal_period(self.normal_duration)
+                                except Exception as e:
+                                    self.log(f"❌ Normal period failed: {e}", level='ERROR')
+                            continue
+                        
                         # Test each service
                         for service in SERVICES:
                             if not self.running or time.time() >= end_time:
@@ -984,6 +1396,7 @@ class ChaosTestRunner:
             self.generate_final_report()
 
 def main():
+    global BACKEND_URL
     parser = argparse.ArgumentParser(
         description='AI Resilience Monitor - Automated Chaos Testing & Empirical Validation',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -1001,8 +1414,33 @@ Examples:
   # Quick test (1 hour)
   python chaos-test.py --duration 1 --requests 5 --chaos-duration 120
   
+  # Full chaos matrix with all services tested at the same time
+  python chaos-test.py --parallel-services
+  
   # Run validation suite with custom output
   python chaos-test.py --validation --output-dir validation-results
+  
+  # Same scenarios with 500 concurrent virtual users each (pip install aiohttp)
+  python chaos-test.py --validation --concurrency 500 --quiet
+  
+  # Open-loop: 20 requests/second as a Poisson process, however slow the backend gets
+  python chaos-test.py --validation --rate 20 --arrival poisson --quiet
+  
+  # Find each service's maximum sustainable rate, with and without chaos
+  python chaos-test.py --capacity-search --slo-p99 1500 --slo-error-rate 1 --quiet
+  
+  # Benchmark the runner itself against the built-in mock backend (no Node.js needed)
+  python chaos-test.py --validation --mock-backend --mock-latency fixed:20 --mock-seed 1 --rate 500 --quiet
+
+  # Capacity search against a mock that fails like src/index.js (10% of provider calls)
+  python chaos-test.py --capacity-search --mock-backend --mock-latency lognormal:200:0.5 --mock-failure-rate 0.1 --slo-error-rate 15 --quiet
+  
+  # Split 2000 requests/second across 8 local worker processes
+  python chaos-test.py --validation --rate 2000 --workers 8 --quiet
+  
+  # Controller waiting for 4 remote workers, and a worker on another machine
+  python chaos-test.py --validation --rate 5000 --remote-workers 4 --worker-listen 0.0.0.0:7100 --quiet
+  python chaos-test.py --worker controller-host:7100
         """
     )
     
@@ -1015,19 +1453,133 @@ Examples:
     parser.add_argument('--chaos-duration', type=int, default=300,
                        help='Chaos experiment duration in seconds (default: 300)')
     parser.add_argument('--normal-duration', type=int, default=180,
-                       help='Normal period duration in seconds (default: 180)')
+                       help='Normal period duration, and the longest recovery phase, in seconds (default: 180)')
     parser.add_argument('--output-dir', type=str, default='chaos-test-results',
                        help='Output directory for results (default: chaos-test-results)')
+    parser.add_argument('--concurrency', type=int, default=1,
+                       help='Concurrent virtual users per scenario, each with the scenario\'s pacing (default: 1)')
+    parser.add_argument('--max-in-flight', type=int, default=1000,
+                       help='Upper bound on concurrent HTTP requests across all scenarios (default: 1000)')
+    parser.add_argument('--quiet', action='store_true',
+                       help='Do not print a line per request (recommended with high --concurrency)')
+    parser.add_argument('--rate', type=float, default=None,
+                       help='Open-loop mode: send this many requests/second per scenario regardless of '
+                            'response time, instead of --concurrency virtual users')
+    parser.add_argument('--arrival', choices=['uniform', 'poisson'], default='uniform',
+                       help='Inter-arrival times for --rate: evenly spaced or Poisson process (default: uniform)')
+    parser.add_argument('--fsync', choices=['never', 'batch', 'close'], default='never',
+                       help='When CSV logs are fsynced: never, after every batch, or once on exit (default: never)')
+    parser.add_argument('--log-flush-interval', type=float, default=1.0,
+                       help='Longest a CSV row waits in memory before its batch is written, in seconds (default: 1.0)')
+    parser.add_argument('--parallel-services', action='store_true',
+                       help='Run each chaos type/intensity on all services at the same time (about 3x faster full matrix)')
+    parser.add_argument('--breaker-sample-interval', type=float, default=0.25,
+                       help='Seconds between circuit breaker status polls (default: 0.25)')
+    parser.add_argument('--recovery-successes', type=int, default=3,
+                       help='Consecutive successful probes (with the breaker CLOSED) that end the recovery '
+                            'period; --normal-duration is the upper bound (default: 3)')
+    parser.add_argument('--recovery-probe-interval', type=float, default=1.0,
+                       help='Seconds between recovery probes (default: 1.0)')
+    parser.add_argument('--capacity-search', action='store_true',
+                       help='Find the highest request rate each service sustains within the SLO, '
+                            'without chaos and under each chaos type')
+    parser.add_argument('--slo-p99', type=int, default=2000,
+                       help='Capacity search SLO: p99 latency in milliseconds (default: 2000)')
+    parser.add_argument('--slo-error-rate', type=float, default=1.0,
+                       help='Capacity search SLO: error rate in percent (default: 1.0)')
+    parser.add_argument('--step-duration', type=int, default=30,
+                       help='Seconds each capacity search rate is held (default: 30)')
+    parser.add_argument('--start-rate', type=float, default=1.0,
+                       help='First capacity search rate in requests/second, doubled every step (default: 1)')
+    parser.add_argument('--max-rate', type=float, default=1000.0,
+                       help='Highest capacity search rate in requests/second (default: 1000)')
+    parser.add_argument('--capacity-tolerance', type=float, default=0.05,
+                       help='Stop bisecting when the bounds are within this fraction (default: 0.05)')
+    parser.add_argument('--backend-url', type=str, default=BACKEND_URL,
+                       help=f'Backend under test; workers use the controller\'s unless given their own (default: {BACKEND_URL})')
+    parser.add_argument('--mock-backend', action='store_true',
+                       help='Test against a local mock of the Node backend (mock_backend.py) instead of --backend-url')
+    parser.add_argument('--mock-latency', type=str, default='uniform:500:2500',
+                       help='Mock provider latency in ms, e.g. fixed:20, uniform:500:2500, lognormal:200:0.5 '
+                            '(default: uniform:500:2500)')
+    parser.add_argument('--mock-seed', type=int, default=None,
+                       help='Seed for the mock backend\'s latency, failure and chaos outcomes')
+    parser.add_argument('--mock-failure-rate', type=float, default=0.0,
+                       help='Fraction of mock provider calls that fail (default: 0, so only load and chaos cause errors; '
+                            'src/index.js uses 0.1)')
+    parser.add_argument('--mock-breaker-timeout', type=float, default=20.0,
+                       help='Seconds an OPEN mock circuit breaker waits before HALF_OPEN (default: 20)')
+    parser.add_argument('--mock-failure-threshold', type=int, default=3,
+                       help='Consecutive failures that open a mock circuit breaker (default: 3)')
+    parser.add_argument('--mock-success-threshold', type=int, default=2,
+                       help='Successes in HALF_OPEN that close a mock circuit breaker (default: 2)')
+    parser.add_argument('--workers', type=int, default=0,
+                       help='Generate scenario load in this many local worker processes (default: 0, in-process)')
+    parser.add_argument('--remote-workers', type=int, default=0,
+                       help='Wait for this many remote workers (chaos-test.py --worker) before starting')
+    parser.add_argument('--worker-listen', type=str, default=None,
+                       help='HOST:PORT the controller accepts remote workers on (default: 127.0.0.1, any free port)')
+    parser.add_argument('--worker-authkey', type=str, default=DEFAULT_AUTHKEY.decode(),
+                       help='Shared secret between controller and workers')
+    parser.add_argument('--worker', type=str, default=None, metavar='HOST:PORT',
+                       help='Run as a load worker for the controller at HOST:PORT; all other options come from it')
     
     args = parser.parse_args()
     
+    BACKEND_URL = args.backend_url
+    
+    if args.worker:
+        print(f"🛠️  Load worker connecting to controller at {args.worker}", flush=True)
+        run_worker(parse_address(args.worker), authkey=args.worker_authkey.encode(),
+                   base_url=args.backend_url if args.backend_url != parser.get_default('backend_url') else None)
+        print("👋 Controller closed the connection, worker exiting", flush=True)
+        return
+    
+    mock = None
+    if args.mock_backend:
+        # Separate process, so the mock doesn't compete with the runner for the GIL
+        try:
+            mock, BACKEND_URL = mock_backend.start_process(
+                latency=args.mock_latency,
+                failure_rate=args.mock_failure_rate,
+                seed=args.mock_seed,
+                breaker_timeout=args.mock_breaker_timeout,
+                failure_threshold=args.mock_failure_threshold,
+                success_threshold=args.mock_success_threshold
+            )
+        except ValueError as e:
+            parser.error(str(e))
+        print(f"🧪 Mock backend running at {BACKEND_URL} (latency {args.mock_latency}, "
+              f"failure rate {args.mock_failure_rate:g}, seed {args.mock_seed})", flush=True)
+    
     # Create test runner
     runner = ChaosTestRunner(
         duration_hours=args.duration,
         requests_per_cycle=args.requests,
         chaos_duration=args.chaos_duration,
         normal_duration=args.normal_duration,
-        output_dir=args.output_dir
+        output_dir=args.output_dir,
+        concurrency=args.concurrency,
+        max_in_flight=args.max_in_flight,
+        quiet=args.quiet,
+        rate=args.rate,
+        arrival=args.arrival,
+        fsync=args.fsync,
+        log_flush_interval=args.log_flush_interval,
+        parallel_services=args.parallel_services,
+        breaker_sample_interval=args.breaker_sample_interval,
+        recovery_successes=args.recovery_successes,
+        recovery_probe_interval=args.recovery_probe_interval,
+        workers=args.workers,
+        remote_workers=args.remote_workers,
+        worker_listen=parse_address(args.worker_listen) if args.worker_listen else None,
+        worker_authkey=args.worker_authkey.encode(),
+        slo_p99_ms=args.slo_p99,
+        slo_error_rate=args.slo_error_rate,
+        capacity_step_duration=args.step_duration,
+        capacity_start_rate=args.start_rate,
+        capacity_max_rate=args.max_rate,
+        capacity_tolerance=args.capacity_tolerance
     )
     
     try:
@@ -1053,6 +1605,13 @@ Examples:
             runner.log("\n" + "="*80, level='INFO')
             runner.log("🎉 EMPIRICAL VALIDATION COMPLETE!", level='SUCCESS')
             runner.log("="*80, level='INFO')
+        elif args.capacity_search:
+            if not runner.check_backend_health():
+                runner.log("❌ Backend is not running! Please start the backend first.", level='ERROR')
+                return
+            
+            runner.run_capacity_search()
+            runner.generate_final_report()
         else:
             # Run standard chaos testing
             runner.run()
@@ -1071,6 +1630,10 @@ Examples:
         import traceback
         traceback.print_exc()
         runner.generate_final_report()
+    finally:
+        runner.close()
+        if mock is not None:
+            mock.terminate()
 
 if __name__ == '__main__':
     main()
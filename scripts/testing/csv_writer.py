@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+AI Resilience Monitor - Buffered CSV Writer
+One long-lived background thread per CSV file. Rows are queued in memory and
+written in batches, so request callbacks never open files or wait on the disk.
+"""
+
+import csv
+import os
+import threading
+import time
+from collections import deque
+
+# never: leave durability to the OS; batch: fsync after every batch; close: fsync once on close
+FSYNC_POLICIES = ('never', 'batch', 'close')
+
+
+class CsvWriterThread:
+    """
+    Append-only CSV file fed through a queue.
+
+    A batch is written once `batch_size` rows are queued or the oldest queued
+    row has waited `flush_interval` seconds, whichever comes first. Call
+    close() before exiting; rows still queued are written then.
+    """
+
+    def __init__(self, path, header=None, batch_size=500, flush_interval=1.0, fsync='never'):
+        if fsync not in FSYNC_POLICIES:
+            raise ValueError(f"Unknown fsync policy '{fsync}', expected one of {FSYNC_POLICIES}")
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.fsync = fsync
+
+        self.rows_written = 0
+        self.batches_written = 0
+
+        self._file = open(path, 'w' if header else 'a', newline='')
+        self._writer = csv.writer(self._file)
+        if header:
+            self._writer.writerow(header)
+            self._file.flush()
+
+        self._queue = deque()
+        self._cond = threading.Condition()
+        self._in_progress = 0
+        self._flush_requested = False
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name=f'csv-writer-{os.path.basename(str(path))}',
+                                        daemon=True)
+        self._thread.start()
+
+    def writerow(self, row):
+        """Queue one row; never blocks on I/O."""
+        with self._cond:
+            if self._closed:
+                raise ValueError(f"{self.path} is closed")
+            self._queue.append(row)
+            if len(self._queue) == 1 or len(self._queue) >= self.batch_size:
+                self._cond.notify_all()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._queue and not self._closed:
+                    self._cond.wait()
+                if not self._queue and self._closed:
+                    return
+                # Let the batch fill up, but don't hold the first row longer than flush_interval
+                deadline = time.monotonic() + self.flush_interval
+                while len(self._queue) < self.batch_size and not (self._closed or self._flush_requested):
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+                batch = list(self._queue)
+                self._queue.clear()
+                self._in_progress = len(batch)
+                self._flush_requested = False
+            self._write(batch)
+
+    def _write(self, batch):
+        try:
+            self._writer.writerows(batch)
+            self._file.flush()
+            if self.fsync == 'batch':
+                os.fsync(self._file.fileno())
+            written = len(batch)
+        except OSError as e:
+            print(f"❌ Failed to write {len(batch)} rows to {self.path}: {e}", flush=True)
+            written = 0
+        with self._cond:
+            self.rows_written += written
+            self.batches_written += 1 if written else 0
+            self._in_progress = 0
+            self._cond.notify_all()
+
+    def flush(self, timeout=10.0):
+        """Wait until every row queued so far is written. Returns True if drained."""
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            while self._queue or self._in_progress:
+                # Write now instead of waiting out flush_interval
+                self._flush_requested = True
+                self._cond.notify_all()
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+            return True
+
+    def close(self, timeout=10.0):
+        """Write what is left, fsync if the policy asks for it, and close the file."""
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join(timeout)
+        if self.fsync in ('batch', 'close'):
+            os.fsync(self._file.fileno())
+        self._file.close()
@@ -0,0 +1,381 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+AI Resilience Monitor - Distributed Load Generation
+Splits a scenario's load across worker processes so request generation is no
+longer bound to one interpreter's GIL. Workers are local processes or
+`chaos-test.py --worker HOST:PORT` instances on other machines; each runs its
+own LoadEngine and streams compact result records back to the controller,
+which feeds them through the scenario's usual callbacks (histograms, CSV logs,
+progress) exactly as if the requests had been sent locally.
+
+Controller and workers talk over plain TCP using multiprocessing.connection,
+authenticated with a shared key. Messages are pickled, so only run workers
+against a controller you trust.
+"""
+
+import asyncio
+import multiprocessing
+import queue
+import random
+import signal
+import threading
+import time
+from multiprocessing.connection import Client, Listener, wait
+
+from load_engine import LoadEngine
+
+DEFAULT_AUTHKEY = b'ai-resilience-monitor'
+
+# A worker sends its buffered records once it has this many, or after this many seconds
+RESULT_BATCH_SIZE = 200
+RESULT_BATCH_INTERVAL = 0.2
+
+# Order of the fields in a result record sent from worker to controller
+RECORD_FIELDS = ('success', 'latency', 'error_type', 'response_size', 'served_by',
+                 'intended_send', 'actual_send', 'send_lag_ms')
+
+
+def parse_address(text, default_host='127.0.0.1'):
+    """'host:port' or ':port' -> (host, port)"""
+    host, _, port = text.rpartition(':')
+    if not port.isdigit():
+        raise ValueError(f"Expected HOST:PORT, got '{text}'")
+    return host or default_host, int(port)
+
+
+def encode_result(service, result):
+    return (service,) + tuple(result.get(field) for field in RECORD_FIELDS)
+
+
+def decode_result(record):
+    return record[0], dict(zip(RECORD_FIELDS, record[1:]))
+
+
+def split_evenly(total, parts):
+    """Split an integer as evenly as possible: split_evenly(5, 3) -> [2, 2, 1]"""
+    return [total // parts + (1 if index < total % parts else 0) for index in range(parts)]
+
+
+# ----------------------------------------------------------------------
+# Worker
+# ----------------------------------------------------------------------
+
+class _Worker:
+    """One worker process: runs jobs from the controller on its own LoadEngine."""
+
+    def __init__(self, conn, base_url=None):
+        self.conn = conn
+        self.base_url = base_url
+        self.engine = None
+        self._send_lock = threading.Lock()
+        self._cancelled = set()
+
+    def send(self, message):
+        with self._send_lock:
+            self.conn.send(message)
+
+    def serve(self):
+        try:
+            while True:
+                try:
+                    message = self.conn.recv()
+                except (EOFError, OSError):
+                    return
+                kind = message['type']
+                if kind == 'config':
+                    self.engine = LoadEngine(self.base_url or message['base_url'], timeout=message['timeout'],
+                                             max_in_flight=message['max_in_flight'], verbose=False).start()
+                elif kind == 'run':
+                    self.engine.call_soon(self._start_job, message)
+                elif kind == 'cancel':
+                    self._cancelled.add(message['job'])
+                elif kind == 'shutdown':
+                    return
+        finally:
+            if self.engine is not None:
+                self.engine.close()
+            self.conn.close()
+
+    def _start_job(self, job):
+        # Runs on the engine loop, so several jobs (parallel experiments) share it
+        asyncio.ensure_future(self._run_job(job))
+
+    async def _run_job(self, job):
+        job_id = job['job']
+        buffer = []
+        last_sent = time.monotonic()
+        completed = 0
+
+        def flush():
+            nonlocal last_sent
+            if buffer:
+                self.send({'type': 'results', 'job': job_id, 'records': list(buffer)})
+                buffer.clear()
+            last_sent = time.monotonic()
+
+        def on_result(service, result):
+            nonlocal completed
+            completed += 1
+            buffer.append(encode_result(service, result))
+            if len(buffer) >= RESULT_BATCH_SIZE or time.monotonic() - last_sent >= RESULT_BATCH_INTERVAL:
+                flush()
+
+        def should_continue():
+            return job_id not in self._cancelled
+
+        error = None
+        try:
+            if job['rate']:
+                await self.engine.open_loop(
+                    job['duration'], job['rate'], job['mix'], on_result,
+                    arrival=job['arrival'],
+                    should_continue=should_continue,
+                    rng=random.Random(),
+                    offset=job['offset']
+                )
+            elif job['users']:
+                await self.engine.closed_loop(
+                    job['duration'], job['mix'], on_result,
+                    think_time=job['think_time'],
+                    users=job['users'],
+                    should_continue=should_continue
+                )
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+        try:
+            flush()
+            self.send({'type': 'done', 'job': job_id, 'completed': completed,
+                       'peak_in_flight': self.engine.peak_in_flight, 'error': error})
+        except (OSError, ValueError):
+            pass
+        self._cancelled.discard(job_id)
+
+
+def run_worker(address, authkey=DEFAULT_AUTHKEY, base_url=None):
+    """
+    Connect to a controller at (host, port) and run its jobs until it shuts us
+    down. Requests go to the controller's backend URL unless `base_url` is given.
+    """
+    # Ctrl+C in the controller's terminal is handled by the controller; it closes our connection
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    _Worker(Client(address, authkey=authkey), base_url).serve()
+
+
+# ----------------------------------------------------------------------
+# Controller
+# ----------------------------------------------------------------------
+
+class WorkerPool:
+    """
+    Controller side: local worker processes plus remote workers that connect in.
+
+    run_load() splits one scenario across every worker: an open-loop rate is
+    divided between them (uniform schedules interleaved so the combined
+    arrivals stay evenly spaced), closed-loop virtual users are shared out.
+    Results come back in batches and `on_result` is called for each on the
+    local engine's loop thread, like the engine's own callbacks, so scenario
+    code is unchanged. Several run_load() calls may be active at once.
+    """
+
+    def __init__(self, engine, base_url, local_workers=0, remote_workers=0, listen=('127.0.0.1', 0),
+                 authkey=DEFAULT_AUTHKEY, timeout=30, max_in_flight=1000, log=print):
+        if local_workers + remote_workers < 1:
+            raise ValueError("WorkerPool needs at least one worker")
+        self.engine = engine
+        self.log = log
+        self.requests_completed = 0
+        self.peak_in_flight = 0
+
+        self._listener = Listener(listen, authkey=authkey)
+        self.address = self._listener.address
+        self._processes = []
+        self._conns = []
+        self._send_locks = {}
+        self._jobs = {}
+        self._jobs_lock = threading.Lock()
+        self._next_job = 0
+        self._closed = False
+
+        # Spawn, not fork: the parent already runs the engine, sampler and CSV threads
+        context = multiprocessing.get_context('spawn')
+        for index in range(local_workers):
+            process = context.Process(target=run_worker, args=(self.address, authkey),
+                                      name=f'load-worker-{index + 1}', daemon=True)
+            process.start()
+            self._processes.append(process)
+        if remote_workers:
+            self.log(f"📡 Waiting for {remote_workers} remote worker(s) on {self.address[0]}:{self.address[1]}")
+
+        try:
+            self._accept(local_workers + remote_workers)
+            for conn in self._conns:
+                conn.send({'type': 'config', 'base_url': base_url, 'timeout': timeout,
+                           'max_in_flight': max_in_flight})
+        except BaseException:
+            self.close()
+            raise
+
+        self._receiver = threading.Thread(target=self._receive, name='worker-pool', daemon=True)
+        self._receiver.start()
+
+    def __len__(self):
+        return len(self._conns)
+
+    def _accept(self, count):
+        accepted = queue.Queue()
+
+        def accept_all():
+            for _ in range(count):
+                try:
+                    accepted.put(self._listener.accept())
+                except Exception as e:
+                    accepted.put(e)
+                    return
+
+        threading.Thread(target=accept_all, name='worker-accept', daemon=True).start()
+        while len(self._conns) < count:
+            try:
+                conn = accepted.get(timeout=1)
+            except queue.Empty:
+                dead = [p.name for p in self._processes if p.exitcode is not None]
+                if dead:
+                    raise RuntimeError(f"Worker process(es) exited before connecting: {', '.join(dead)}")
+                continue
+            if isinstance(conn, Exception):
+                raise conn
+            self._conns.append(conn)
+            self._send_locks[conn] = threading.Lock()
+            peer = getattr(self._listener, 'last_accepted', None)
+            self.log(f"🤝 Worker {len(self._conns)}/{count} connected" + (f" from {peer[0]}" if peer else ""))
+
+    def _send(self, conn, message):
+        with self._send_locks[conn]:
+            conn.send(message)
+
+    # ------------------------------------------------------------------
+    # Receiving
+    # ------------------------------------------------------------------
+
+    def _receive(self):
+        live = list(self._conns)
+        while live and not self._closed:
+            try:
+                ready = wait(live, timeout=0.5)
+            except (OSError, ValueError):
+                return  # connections closed under us by close()
+            for conn in ready:
+                try:
+                    message = conn.recv()
+                except (EOFError, OSError):
+                    live.remove(conn)
+                    if not self._closed:
+                        self.log("❌ Lost connection to a load worker")
+                        self.engine.call_soon(self._worker_lost, conn)
+                    continue
+                job = self._jobs.get(message.get('job'))
+                if job is None:
+                    continue
+                if message['type'] == 'results':
+                    self.engine.call_soon(self._deliver, job, message['records'])
+                elif message['type'] == 'done':
+                    # Queued behind this worker's last results, so the job ends after they are applied
+                    self.engine.call_soon(self._finish, job, conn, message)
+
+    def _deliver(self, job, records):
+        for record in records:
+            service, result = decode_result(record)
+            value = job['on_result'](service, result)
+            if asyncio.iscoroutine(value):
+                asyncio.ensure_future(value)
+
+    def _finish(self, job, conn, message):
+        self.requests_completed += message['completed']
+        self.peak_in_flight = max(self.peak_in_flight, message['peak_in_flight'])
+        if message.get('error'):
+            self.log(f"❌ Load worker failed: {message['error']}")
+        job['pending'].discard(conn)
+        if not job['pending']:
+            job['done'].set()
+
+    def _worker_lost(self, conn):
+        if conn in self._conns:
+            self._conns.remove(conn)
+        with self._jobs_lock:
+            jobs = list(self._jobs.values())
+        for job in jobs:
+            job['pending'].discard(conn)
+            if not job['pending']:
+                job['done'].set()
+
+    # ------------------------------------------------------------------
+    # Load
+    # ------------------------------------------------------------------
+
+    def run_load(self, duration, next_request, on_result, rate=None, arrival='uniform',
+                 users=1, think_time=0, should_continue=None):
+        """
+        Run one scenario across all workers and block until every worker is done.
+        `next_request` must be picklable (a load_engine.RequestMix) and
+        `think_time` a number, since both travel to the workers.
+        """
+        conns = list(self._conns)
+        count = len(conns)
+        if not count:
+            raise RuntimeError("No load workers left")
+        user_split = split_evenly(users, count)
+        with self._jobs_lock:
+            self._next_job += 1
+            job_id = self._next_job
+            job = {'on_result': on_result, 'pending': set(conns), 'done': threading.Event()}
+            self._jobs[job_id] = job
+
+        try:
+            for index, conn in enumerate(conns):
+                self._send(conn, {
+                    'type': 'run',
+                    'job': job_id,
+                    'duration': duration,
+                    'rate': rate / count if rate else None,
+                    # Worker i starts i/rate in, so uniform schedules interleave
+                    'offset': index / rate if rate and arrival == 'uniform' else 0,
+                    'arrival': arrival,
+                    'users': user_split[index],
+                    'think_time': think_time,
+                    'mix': next_request.for_worker(index),
+                })
+
+            cancelled = False
+            while not job['done'].wait(0.25):
+                if not cancelled and should_continue is not None and not should_continue():
+                    cancelled = True
+                    for conn in conns:
+                        try:
+                            self._send(conn, {'type': 'cancel', 'job': job_id})
+                        except (OSError, ValueError):
+                            pass
+        finally:
+            with self._jobs_lock:
+                self._jobs.pop(job_id, None)
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def close(self):
+        """Tell the workers to stop, then wait for local worker processes to exit."""
+        if self._closed:
+            return
+        self._closed = True
+        for conn in self._conns:
+            try:
+                self._send(conn, {'type': 'shutdown'})
+            except (OSError, ValueError):
+                pass
+        for process in self._processes:
+            process.join(timeout=10)
+            if process.is_alive():
+                process.terminate()
+        for conn in self._conns:
+            conn.close()
+        self._listener.close()
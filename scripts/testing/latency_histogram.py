@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+AI Resilience Monitor - Latency Histograms
+HDR-style log-linear histograms of request latency (integer milliseconds),
+with coordinated-omission correction against the intended send schedule.
+
+Values below 2 * 10**significant_figures are counted exactly; above that every
+bucket keeps `significant_figures` decimal digits of precision, so a histogram
+costs the same whether it holds ten samples or ten million.
+"""
+
+import math
+
+PERCENTILES = (50, 90, 99, 99.9)
+
+
+def percentile_label(percentile):
+    """50 -> 'p50', 99.9 -> 'p99_9'"""
+    return 'p' + f"{percentile:g}".replace('.', '_')
+
+
+class LatencyHistogram:
+    """
+    Counts of integer values from 0 to `highest` (larger values are clamped).
+
+    Bucket 0 holds 0 .. sub_bucket_count-1 at a resolution of 1. Bucket b
+    holds the next power-of-two range at a resolution of 2**b, using the upper
+    half of its sub-buckets only, as in HdrHistogram.
+    """
+
+    def __init__(self, highest=3600000, significant_figures=3):
+        if not 1 <= significant_figures <= 5:
+            raise ValueError("significant_figures must be between 1 and 5")
+        self.highest = highest
+        self.significant_figures = significant_figures
+        self._sub_bucket_magnitude = math.ceil(math.log2(2 * 10 ** significant_figures))
+        self._sub_bucket_count = 1 << self._sub_bucket_magnitude
+        self._sub_bucket_half = self._sub_bucket_count // 2
+
+        self._counts = {}
+        self.total = 0
+        self.min = None
+        self.max = None
+        self._sum = 0
+
+    # ------------------------------------------------------------------
+    # Bucket arithmetic
+    # ------------------------------------------------------------------
+
+    def _index(self, value):
+        bucket = max(0, value.bit_length() - self._sub_bucket_magnitude)
+        if bucket == 0:
+            return value
+        return self._sub_bucket_count + (bucket - 1) * self._sub_bucket_half + ((value >> bucket) - self._sub_bucket_half)
+
+    def _value_range(self, index):
+        """(lowest, highest) value counted at `index`."""
+        if index < self._sub_bucket_count:
+            return index, index
+        bucket, offset = divmod(index - self._sub_bucket_count, self._sub_bucket_half)
+        bucket += 1
+        lowest = (self._sub_bucket_half + offset) << bucket
+        return lowest, lowest + (1 << bucket) - 1
+
+    # ------------------------------------------------------------------
+    # Recording
+    # ------------------------------------------------------------------
+
+    def record(self, value, count=1):
+        value = min(max(0, int(round(value))), self.highest)
+        index = self._index(value)
+        self._counts[index] = self._counts.get(index, 0) + count
+        self.total += count
+        self._sum += value * count
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def record_corrected(self, value, expected_interval):
+        """
+        Record `value`, plus the samples a sender that waits for each response
+        failed to take while this one was outstanding: value - interval,
+        value - 2*interval, ... down to `expected_interval`.
+        """
+        self.record(value)
+        if not expected_interval or expected_interval <= 0:
+            return
+        missing = value - expected_interval
+        while missing >= expected_interval:
+            self.record(missing)
+            missing -= expected_interval
+
+    def add(self, other):
+        """Merge another histogram with the same precision into this one."""
+        if other.significant_figures != self.significant_figures:
+            raise ValueError("Cannot merge histograms with different precision")
+        for index, count in other._counts.items():
+            self._counts[index] = self._counts.get(index, 0) + count
+        self.total += other.total
+        self._sum += other._sum
+        if other.total:
+            self.min = other.min if self.min is None else min(self.min, other.min)
+            self.max = other.max if self.max is None else max(self.max, other.max)
+        return self
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    @property
+    def mean(self):
+        return self._sum / self.total if self.total else 0
+
+    def value_at_percentile(self, percentile):
+        """Highest value equivalent to the given percentile (0-100); 0 when empty."""
+        if not self.total:
+            return 0
+        target = max(1, math.ceil(percentile / 100 * self.total))
+        running = 0
+        for index in sorted(self._counts):
+            running += self._counts[index]
+            if running >= target:
+                return min(self._value_range(index)[1], self.max)
+        return self.max
+
+    def percentiles(self, percentiles=PERCENTILES):
+        """{'p50': ..., 'p90': ..., 'p99': ..., 'p99_9': ...}"""
+        return {percentile_label(p): self.value_at_percentile(p) for p in percentiles}
+
+    def summary(self):
+        return {
+            'count': self.total,
+            'min': self.min or 0,
+            'mean': round(self.mean, 2),
+            'max': self.max or 0,
+            **self.percentiles(),
+        }
+
+
+class LatencyRecorder:
+    """
+    Separate success and failure histograms for one experiment.
+
+    Latency is measured from the intended send time (the engine's latency plus
+    its send lag), which corrects an open-loop schedule for coordinated
+    omission. For closed-loop pacing, pass the per-user `expected_interval_ms`
+    so each slow response also records the requests it held back.
+    """
+
+    def __init__(self, expected_interval_ms=None, significant_figures=3):
+        self.expected_interval_ms = expected_interval_ms
+        self.success = LatencyHistogram(significant_figures=significant_figures)
+        self.failure = LatencyHistogram(significant_figures=significant_figures)
+
+    def record(self, result):
+        latency = result['latency'] + result.get('send_lag_ms', 0)
+        histogram = self.success if result['success'] else self.failure
+        if self.expected_interval_ms:
+            histogram.record_corrected(latency, self.expected_interval_ms)
+        else:
+            histogram.record(latency)
+
+    def add(self, other):
+        self.success.add(other.success)
+        self.failure.add(other.failure)
+        return self
@@ -0,0 +1,369 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+AI Resilience Monitor - Asynchronous Load Engine
+Keeps many /ai requests in flight over one pooled HTTP client. The asyncio
+event loop runs in a background thread so ChaosTestRunner's synchronous
+scenarios can drive it.
+
+Uses aiohttp (listed in requirements.txt). Without it, requests run through a
+pooled requests.Session on a thread pool, which caps in-flight requests at
+FALLBACK_MAX_THREADS.
+"""
+
+import asyncio
+import functools
+import json
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+FALLBACK_MAX_THREADS = 256
+
+ARRIVAL_PROCESSES = ('uniform', 'poisson')
+
+
+class RequestTimeout(Exception):
+    """An HTTP request exceeded the engine's timeout."""
+
+
+class RequestMix:
+    """
+    Picklable (service, prompt) source for the load patterns: services in random
+    or round-robin order, prompts at random. Worker processes get their own copy
+    through for_worker().
+    """
+
+    def __init__(self, services, prompts, order='random', offset=0, seed=None):
+        if order not in ('random', 'round_robin'):
+            raise ValueError(f"Unknown order '{order}', expected 'random' or 'round_robin'")
+        self.services = list(services)
+        self.prompts = list(prompts)
+        self.order = order
+        self.offset = offset
+        self._count = 0
+        self._rng = random.Random(seed)
+
+    def __call__(self):
+        if self.order == 'round_robin':
+            service = self.services[(self.offset + self._count) % len(self.services)]
+            self._count += 1
+        else:
+            service = self._rng.choice(self.services)
+        return service, self._rng.choice(self.prompts)
+
+    def for_worker(self, index):
+        """Copy for worker `index`: round-robin staggered by index, independent random stream."""
+        return RequestMix(self.services, self.prompts, self.order, offset=self.offset + index)
+
+
+async def _maybe_await(value):
+    if asyncio.iscoroutine(value):
+        return await value
+    return value
+
+
+class LoadEngine:
+    """
+    Pooled asynchronous HTTP client plus the load patterns the runner uses.
+
+    Call start() once, then drive coroutines from any thread with run().
+    Callbacks passed to the load patterns run on the engine's event loop
+    thread, one at a time, so they may update shared counters without locks.
+    """
+
+    def __init__(self, base_url, timeout=30, max_in_flight=1000, verbose=True):
+        self.base_url = base_url
+        self.timeout = timeout
+        self.max_in_flight = max_in_flight
+        self.verbose = verbose
+
+        self.requests_sent = 0
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+        self._loop = None
+        self._thread = None
+        self._session = None
+        self._executor = None
+        self._semaphore = None
+        # Converts loop (monotonic) timestamps to wall-clock epoch seconds
+        self._wall_offset = time.time() - time.monotonic()
+
+    @property
+    def backend(self):
+        return 'aiohttp' if aiohttp is not None else 'requests-threadpool'
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def start(self):
+        """Start the event loop thread and open the HTTP connection pool."""
+        if self._loop is not None:
+            return self
+        self._loop = asyncio.new_event_loop()
+        ready = threading.Event()
+
+        def run_loop():
+            asyncio.set_event_loop(self._loop)
+            self._loop.call_soon(ready.set)
+            self._loop.run_forever()
+
+        self._thread = threading.Thread(target=run_loop, name='load-engine', daemon=True)
+        self._thread.start()
+        ready.wait()
+        self.run(self._open())
+        return self
+
+    async def _open(self):
+        self._semaphore = asyncio.Semaphore(self.max_in_flight)
+        if aiohttp is not None:
+            connector = aiohttp.TCPConnector(limit=self.max_in_flight, limit_per_host=self.max_in_flight,
+                                             ttl_dns_cache=300)
+            self._session = aiohttp.ClientSession(connector=connector)
+        else:
+            pool_size = min(self.max_in_flight, FALLBACK_MAX_THREADS)
+            if self.max_in_flight > FALLBACK_MAX_THREADS:
+                print(f"⚠️ aiohttp is not installed: at most {FALLBACK_MAX_THREADS} of {self.max_in_flight} "
+                      f"requests can be in flight (pip install -r requirements.txt)", flush=True)
+            self._executor = ThreadPoolExecutor(max_workers=pool_size, thread_name_prefix='load-engine-http')
+            self._session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size)
+            self._session.mount('http://', adapter)
+            self._session.mount('https://', adapter)
+
+    def close(self):
+        """Close the connection pool and stop the event loop thread."""
+        if self._loop is None:
+            return
+        try:
+            self.run(self._close(), timeout=10)
+        finally:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(timeout=10)
+            if not self._thread.is_alive():
+                self._loop.close()
+            self._loop = None
+
+    async def _close(self):
+        if aiohttp is not None:
+            await self._session.close()
+        else:
+            self._session.close()
+            self._executor.shutdown(wait=False)
+
+    def run(self, coro, timeout=None):
+        """Run a coroutine on the engine loop and block until it finishes."""
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result(timeout)
+
+    # ------------------------------------------------------------------
+    # HTTP
+    # ------------------------------------------------------------------
+
+    async def request(self, method, path, payload=None, timeout=None):
+        """Return (status_code, body_bytes). Raises RequestTimeout or another exception on failure."""
+        url = f"{self.base_url}{path}"
+        timeout = timeout or self.timeout
+        if aiohttp is not None:
+            try:
+                async with self._session.request(method, url, json=payload,
+                                                 timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+                    return response.status, await response.read()
+            except asyncio.TimeoutError:
+                raise RequestTimeout(f"{method} {path} exceeded {timeout}s")
+
+        call = functools.partial(self._session.request, method, url, json=payload, timeout=timeout)
+        try:
+            response = await asyncio.get_running_loop().run_in_executor(self._executor, call)
+        except requests.exceptions.Timeout:
+            raise RequestTimeout(f"{method} {path} exceeded {timeout}s")
+        return response.status_code, response.content
+
+    async def get_json(self, path, timeout=5):
+        """GET a JSON document; {} on any failure."""
+        try:
+            status, body = await self.request('GET', path, timeout=timeout)
+            if status == 200:
+                return json.loads(body)
+        except Exception:
+            pass
+        return {}
+
+    def call_soon(self, callback, *args):
+        """Run callback(*args) on the engine loop thread, after callbacks already scheduled."""
+        self._loop.call_soon_threadsafe(callback, *args)
+
+    def wall_time(self, monotonic_time):
+        """Epoch seconds for a time.monotonic() reading."""
+        return monotonic_time + self._wall_offset
+
+    async def send_ai_request(self, service, prompt, intended_send=None):
+        """
+        Send one /ai request; returns the same result dict as the synchronous runner
+        plus intended_send/actual_send (epoch seconds), send_lag_ms and served_by
+        (the service named in the backend's reply, None if there was no reply).
+
+        `intended_send` is the time.monotonic() at which the request was scheduled;
+        it defaults to now. The actual send time is taken once an in-flight slot
+        is free, so time spent waiting on --max-in-flight shows up as send lag.
+        """
+        if intended_send is None:
+            intended_send = time.monotonic()
+        payload = {
+            'service': service,
+            'prompt': prompt
+        }
+
+        async with self._semaphore:
+            actual_send = time.monotonic()
+            timing = {
+                'intended_send': self.wall_time(intended_send),
+                'actual_send': self.wall_time(actual_send),
+                'send_lag_ms': max(0, int((actual_send - intended_send) * 1000)),
+            }
+            self.requests_sent += 1
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+            if self.verbose:
+                print(f"🔵 Request #{self.requests_sent} → {service.upper()} | Prompt: '{prompt[:50]}...'", flush=True)
+            start_time = time.perf_counter()
+            try:
+                status, body = await self.request('POST', '/ai', payload)
+            except RequestTimeout:
+                if self.verbose:
+                    print(f"⏱️ TIMEOUT | {service.upper()} | Request exceeded {self.timeout}s", flush=True)
+                return {
+                    'success': False,
+                    'latency': self.timeout * 1000,
+                    'error_type': 'Timeout',
+                    'response_size': 0,
+                    'served_by': None,
+                    **timing
+                }
+            except Exception as e:
+                if self.verbose:
+                    print(f"❌ EXCEPTION | {service.upper()} | Error: {str(e)}", flush=True)
+                return {
+                    'success': False,
+                    'latency': 0,
+                    'error_type': str(e) or type(e).__name__,
+                    'response_size': 0,
+                    'served_by': None,
+                    **timing
+                }
+            finally:
+                self.in_flight -= 1
+
+        latency = int((time.perf_counter() - start_time) * 1000)  # milliseconds
+        success = status == 200
+        error_type = None
+        try:
+            data = json.loads(body)
+            served_by = data.get('service')
+            if not success:
+                error_type = data.get('error', 'Unknown')
+        except (ValueError, AttributeError):
+            served_by = None
+            if not success:
+                error_type = f"HTTP {status}"
+
+        if self.verbose:
+            if success:
+                print(f"✅ SUCCESS | {service.upper()} | Latency: {latency}ms | Response: {len(body)} bytes", flush=True)
+            else:
+                print(f"❌ FAILED | {service.upper()} | Latency: {latency}ms | Error: {error_type}", flush=True)
+
+        return {
+            'success': success,
+            'latency': latency,
+            'error_type': error_type,
+            'response_size': len(body) if success else 0,
+            'served_by': served_by,
+            **timing
+        }
+
+    # ------------------------------------------------------------------
+    # Load patterns
+    # ------------------------------------------------------------------
+
+    async def closed_loop(self, duration, next_request, on_result, think_time=0, users=1, should_continue=None):
+        """
+        Run `users` virtual users for `duration` seconds. Each one sends a
+        request, waits for the answer, calls on_result(service, result) and
+        then sleeps think_time (seconds, or a callable of its request count).
+        """
+        end_time = time.monotonic() + duration
+
+        def keep_going():
+            return time.monotonic() < end_time and (should_continue is None or should_continue())
+
+        async def user():
+            count = 0
+            while keep_going():
+                service, prompt = next_request()
+                result = await self.send_ai_request(service, prompt)
+                count += 1
+                await _maybe_await(on_result(service, result))
+                delay = think_time(count) if callable(think_time) else think_time
+                if delay and keep_going():
+                    await asyncio.sleep(min(delay, max(0, end_time - time.monotonic())))
+
+        await asyncio.gather(*(user() for _ in range(max(1, users))))
+
+    async def burst(self, batch, on_result):
+        """Send every (service, prompt) in `batch` at once and wait for all of them."""
+        async def one(service, prompt):
+            result = await self.send_ai_request(service, prompt)
+            await _maybe_await(on_result(service, result))
+            return result
+
+        return await asyncio.gather(*(one(service, prompt) for service, prompt in batch))
+
+    async def open_loop(self, duration, rate, next_request, on_result, arrival='uniform',
+                        should_continue=None, rng=None, offset=0):
+        """
+        Issue requests on a fixed schedule for `duration` seconds, whether or not
+        earlier ones have answered, so a slow backend keeps receiving the offered
+        load. Arrivals are `rate` per second, evenly spaced ('uniform') or with
+        exponential gaps ('poisson'), the first one `offset` seconds in.
+        Returns the number of requests scheduled.
+        """
+        if arrival not in ARRIVAL_PROCESSES:
+            raise ValueError(f"Unknown arrival process '{arrival}', expected one of {ARRIVAL_PROCESSES}")
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        rng = rng or random.Random()
+        start = time.monotonic()
+        end_time = start + duration
+        pending = set()
+        scheduled = 0
+
+        async def one(service, prompt, intended_send):
+            result = await self.send_ai_request(service, prompt, intended_send=intended_send)
+            await _maybe_await(on_result(service, result))
+
+        intended_send = start + offset
+        while intended_send < end_time and (should_continue is None or should_continue()):
+            delay = intended_send - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            service, prompt = next_request()
+            task = asyncio.ensure_future(one(service, prompt, intended_send))
+            pending.add(task)
+            task.add_done_callback(pending.discard)
+            scheduled += 1
+            intended_send += rng.expovariate(rate) if arrival == 'poisson' else 1.0 / rate
+
+        if pending:
+            await asyncio.gather(*pending)
+        return scheduled
@@ -0,0 +1,569 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+AI Resilience Monitor - Mock Backend
+Stand-in for the Node backend (src/index.js) when benchmarking the chaos test
+runner itself: /test, /ai, /chaos/inject, /chaos/stop, /chaos/status,
+/circuit-breaker/status and /circuit-breaker/reset on a single asyncio HTTP
+server, with no providers, database or Node.js.
+
+Semantics follow src/index.js running without API keys (its simulation
+fallback): chaos is applied before the circuit breaker, so chaos errors fail
+the request without counting against the breaker; provider latency and the
+provider failure rate count as usual. The provider latency distribution and
+failure rate are configurable, and a seeded RNG makes chaos and provider
+outcomes reproducible for the same request order.
+
+Usage:
+  python mock_backend.py                                   # Node defaults on :3000
+  python mock_backend.py --latency fixed:5 --failure-rate 0 --seed 42
+  python mock_backend.py --latency lognormal:200:0.5 --breaker-timeout 2
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import multiprocessing
+import random
+import threading
+import time
+from datetime import datetime, timezone
+
+SERVICES = ('gemini', 'cohere', 'huggingface')
+BREAKER_NAMES = {'gemini': 'Gemini', 'cohere': 'Cohere', 'huggingface': 'HuggingFace'}
+CHAOS_TYPES = ('latency', 'failure', 'timeout', 'intermittent', 'unavailable', 'corruption')
+
+# name: parameters (milliseconds, except the lognormal sigma)
+LATENCY_DISTRIBUTIONS = {
+    'fixed': ('ms',),
+    'uniform': ('low', 'high'),
+    'normal': ('mean', 'stddev'),
+    'lognormal': ('median', 'sigma'),
+    'exponential': ('mean',),
+}
+
+HTTP_REASONS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 500: 'Internal Server Error'}
+
+
+class MockError(Exception):
+    """A request failure, reported as the Node backend's 500 JSON body."""
+
+
+def now_ms():
+    return int(time.time() * 1000)
+
+
+def iso(ms):
+    """JavaScript Date.toISOString() for epoch milliseconds."""
+    return datetime.fromtimestamp(ms / 1000, timezone.utc).isoformat(timespec='milliseconds').replace('+00:00', 'Z')
+
+
+def js_int(value, default):
+    """parseInt(value) || default"""
+    try:
+        number = int(float(value))
+    except (TypeError, ValueError):
+        return default
+    return number or default
+
+
+class LatencyDistribution:
+    """
+    Provider latency from a 'name:param[:param]' spec, in milliseconds:
+    fixed:MS, uniform:LOW:HIGH, normal:MEAN:STDDEV, lognormal:MEDIAN:SIGMA,
+    exponential:MEAN. Samples are never negative.
+    """
+
+    def __init__(self, spec):
+        name, *params = spec.split(':')
+        if name not in LATENCY_DISTRIBUTIONS:
+            raise ValueError(f"Unknown latency distribution '{name}', expected one of "
+                             f"{', '.join(LATENCY_DISTRIBUTIONS)}")
+        expected = LATENCY_DISTRIBUTIONS[name]
+        if len(params) != len(expected):
+            raise ValueError(f"'{name}' takes {len(expected)} parameter(s): {name}:{':'.join(p.upper() for p in expected)}")
+        self.spec = spec
+        self.name = name
+        self.params = [float(p) for p in params]
+
+    def sample(self, rng):
+        """One latency in seconds."""
+        p = self.params
+        if self.name == 'fixed':
+            ms = p[0]
+        elif self.name == 'uniform':
+            ms = rng.uniform(p[0], p[1])
+        elif self.name == 'normal':
+            ms = rng.gauss(p[0], p[1])
+        elif self.name == 'lognormal':
+            ms = rng.lognormvariate(math.log(p[0]), p[1]) if p[0] > 0 else 0
+        else:
+            ms = rng.expovariate(1 / p[0]) if p[0] > 0 else 0
+        return max(0.0, ms) / 1000
+
+
+class CircuitBreaker:
+    """Port of the Node backend's CircuitBreaker, with its per-service settings."""
+
+    def __init__(self, name, failure_threshold=3, success_threshold=2, timeout=20.0):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.success_threshold = success_threshold
+        self.timeout_ms = int(timeout * 1000)
+
+        self.state = 'CLOSED'
+        self.failure_count = 0
+        self.consecutive_successes = 0
+        self.last_failure_time = None
+        self.last_state_change = now_ms()
+        self.state_history = []
+
+        self.metrics = {
+            'totalCalls': 0,
+            'successfulCalls': 0,
+            'failedCalls': 0,
+            'rejectedCalls': 0,
+            'stateTransitions': {'CLOSED->OPEN': 0, 'OPEN->HALF_OPEN': 0,
+                                 'HALF_OPEN->CLOSED': 0, 'HALF_OPEN->OPEN': 0},
+            'timeInStates': {'CLOSED': 0, 'OPEN': 0, 'HALF_OPEN': 0},
+            'lastTransitionTime': None,
+        }
+
+    def before_call(self):
+        """Count the call; raise MockError if the breaker rejects it."""
+        self.metrics['totalCalls'] += 1
+        if self.state == 'OPEN':
+            since_failure = now_ms() - self.last_failure_time
+            if since_failure >= self.timeout_ms:
+                self.transition_to('HALF_OPEN')
+            else:
+                self.metrics['rejectedCalls'] += 1
+                wait = math.ceil((self.timeout_ms - since_failure) / 1000)
+                raise MockError(f"⛔ Circuit breaker [{self.name}] is OPEN. Retry in {wait}s")
+
+    def on_success(self):
+        self.metrics['successfulCalls'] += 1
+        self.consecutive_successes += 1
+        if self.state == 'HALF_OPEN':
+            if self.consecutive_successes >= self.success_threshold:
+                self.transition_to('CLOSED')
+                self.failure_count = 0
+                self.consecutive_successes = 0
+        elif self.state == 'CLOSED':
+            self.failure_count = 0
+
+    def on_failure(self):
+        self.metrics['failedCalls'] += 1
+        self.failure_count += 1
+        self.consecutive_successes = 0
+        self.last_failure_time = now_ms()
+        if self.state == 'HALF_OPEN':
+            self.transition_to('OPEN')
+        elif self.state == 'CLOSED' and self.failure_count >= self.failure_threshold:
+            self.transition_to('OPEN')
+
+    def transition_to(self, new_state):
+        old_state = self.state
+        if old_state == new_state:
+            return
+        at = now_ms()
+        self.metrics['timeInStates'][old_state] += at - self.last_state_change
+        self.state = new_state
+        self.last_state_change = at
+        self.metrics['lastTransitionTime'] = at
+        transition = f"{old_state}->{new_state}"
+        if transition in self.metrics['stateTransitions']:
+            self.metrics['stateTransitions'][transition] += 1
+        self.state_history.append({'from': old_state, 'to': new_state, 'timestamp': at,
+                                   'reason': self.transition_reason(old_state, new_state)})
+        del self.state_history[:-10]
+
+    def transition_reason(self, from_state, to_state):
+        if (from_state, to_state) == ('CLOSED', 'OPEN'):
+            return f"Failure threshold reached ({self.failure_count}/{self.failure_threshold})"
+        if (from_state, to_state) == ('OPEN', 'HALF_OPEN'):
+            return f"Timeout expired ({self.timeout_ms}ms), testing recovery"
+        if (from_state, to_state) == ('HALF_OPEN', 'CLOSED'):
+            return f"Success threshold reached ({self.consecutive_successes}/{self.success_threshold})"
+        if (from_state, to_state) == ('HALF_OPEN', 'OPEN'):
+            return "Failure during recovery test"
+        return 'Unknown'
+
+    def status(self):
+        total = self.metrics['totalCalls']
+        return {
+            'name': self.name,
+            'state': self.state,
+            'failureCount': self.failure_count,
+            'consecutiveSuccesses': self.consecutive_successes,
+            'failureThreshold': self.failure_threshold,
+            'successThreshold': self.success_threshold,
+            'timeInCurrentState': now_ms() - self.last_state_change,
+            'lastFailureTime': self.last_failure_time,
+            'metrics': {
+                **self.metrics,
+                'successRate': f"{self.metrics['successfulCalls'] / total * 100:.2f}" if total else 0,
+                'rejectionRate': f"{self.metrics['rejectedCalls'] / total * 100:.2f}" if total else 0,
+            },
+            'stateHistory': self.state_history[-5:],
+        }
+
+    def reset(self):
+        self.state = 'CLOSED'
+        self.failure_count = 0
+        self.consecutive_successes = 0
+        self.last_failure_time = None
+        self.last_state_change = now_ms()
+
+
+class MockBackend:
+    """
+    The mock server. Either await serve() on your own loop, call start() to
+    run it on a background thread, or use start_process() to keep it off the
+    caller's GIL entirely.
+    """
+
+    def __init__(self, host='127.0.0.1', port=3000, latency='uniform:500:2500', failure_rate=0.1,
+                 seed=None, breaker_timeout=20.0, failure_threshold=3, success_threshold=2):
+        self.host = host
+        self.port = port
+        self.latency = LatencyDistribution(latency)
+        self.failure_rate = failure_rate
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.started_at = now_ms()
+        self.requests_served = 0
+
+        self.breakers = {service: CircuitBreaker(BREAKER_NAMES[service], failure_threshold,
+                                                 success_threshold, breaker_timeout)
+                         for service in SERVICES}
+        self.chaos = {service: self._no_chaos() for service in SERVICES}
+
+        self._routes = {
+            ('GET', '/test'): self.test,
+            ('POST', '/ai'): self.ai,
+            ('POST', '/chaos/inject'): self.chaos_inject,
+            ('POST', '/chaos/stop'): self.chaos_stop,
+            ('GET', '/chaos/status'): self.chaos_status,
+            ('GET', '/circuit-breaker/status'): self.breaker_status,
+            ('POST', '/circuit-breaker/reset'): self.breaker_reset,
+        }
+        self._server = None
+        self._loop = None
+        self._task = None
+        self._thread = None
+
+    @property
+    def url(self):
+        return f"http://{self.host}:{self.port}"
+
+    @staticmethod
+    def _no_chaos():
+        return {'type': None, 'intensity': 0, 'endTime': None, 'startTime': None}
+
+    # ------------------------------------------------------------------
+    # Endpoints
+    # ------------------------------------------------------------------
+
+    async def test(self, body):
+        return 200, {
+            'status': 'OK',
+            'timestamp': iso(now_ms()),
+            'uptime': now_ms() - self.started_at,
+            'chaos_active': any(chaos['type'] is not None for chaos in self.chaos.values()),
+        }
+
+    async def ai(self, body):
+        start = time.monotonic()
+        service = body.get('service') or 'gemini'
+        try:
+            prompt = body.get('prompt')
+            if not prompt:
+                raise MockError('Prompt is required')
+            # Chaos runs before (and outside) the circuit breaker, as in the Node backend
+            await self.apply_chaos(service)
+            breaker = self.breakers.get(service)
+            if breaker is None:
+                raise MockError(f"Unknown service: {service}")
+            breaker.before_call()
+            try:
+                response = await self.call_provider(service, prompt)
+            except MockError:
+                breaker.on_failure()
+                raise
+            breaker.on_success()
+            return 200, {
+                'success': True,
+                'service': service,
+                'response': response,
+                'latency': int((time.monotonic() - start) * 1000),
+                'isRealAPI': False,
+                'timestamp': iso(now_ms()),
+            }
+        except MockError as e:
+            return 500, {
+                'success': False,
+                'error': str(e),
+                'service': service,
+                'latency': int((time.monotonic() - start) * 1000),
+                'timestamp': iso(now_ms()),
+            }
+
+    async def apply_chaos(self, service):
+        chaos = self.chaos.get(service)
+        if not chaos or not chaos['type'] or not chaos['endTime']:
+            return
+        if now_ms() > chaos['endTime']:
+            self.chaos[service] = self._no_chaos()
+            return
+
+        chaos_type, intensity = chaos['type'], chaos['intensity']
+        if chaos_type == 'latency':
+            await asyncio.sleep(min(intensity, 10000) / 1000)
+        elif chaos_type == 'failure':
+            if self.rng.random() * 100 < intensity:
+                raise MockError(f"Chaos: Simulated {service} failure")
+        elif chaos_type == 'timeout':
+            await asyncio.sleep(min(intensity * 30, 3000) / 1000)
+            raise MockError(f"Chaos: Request timeout for {service}")
+        elif chaos_type == 'intermittent':
+            if self.rng.random() * 100 < intensity:
+                raise MockError(f"Chaos: Intermittent failure for {service}")
+        elif chaos_type == 'unavailable':
+            raise MockError(f"Chaos: {service} is unavailable")
+        # corruption is applied to the provider's response
+
+    async def call_provider(self, service, prompt):
+        """The simulated provider: configurable latency, then failure_rate errors."""
+        await asyncio.sleep(self.latency.sample(self.rng))
+        if self.rng.random() < self.failure_rate:
+            raise MockError(f"Simulated {service} service failure")
+        response = f'Simulated {service} response for: "{prompt}"'
+        chaos = self.chaos[service]
+        if chaos['type'] == 'corruption' and now_ms() < chaos['endTime']:
+            response = f"{{CORRUPTED_DATA: {self.rng.random()}, original_length: {len(response)}}}"
+        return response
+
+    async def chaos_inject(self, body):
+        service, chaos_type = body.get('service'), body.get('type')
+        if service not in SERVICES:
+            return 400, {'success': False, 'error': 'Invalid service. Must be gemini, cohere, or huggingface'}
+        if chaos_type not in CHAOS_TYPES:
+            return 400, {'success': False, 'error': f"Invalid chaos type. Must be one of: {', '.join(CHAOS_TYPES)}"}
+        intensity = js_int(body.get('intensity'), 50)
+        duration = js_int(body.get('duration'), 30)
+        if not 0 <= intensity <= 10000:
+            return 400, {'success': False, 'error': 'Intensity must be between 0 and 10000'}
+        if not 1 <= duration <= 300:
+            return 400, {'success': False, 'error': 'Duration must be between 1 and 300 seconds'}
+
+        start = now_ms()
+        end = start + duration * 1000
+        self.chaos[service] = {'type': chaos_type, 'intensity': intensity, 'startTime': start, 'endTime': end}
+        return 200, {
+            'success': True,
+            'experiment': {'service': service, 'type': chaos_type, 'intensity': intensity,
+                           'duration': duration, 'startTime': iso(start), 'endTime': iso(end)},
+        }
+
+    async def chaos_stop(self, body):
+        service = body.get('service')
+        if service not in SERVICES + ('all',):
+            return 400, {'success': False, 'error': 'Invalid service. Must be gemini, cohere, huggingface, or all'}
+        if service == 'all':
+            for name in SERVICES:
+                self.chaos[name] = self._no_chaos()
+            return 200, {'success': True, 'message': 'All chaos experiments stopped'}
+        if self.chaos[service]['type']:
+            self.chaos[service] = self._no_chaos()
+            return 200, {'success': True, 'message': f"Chaos experiment stopped for {service}"}
+        return 200, {'success': True, 'message': f"No active chaos for {service}"}
+
+    async def chaos_status(self, body):
+        now = now_ms()
+        active = [{
+            'service': service,
+            'type': chaos['type'],
+            'intensity': chaos['intensity'],
+            'remainingSeconds': math.ceil((chaos['endTime'] - now) / 1000),
+            'startTime': iso(chaos['startTime']),
+            'endTime': iso(chaos['endTime']),
+        } for service, chaos in self.chaos.items() if chaos['type'] and chaos['endTime'] and now < chaos['endTime']]
+        return 200, {'success': True, 'active': active, 'count': len(active)}
+
+    async def breaker_status(self, body):
+        return 200, {service: breaker.status() for service, breaker in self.breakers.items()}
+
+    async def breaker_reset(self, body):
+        service = body.get('service')
+        if service and service in self.breakers:
+            self.breakers[service].reset()
+            return 200, {'success': True, 'message': f"Circuit breaker for {service} reset successfully",
+                         'state': self.breakers[service].state}
+        if not service:
+            for breaker in self.breakers.values():
+                breaker.reset()
+            return 200, {'success': True, 'message': 'All circuit breakers reset successfully'}
+        return 400, {'error': 'Invalid service name'}
+
+    # ------------------------------------------------------------------
+    # HTTP
+    # ------------------------------------------------------------------
+
+    async def dispatch(self, method, path, raw_body):
+        handler = self._routes.get((method, path))
+        if handler is None:
+            return 404, {'error': f"Cannot {method} {path}"}
+        try:
+            body = json.loads(raw_body) if raw_body else {}
+        except ValueError:
+            return 400, {'error': 'Invalid JSON body'}
+        if not isinstance(body, dict):
+            body = {}
+        self.requests_served += 1
+        return await handler(body)
+
+    async def _handle_connection(self, reader, writer):
+        """Minimal HTTP/1.1 with keep-alive: enough for requests and aiohttp clients."""
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b'\r\n\r\n')
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                    return
+                lines = head.decode('latin-1').split('\r\n')
+                try:
+                    method, target, version = lines[0].split(' ', 2)
+                except ValueError:
+                    return
+                headers = {}
+                for line in lines[1:]:
+                    name, sep, value = line.partition(':')
+                    if sep:
+                        headers[name.strip().lower()] = value.strip()
+                length = int(headers.get('content-length') or 0)
+                body = await reader.readexactly(length) if length else b''
+
+                status, payload = await self.dispatch(method, target.split('?', 1)[0], body)
+                data = json.dumps(payload).encode()
+                keep_alive = version == 'HTTP/1.1' and headers.get('connection', '').lower() != 'close'
+                writer.write(
+                    f"HTTP/1.1 {status} {HTTP_REASONS.get(status, '')}\r\n"
+                    f"Content-Type: application/json; charset=utf-8\r\n"
+                    f"Content-Length: {len(data)}\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode('latin-1') + data
+                )
+                await writer.drain()
+                if not keep_alive:
+                    return
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    async def serve(self, ready=None):
+        """Serve until cancelled. `ready` is called with the bound port."""
+        self._server = await asyncio.start_server(self._handle_connection, self.host, self.port,
+                                                  backlog=1024, reuse_address=True)
+        self.port = self._server.sockets[0].getsockname()[1]
+        if ready is not None:
+            ready(self.port)
+        async with self._server:
+            await self._server.serve_forever()
+
+    def start(self):
+        """Serve on a background thread; returns once the port is bound."""
+        bound = threading.Event()
+        self._loop = asyncio.new_event_loop()
+
+        def run():
+            asyncio.set_event_loop(self._loop)
+            self._task = self._loop.create_task(self.serve(ready=lambda port: bound.set()))
+            try:
+                self._loop.run_until_complete(self._task)
+            except asyncio.CancelledError:
+                pass
+
+        self._thread = threading.Thread(target=run, name='mock-backend', daemon=True)
+        self._thread.start()
+        if not bound.wait(10):
+            raise RuntimeError(f"Mock backend did not start on {self.host}:{self.port}")
+        return self
+
+    def stop(self):
+        if self._thread is None:
+            return
+        self._loop.call_soon_threadsafe(self._task.cancel)
+        self._thread.join(timeout=5)
+        self._thread = None
+
+
+def _serve_in_process(conn, options):
+    backend = MockBackend(**options)
+    asyncio.run(backend.serve(ready=conn.send))
+
+
+def start_process(**options):
+    """
+    Run a MockBackend in its own process (port=0 picks a free port).
+    Returns (process, url); terminate() the process when done.
+    """
+    options.setdefault('port', 0)
+    LatencyDistribution(options.get('latency', 'uniform:500:2500'))  # raise ValueError here, not in the child
+    parent, child = multiprocessing.Pipe(duplex=False)
+    context = multiprocessing.get_context('spawn')
+    process = context.Process(target=_serve_in_process, args=(child, options), name='mock-backend', daemon=True)
+    process.start()
+    deadline = time.monotonic() + 15
+    while not parent.poll(0.1):
+        if not process.is_alive() or time.monotonic() > deadline:
+            process.terminate()
+            raise RuntimeError("Mock backend process did not start")
+    port = parent.recv()
+    return process, f"http://{options.get('host', '127.0.0.1')}:{port}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description='AI Resilience Monitor - Mock Backend for chaos test benchmarking')
+    parser.add_argument('--host', default='127.0.0.1', help='Address to listen on (default: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=3000, help='Port to listen on (default: 3000, the Node backend\'s)')
+    parser.add_argument('--latency', default='uniform:500:2500',
+                        help='Provider latency in ms: fixed:MS, uniform:LOW:HIGH, normal:MEAN:STDDEV, '
+                             'lognormal:MEDIAN:SIGMA or exponential:MEAN (default: uniform:500:2500, as in src/index.js)')
+    parser.add_argument('--failure-rate', type=float, default=0.1,
+                        help='Fraction of provider calls that fail (default: 0.1)')
+    parser.add_argument('--seed', type=int, default=None, help='Seed for latency, failure and chaos outcomes')
+    parser.add_argument('--breaker-timeout', type=float, default=20.0,
+                        help='Seconds an OPEN circuit breaker waits before HALF_OPEN (default: 20)')
+    parser.add_argument('--failure-threshold', type=int, default=3,
+                        help='Consecutive failures that open a circuit breaker (default: 3)')
+    parser.add_argument('--success-threshold', type=int, default=2,
+                        help='Successes in HALF_OPEN that close a circuit breaker (default: 2)')
+    args = parser.parse_args()
+
+    try:
+        backend = MockBackend(host=args.host, port=args.port, latency=args.latency,
+                              failure_rate=args.failure_rate, seed=args.seed,
+                              breaker_timeout=args.breaker_timeout,
+                              failure_threshold=args.failure_threshold,
+                              success_threshold=args.success_threshold)
+    except ValueError as e:
+        parser.error(str(e))
+
+    def ready(port):
+        print(f"🧪 Mock backend listening on http://{args.host}:{port} "
+              f"(latency {args.latency}, failure rate {args.failure_rate:g}, seed {args.seed})", flush=True)
+
+    try:
+        asyncio.run(backend.serve(ready=ready))
+    except KeyboardInterrupt:
+        print(f"\n🛑 Mock backend stopped after {backend.requests_served} requests", flush=True)
+
+
+if __name__ == '__main__':
+    main()
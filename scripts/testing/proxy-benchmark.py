@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+AI Resilience Monitor - /ai Proxy Streaming Benchmark
+Compares the buffered /ai proxy (decode + jsonify) with streaming pass-through,
+measuring time-to-first-byte and total time as the response size grows.
+Runs the dashboard app in-process against a synthetic upstream; no Node.js needed.
+"""
+
+import os
+import sys
+import time
+import json
+import csv
+import argparse
+import statistics
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+import requests
+from werkzeug.serving import make_server
+
+# Import the dashboard app from the project root
+PROJECT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+sys.path.insert(0, PROJECT_DIR)
+
+DEFAULT_SIZES_KB = [1, 16, 128, 1024, 8192]
+UPSTREAM_CHUNK_SIZE = 64 * 1024
+
+
+class SyntheticBackend(BaseHTTPRequestHandler):
+    """Answers POST /ai with a JSON body of `size_kb` KB, written in chunks."""
+
+    protocol_version = 'HTTP/1.1'
+    chunk_delay = 0.0
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_POST(self):
+        request = json.loads(self.rfile.read(int(self.headers.get('Content-Length', 0))) or b'{}')
+        size = int(request.get('size_kb', 1)) * 1024
+        body = json.dumps({
+            'success': True,
+            'service': request.get('service', 'gemini'),
+            'response': 'x' * size,
+            'latency': 0,
+        }).encode()
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        for offset in range(0, len(body), UPSTREAM_CHUNK_SIZE):
+            self.wfile.write(body[offset:offset + UPSTREAM_CHUNK_SIZE])
+            self.wfile.flush()
+            if self.chunk_delay:
+                time.sleep(self.chunk_delay)
+
+
+def start_server(server):
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server
+
+
+def measure(session, url, size_kb):
+    """Return (ttfb_ms, total_ms, bytes) for one proxied request."""
+    start = time.perf_counter()
+    response = session.post(url, json={'service': 'gemini', 'prompt': 'benchmark', 'size_kb': size_kb},
+                            stream=True, timeout=60)
+    chunks = response.iter_content(UPSTREAM_CHUNK_SIZE)
+    first = next(chunks, b'')
+    ttfb = time.perf_counter() - start
+    received = len(first) + sum(len(chunk) for chunk in chunks)
+    total = time.perf_counter() - start
+    response.raise_for_status()
+    return ttfb * 1000, total * 1000, received
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark buffered vs. streaming /ai proxying')
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES_KB,
+                        help=f'Response sizes in KB (default: {DEFAULT_SIZES_KB})')
+    parser.add_argument('--repeat', type=int, default=20,
+                        help='Requests per size and mode (default: 20)')
+    parser.add_argument('--chunk-delay', type=float, default=0.0,
+                        help='Seconds the synthetic upstream pauses between 64KB chunks (default: 0)')
+    parser.add_argument('--output', help='Optional CSV file for the results')
+    args = parser.parse_args()
+
+    SyntheticBackend.chunk_delay = args.chunk_delay
+    upstream = start_server(ThreadingHTTPServer(('127.0.0.1', 0), SyntheticBackend))
+
+    import app as dashboard
+    dashboard.BACKEND_URL = f"http://127.0.0.1:{upstream.server_port}"
+    dashboard.ai_admission.configure(dashboard.AI_SERVICES, 64, 64, 30.0)
+    proxy = start_server(make_server('127.0.0.1', 0, dashboard.app, threaded=True))
+    base = f"http://127.0.0.1:{proxy.server_port}/ai"
+
+    modes = {'buffered': base, 'streaming': f"{base}?stream=1"}
+    session = requests.Session()
+    rows = []
+
+    print(f"{'size':>8} {'mode':>10} {'ttfb p50':>10} {'total p50':>10} {'total p95':>10}")
+    for size_kb in args.sizes:
+        for mode, url in modes.items():
+            measure(session, url, size_kb)  # warm-up
+            samples = [measure(session, url, size_kb) for _ in range(args.repeat)]
+            ttfb = [s[0] for s in samples]
+            total = sorted(s[1] for s in samples)
+            row = {
+                'size_kb': size_kb,
+                'mode': mode,
+                'bytes': samples[0][2],
+                'ttfb_p50_ms': round(statistics.median(ttfb), 2),
+                'total_p50_ms': round(statistics.median(total), 2),
+                'total_p95_ms': round(total[min(len(total) - 1, int(len(total) * 0.95))], 2),
+            }
+            rows.append(row)
+            print(f"{str(size_kb) + 'KB':>8} {mode:>10} {row['ttfb_p50_ms']:>9}ms "
+                  f"{row['total_p50_ms']:>9}ms {row['total_p95_ms']:>9}ms", flush=True)
+
+    if args.output:
+        with open(args.output, 'w', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=list(rows[0].keys()))
+            writer.writeheader()
+            writer.writerows(rows)
+        print(f"📄 Results written to {args.output}")
+
+    proxy.shutdown()
+    upstream.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,2405 @@
+// Dashboard configuration and state
+const BACKEND_URL = '';
+const POLLING_INTERVAL = 5000; // 5 seconds
+let isConnected = false;
+let retryCount = 0;
+let pollingInterval = null;
+let previousMetrics = {
+    totalRequests: 0,
+    successRate: 100,
+    avgLatency: 0
+};
+
+// Configure axios with proper timeout and error handling
+const apiClient = axios.create({
+    baseURL: BACKEND_URL,
+    timeout: 8000,
+    headers: {
+        'Accept': 'application/json',
+        'Content-Type': 'application/json'
+    }
+});
+
+// Add response interceptor for global error handling
+apiClient.interceptors.response.use(
+    response => response,
+    error => {
+        console.error('API Error:', error.message);
+        updateConnectionStatus(false);
+        return Promise.reject(error);
+    }
+);
+
+// Update connection status indicator
+function updateConnectionStatus(connected) {
+    isConnected = connected;
+    const statusIndicator = document.getElementById('connectionStatus');
+    const statusDot = document.getElementById('statusDot');
+
+    if (connected) {
+        statusIndicator.innerHTML = '<div class="status-dot status-live"></div><span>Connected</span>';
+        statusIndicator.className = 'status-indicator status-connected';
+        retryCount = 0;
+    } else {
+        statusIndicator.innerHTML = '<div class="status-dot status-error"></div><span>Backend Offline</span>';
+        statusIndicator.className = 'status-indicator status-disconnected';
+    }
+}
+
+// Update metrics display with smooth animations
+function updateMetricsDisplay(data) {
+    // Validate and sanitize data
+    const totalRequests = parseInt(data.totalRequests) || 0;
+    const successRate = parseFloat(data.successRate) || 0;
+    const avgLatency = parseFloat(data.avgLatency) || 0;
+
+    // Update main metrics with change indicators
+    const totalEl = document.getElementById('totalRequests');
+    const rateEl = document.getElementById('successRate');
+    const latencyEl = document.getElementById('avgLatency');
+    const requestsChangeEl = document.getElementById('requestsChange');
+    const successChangeEl = document.getElementById('successChange');
+    const latencyChangeEl = document.getElementById('latencyChange');
+
+    if (totalEl) {
+        totalEl.textContent = totalRequests.toLocaleString();
+        const requestsDiff = totalRequests - previousMetrics.totalRequests;
+        if (requestsChangeEl && requestsDiff > 0) {
+            requestsChangeEl.textContent = `+${requestsDiff} from last refresh`;
+        }
+    }
+
+    if (rateEl) {
+        rateEl.textContent = `${successRate.toFixed(1)}%`;
+        if (successChangeEl) {
+            if (successRate >= 95) {
+                successChangeEl.textContent = 'Excellent performance';
+                successChangeEl.className = 'metric-change text-success';
+            } else if (successRate >= 85) {
+                successChangeEl.textContent = 'Good performance';
+                successChangeEl.className = 'metric-change text-warning';
+            } else {
+                successChangeEl.textContent = 'Degraded performance';
+                successChangeEl.className = 'metric-change text-error';
+            }
+        }
+    }
+
+    if (latencyEl) {
+        latencyEl.textContent = `${avgLatency.toFixed(0)}ms`;
+        if (latencyChangeEl) {
+            if (avgLatency < 200) {
+                latencyChangeEl.textContent = 'Excellent response time';
+                latencyChangeEl.className = 'metric-change text-success';
+            } else if (avgLatency < 500) {
+                latencyChangeEl.textContent = 'Good response time';
+                latencyChangeEl.className = 'metric-change text-warning';
+            } else {
+                latencyChangeEl.textContent = 'Slow response time';
+                latencyChangeEl.className = 'metric-change text-error';
+            }
+        }
+    }
+
+    // Update AI services status
+    if (data.aiServices) {
+        updateServiceStatus('gemini', data.aiServices.gemini);
+        updateServiceStatus('cohere', data.aiServices.cohere);
+        updateServiceStatus('huggingface', data.aiServices.huggingface);
+    }
+
+    // Update analytics with new data
+    updateAnalytics(data);
+
+    // Update timestamp
+    const timestampEl = document.getElementById('lastUpdated');
+    if (timestampEl) {
+        timestampEl.textContent = `Last updated: ${new Date().toLocaleTimeString()}`;
+    }
+
+    // Store current metrics for next comparison
+    previousMetrics = { totalRequests, successRate, avgLatency };
+}
+
+// Update individual service status
+function updateServiceStatus(serviceName, serviceData) {
+    const statusEl = document.getElementById(`${serviceName}-status`);
+    const requestsEl = document.getElementById(`${serviceName}-requests`);
+    const latencyEl = document.getElementById(`${serviceName}-latency`);
+
+    if (statusEl && serviceData) {
+        const statusDot = statusEl.querySelector('.status-dot');
+        const statusText = statusEl.querySelector('span');
+
+        if (serviceData.status === 'healthy') {
+            statusDot.className = 'status-dot bg-success';
+            statusText.textContent = 'Healthy (API Key OK)';
+            statusText.className = 'text-success';
+        } else if (serviceData.status === 'disabled') {
+            statusDot.className = 'status-dot bg-neutral-gray';
+            statusText.textContent = 'Disabled (Paid Service)';
+            statusText.className = 'text-secondary';
+        } else if (serviceData.status === 'not_configured') {
+            statusDot.className = 'status-dot bg-warning';
+            statusText.textContent = 'No API Key';
+            statusText.className = 'text-warning';
+        } else if (serviceData.status === 'error') {
+            statusDot.className = 'status-dot bg-error';
+            statusText.textContent = 'Error';
+            statusText.className = 'text-error';
+        } else {
+            statusDot.className = 'status-dot bg-warning';
+            statusText.textContent = 'Unknown';
+            statusText.className = 'text-warning';
+        }
+    }
+
+    if (requestsEl) {
+        requestsEl.textContent = (serviceData?.requests || 0).toLocaleString();
+    }
+
+    const failuresEl = document.getElementById(`${serviceName}-failures`);
+    if (failuresEl) {
+        const failures = serviceData?.failures || 0;
+        failuresEl.textContent = failures.toLocaleString();
+
+        // Color code failures - red if > 0, gray if 0
+        if (failures > 0) {
+            failuresEl.style.color = 'var(--error-red)';
+        } else {
+            failuresEl.style.color = 'var(--text-secondary)';
+        }
+    }
+
+    if (latencyEl) {
+        latencyEl.textContent = `${serviceData?.avgLatency || 0}ms`;
+    }
+}
+
+// Show offline state when backend is unavailable
+function showOfflineState() {
+    document.getElementById('totalRequests').textContent = 'N/A';
+    document.getElementById('successRate').textContent = 'N/A';
+    document.getElementById('avgLatency').textContent = 'N/A';
+
+    document.getElementById('requestsChange').textContent = 'Backend offline';
+    document.getElementById('successChange').textContent = 'Backend offline';
+    document.getElementById('latencyChange').textContent = 'Backend offline';
+
+    // Update all service cards to show offline status
+    ['gemini', 'cohere', 'huggingface'].forEach(service => {
+        const statusEl = document.getElementById(`${service}-status`);
+        if (statusEl) {
+            const statusDot = statusEl.querySelector('.status-dot');
+            const statusText = statusEl.querySelector('span');
+            statusDot.className = 'status-dot bg-error';
+            statusText.textContent = 'Backend Offline';
+            statusText.className = 'text-error';
+        }
+
+        const requestsEl = document.getElementById(`${service}-requests`);
+        const latencyEl = document.getElementById(`${service}-latency`);
+        if (requestsEl) requestsEl.textContent = 'N/A';
+        if (latencyEl) latencyEl.textContent = 'N/A';
+    });
+}
+
+// Fetch metrics from backend with retry logic
+// `prefetched` is the metrics section of /api/dashboard, when available
+async function fetchMetrics(prefetched) {
+    try {
+        console.log(`🔄 Fetching metrics... (attempt ${retryCount + 1})`);
+
+        const data = prefetched || (await apiClient.get('/metrics')).data;
+
+        // Validate response structure
+        if (!data || typeof data.totalRequests === 'undefined') {
+            throw new Error('Invalid response format from backend');
+        }
+
+        updateMetricsDisplay(data);
+        updateConnectionStatus(true);
+        retryCount = 0;
+
+        console.log('✅ Metrics updated successfully:', data);
+        return true;
+
+    } catch (error) {
+        console.error('❌ Failed to fetch metrics:', error.message);
+        updateConnectionStatus(false);
+
+        retryCount++;
+        if (retryCount >= 3) {
+            console.log('❌ Max retries reached. Showing offline state.');
+            showOfflineState();
+        }
+
+        return false;
+    }
+}
+
+// Start polling for metrics
+function startPolling() {
+    console.log('🔄 Starting real-time polling...');
+
+    // Clear any existing interval
+    if (pollingInterval) {
+        clearInterval(pollingInterval);
+    }
+
+    // Initial fetch
+    refreshDashboard();
+
+    // Set up recurring fetch
+    pollingInterval = setInterval(() => {
+        if (document.visibilityState === 'visible') {
+            refreshDashboard();
+        }
+    }, POLLING_INTERVAL);
+}
+
+// Refresh metrics, circuit breakers and chaos status in one round trip.
+// The server fans out to the backend concurrently; sections it could not
+// fetch come back null and are loaded individually instead.
+async function refreshDashboard() {
+    let data = null;
+    try {
+        data = (await apiClient.get('/api/dashboard')).data;
+    } catch (error) {
+        console.warn('⚠️ Aggregated dashboard fetch failed, using individual endpoints:', error.message);
+    }
+
+    fetchMetrics(data && data.metrics && !data.errors.metrics ? data.metrics : undefined);
+    updateCircuitBreakerStatus(data && data.circuitBreakers && !data.errors.circuitBreakers ? data.circuitBreakers : undefined);
+    if (data && data.chaos && !data.errors.chaos) {
+        updateActiveExperiments(data.chaos);
+    }
+}
+
+// Stop polling
+function stopPolling() {
+    if (pollingInterval) {
+        clearInterval(pollingInterval);
+        pollingInterval = null;
+    }
+}
+
+// Initialize dashboard when DOM is loaded
+document.addEventListener('DOMContentLoaded', function() {
+    console.log('🚀 AI Resilience Dashboard initializing...');
+
+    try {
+        // Initialize connection status
+        updateConnectionStatus(false);
+
+        // Set initial values to prevent undefined display
+        document.getElementById('totalRequests').textContent = '0';
+        document.getElementById('successRate').textContent = '100%';
+        document.getElementById('avgLatency').textContent = '0ms';
+
+        // Initialize analytics system
+        initializeAnalytics();
+
+        // Check chaos testing status on load
+        checkChaosTestingStatus();
+
+        // Refresh chaos test results
+        refreshChaosResults();
+
+        // Reset circuit breakers on page load to ensure fresh start
+        setTimeout(async () => {
+            try {
+                await axios.post('/circuit-breaker/reset', {});
+                console.log('🔄 Circuit breakers reset on startup');
+            } catch (err) {
+                console.log('⚠️ Could not reset circuit breakers:', err.message);
+            }
+        }, 500);
+
+        // Start polling with delay to ensure backend is ready
+        setTimeout(() => {
+            startPolling();
+        }, 1000);
+
+        // Handle page visibility changes
+        document.addEventListener('visibilitychange', () => {
+            if (document.visibilityState === 'visible') {
+                console.log('👁️ Tab became visible - resuming polling');
+                if (!pollingInterval) startPolling();
+            }
+        });
+
+        console.log('✅ Dashboard initialization complete');
+
+    } catch (error) {
+        console.error('❌ Dashboard initialization error:', error);
+        showOfflineState();
+    }
+});
+
+// Cleanup on page unload
+window.addEventListener('beforeunload', () => {
+    stopPolling();
+});
+
+// Handle errors globally
+window.addEventListener('error', (event) => {
+    console.error('Global error:', event.error);
+});
+
+// Handle unhandled promise rejections
+window.addEventListener('unhandledrejection', (event) => {
+    console.error('Unhandled promise rejection:', event.reason);
+});
+
+// ============================================================================
+// ANALYTICS AND AUTOMATION SYSTEM
+// ============================================================================
+
+// Version check - clear old data if version changed
+const DASHBOARD_VERSION = '2.0.3'; // Fixed timestamp Date conversion from localStorage
+const storedVersion = localStorage.getItem('dashboardVersion');
+if (storedVersion !== DASHBOARD_VERSION) {
+    console.log('🔄 Dashboard version changed, clearing old data...');
+    localStorage.removeItem('aiResilienceAnalytics');
+    localStorage.setItem('dashboardVersion', DASHBOARD_VERSION);
+}
+
+// Analytics data storage
+let analyticsData = {
+    requests: [],
+    performanceHistory: [],
+    serviceStats: {
+        gemini: { requests: 0, failures: 0, totalLatency: 0, recentLatencies: [], uptimeStart: Date.now(), lastFailure: null, lastFailureReason: null, recoveryTime: null },
+        cohere: { requests: 0, failures: 0, totalLatency: 0, recentLatencies: [], uptimeStart: Date.now(), lastFailure: null, lastFailureReason: null, recoveryTime: null },
+        huggingface: { requests: 0, failures: 0, totalLatency: 0, recentLatencies: [], uptimeStart: Date.now(), lastFailure: null, lastFailureReason: null, recoveryTime: null }
+    },
+    errorPatterns: {},
+    performanceTrends: {
+        latencyTrend: [],
+        successRateTrend: [],
+        trendAnalysis: 'stable'
+    }
+};
+
+// Automation state
+let automationState = {
+    running: false,
+    interval: null,
+    requestCount: 0,
+    intervalMs: 10000 // 10 seconds default
+};
+
+// Chart instances
+let charts = {
+    performance: null,
+    latency: null,
+    usage: null
+};
+
+// Sample prompts for automated requests
+const automationPrompts = [
+    "Explain quantum computing briefly",
+    "What is machine learning?",
+    "Describe artificial intelligence",
+    "How does blockchain work?",
+    "What are neural networks?",
+    "Explain cloud computing",
+    "What is data science?",
+    "Describe IoT technology",
+    "What is cybersecurity?",
+    "How does 5G work?"
+];
+
+// Available services for automation
+const availableServices = ['gemini', 'cohere', 'huggingface'];
+
+// Initialize analytics system
+function initializeAnalytics() {
+    console.log('🔧 Initializing analytics system...');
+
+    // Initialize charts
+    initializeCharts();
+
+    // Set up automation controls
+    setupAutomationControls();
+
+    // Load historical data from database
+    loadHistoricalData();
+
+    // Load any stored local data as fallback
+    loadStoredAnalytics();
+
+    console.log('✅ Analytics system initialized');
+}
+
+// Load historical data from database
+async function loadHistoricalData() {
+    try {
+        console.log('📚 Loading historical data from database...');
+
+        // Load recent requests (last 100) as columns: one array per field,
+        // with service/error_type as codes into per-column dictionaries
+        const historyFields = 'timestamp,service,success,latency,response_size,error_type,automated';
+        const historyResponse = await axios.get(
+            `/api/history/requests?limit=100&format=columnar&fields=${historyFields}`);
+        if (historyResponse.data.success && historyResponse.data.count > 0) {
+            console.log(`📥 Loaded ${historyResponse.data.count} historical requests`);
+
+            const { data, dictionaries, length } = historyResponse.data.requests;
+            const decode = (column, i) => {
+                const code = data[column][i];
+                return code === null ? null : dictionaries[column][code];
+            };
+
+            // Rows arrive newest first, so walk the columns backwards
+            for (let i = length - 1; i >= 0; i--) {
+                const service = decode('service', i);
+                const requestLog = {
+                    timestamp: new Date(data.timestamp[i]),
+                    service: service,
+                    success: data.success[i] === 1 || data.success[i] === true,
+                    latency: data.latency[i],
+                    responseSize: data.response_size[i] || 0,
+                    errorType: decode('error_type', i),
+                    isAutomated: data.automated[i] === 1 || data.automated[i] === true
+                };
+
+                // Add to history table
+                updateHistoryTable(requestLog);
+
+                // Update service stats
+                if (analyticsData.serviceStats[service]) {
+                    analyticsData.serviceStats[service].requests++;
+                    if (!requestLog.success) {
+                        analyticsData.serviceStats[service].failures++;
+                    } else {
+                        analyticsData.serviceStats[service].totalLatency += data.latency[i];
+                    }
+                }
+            }
+
+            // Update charts with historical data
+            updateCharts();
+        }
+
+        // Load database statistics
+        const statsResponse = await axios.get('/api/database/stats');
+        if (statsResponse.data.success) {
+            console.log('📊 Database stats:', statsResponse.data.statistics);
+        }
+
+    } catch (error) {
+        console.error('Failed to load historical data:', error);
+        // Continue with empty data
+    }
+}
+
+// Initialize all charts
+function initializeCharts() {
+    const chartConfig = {
+        responsive: true,
+        maintainAspectRatio: false,
+        plugins: {
+            legend: {
+                position: 'top',
+                labels: { font: { size: 11 } }
+            }
+        },
+        scales: {
+            x: { 
+                display: true,
+                grid: { color: '#e5e7eb' },
+                ticks: { font: { size: 10 } }
+            },
+            y: { 
+                display: true,
+                grid: { color: '#e5e7eb' },
+                ticks: { font: { size: 10 } }
+            }
+        }
+    };
+
+    // Performance Chart (Real-time response times)
+    const performanceCtx = document.getElementById('performanceChart').getContext('2d');
+    charts.performance = new Chart(performanceCtx, {
+        type: 'line',
+        data: {
+            labels: [],
+            datasets: [{
+                label: 'Avg Response Time (ms)',
+                data: [],
+                borderColor: '#2563eb',
+                backgroundColor: 'rgba(37, 99, 235, 0.1)',
+                tension: 0.4,
+                fill: true
+            }]
+        },
+        options: {
+            ...chartConfig,
+            scales: {
+                ...chartConfig.scales,
+                y: { 
+                    ...chartConfig.scales.y,
+                    beginAtZero: true,
+                    title: { display: true, text: 'Response Time (ms)' }
+                }
+            }
+        }
+    });
+
+    // Service Response Time Trends
+    const latencyCtx = document.getElementById('latencyChart').getContext('2d');
+    charts.latency = new Chart(latencyCtx, {
+        type: 'line',
+        data: {
+            labels: [], // Time labels
+            datasets: [
+                {
+                    label: 'Gemini',
+                    data: [],
+                    borderColor: '#10b981',
+                    backgroundColor: 'rgba(16, 185, 129, 0.1)',
+                    borderWidth: 2,
+                    fill: true,
+                    tension: 0.3,
+                    spanGaps: true
+                },
+                {
+                    label: 'Cohere', 
+                    data: [],
+                    borderColor: '#3b82f6',
+                    backgroundColor: 'rgba(59, 130, 246, 0.1)',
+                    borderWidth: 2,
+                    fill: true,
+                    tension: 0.3,
+                    spanGaps: true
+                },
+                {
+                    label: 'Hugging Face',
+                    data: [],
+                    borderColor: '#8b5cf6',
+                    backgroundColor: 'rgba(139, 92, 246, 0.1)',
+                    borderWidth: 2,
+                    fill: true,
+                    tension: 0.3,
+                    spanGaps: true
+                }
+            ]
+        },
+        options: {
+            responsive: true,
+            maintainAspectRatio: false,
+            interaction: {
+                intersect: false,
+                mode: 'index'
+            },
+            plugins: {
+                legend: {
+                    position: 'top',
+                    labels: { 
+                        font: { size: 10 },
+                        color: '#f1f5f9',
+                        usePointStyle: true,
+                        padding: 15
+                    }
+                },
+                tooltip: {
+                    backgroundColor: 'rgba(15, 23, 42, 0.9)',
+                    titleColor: '#f1f5f9',
+                    bodyColor: '#f1f5f9',
+                    borderColor: '#3b82f6',
+                    borderWidth: 1,
+                    callbacks: {
+                        label: function(context) {
+                            return `${context.dataset.label}: ${context.parsed.y}ms`;
+                        }
+                    }
+                }
+            },
+            scales: {
+                x: {
+                    display: true,
+                    title: { 
+                        display: true, 
+                        text: 'Time',
+                        color: '#94a3b8',
+                        font: { size: 10 }
+                    },
+                    grid: { color: 'rgba(148, 163, 184, 0.1)' },
+                    ticks: { 
+                        color: '#94a3b8',
+                        font: { size: 9 },
+                        maxTicksLimit: 8
+                    }
+                },
+                y: {
+                    display: true,
+                    beginAtZero: true,
+                    title: { 
+                        display: true, 
+                        text: 'Response Time (ms)',
+                        color: '#94a3b8',
+                        font: { size: 10 }
+                    },
+                    grid: { color: 'rgba(148, 163, 184, 0.1)' },
+                    ticks: { 
+                        color: '#94a3b8',
+                        font: { size: 9 }
+                    }
+                }
+            }
+        }
+    });
+
+    // Service Health Dashboard - No chart initialization needed
+    // Health scores will be updated via updateHealthDashboard() function
+}
+
+// Setup automation controls
+function setupAutomationControls() {
+    const toggleBtn = document.getElementById('toggleAutomation');
+    const intervalSelect = document.getElementById('requestInterval');
+    const clearChartBtn = document.getElementById('clearChart');
+    const clearLatencyChartBtn = document.getElementById('clearLatencyChart');
+    const exportBtn = document.getElementById('exportData');
+    const clearHistoryBtn = document.getElementById('clearHistory');
+
+    toggleBtn.addEventListener('click', toggleAutomation);
+    intervalSelect.addEventListener('change', (e) => {
+        automationState.intervalMs = parseInt(e.target.value);
+        if (automationState.running) {
+            stopAutomation();
+            startAutomation();
+        }
+    });
+
+    clearChartBtn.addEventListener('click', clearCharts);
+    clearLatencyChartBtn.addEventListener('click', () => clearLatencyChart());
+    exportBtn.addEventListener('click', exportAnalyticsData);
+    clearHistoryBtn.addEventListener('click', clearAnalyticsHistory);
+}
+
+// Toggle automation on/off
+function toggleAutomation() {
+    if (automationState.running) {
+        stopAutomation();
+    } else {
+        startAutomation();
+    }
+}
+
+// Start automated requests
+function startAutomation() {
+    console.log('🚀 Starting automated requests...');
+    automationState.running = true;
+
+    const toggleBtn = document.getElementById('toggleAutomation');
+    const statusEl = document.getElementById('automationStatus');
+
+    toggleBtn.textContent = '⏹️ Stop Auto Requests';
+    toggleBtn.className = 'control-btn automation-running';
+    statusEl.textContent = 'Running';
+
+    // Start making requests
+    automationState.interval = setInterval(makeAutomatedRequest, automationState.intervalMs);
+
+    // Make first request immediately
+    makeAutomatedRequest();
+}
+
+// Stop automated requests
+function stopAutomation() {
+    console.log('⏹️ Stopping automated requests...');
+    automationState.running = false;
+
+    if (automationState.interval) {
+        clearInterval(automationState.interval);
+        automationState.interval = null;
+    }
+
+    const toggleBtn = document.getElementById('toggleAutomation');
+    const statusEl = document.getElementById('automationStatus');
+
+    toggleBtn.textContent = '🔄 Start Auto Requests';
+    toggleBtn.className = 'control-btn automation-stopped';
+    statusEl.textContent = 'Stopped';
+}
+
+// Make an automated request
+async function makeAutomatedRequest() {
+    try {
+        // Get selected target service
+        const targetServiceSelect = document.getElementById('targetService');
+        const targetService = targetServiceSelect?.value || 'all';
+
+        // Determine which service to use
+        let service;
+        if (targetService === 'all') {
+            // Round robin through all services
+            service = availableServices[Math.floor(Math.random() * availableServices.length)];
+        } else {
+            // Use the selected service
+            service = targetService;
+        }
+
+        const prompt = automationPrompts[Math.floor(Math.random() * automationPrompts.length)];
+
+        console.log(`🤖 Auto request: ${service} - "${prompt}"`);
+
+        const requestData = {
+            prompt: `${prompt} (Auto-request #${automationState.requestCount + 1})`,
+            service: service
+        };
+
+        const response = await apiClient.post('/ai', requestData);
+
+        // Check if the request was actually successful
+        const success = response.data.success !== false;
+        const latency = response.data.latency || 0;
+        const responseSize = success ? (response.data.response?.length || 0) : 0;
+        const errorType = success ? null : (response.data.error || 'Unknown error');
+
+        // Log request with actual data from response
+        logAutomatedRequest(service, success, latency, responseSize, errorType);
+
+        automationState.requestCount++;
+        updateAutomationCounter();
+
+    } catch (error) {
+        // Log failed request (network error or exception)
+        const targetServiceSelect = document.getElementById('targetService');
+        const targetService = targetServiceSelect?.value || 'all';
+        const service = targetService === 'all' ? availableServices[0] : targetService;
+
+        // Try to extract error details
+        const errorMessage = error.response?.data?.error || error.message || 'Request failed';
+        const latency = error.response?.data?.latency || 0;
+
+        logAutomatedRequest(service, false, latency, 0, errorMessage);
+
+        console.error('❌ Automated request failed:', error.message);
+    }
+}
+
+// Log automated request for analytics
+function logAutomatedRequest(service, success, latency, responseSize, errorType = null) {
+    const requestLog = {
+        timestamp: new Date(),
+        service: service,
+        success: success,
+        latency: latency,
+        responseSize: responseSize,
+        errorType: errorType,
+        isAutomated: true
+    };
+
+    // Add to analytics data
+    analyticsData.requests.push(requestLog);
+
+    // Log to database for persistent storage
+    logRequestToDatabase(service, success, latency, responseSize, errorType, true);
+
+    // Update service stats and failure recovery
+    if (analyticsData.serviceStats[service]) {
+        analyticsData.serviceStats[service].requests++;
+        if (!success) {
+            analyticsData.serviceStats[service].failures++;
+            analyticsData.serviceStats[service].lastFailure = new Date();
+            analyticsData.serviceStats[service].lastFailureReason = errorType || 'Unknown Error';
+            analyticsData.serviceStats[service].recoveryTime = null;
+
+            // Track error patterns
+            trackErrorPattern(errorType || 'Unknown Error');
+        } else {
+            analyticsData.serviceStats[service].totalLatency += latency;
+
+            // Initialize recentLatencies array if it doesn't exist
+            if (!analyticsData.serviceStats[service].recentLatencies) {
+                analyticsData.serviceStats[service].recentLatencies = [];
+            }
+
+            // Track recent latencies with timestamps for line chart (keep last 15)
+            analyticsData.serviceStats[service].recentLatencies.push({
+                latency: latency,
+                timestamp: new Date()
+            });
+            if (analyticsData.serviceStats[service].recentLatencies.length > 15) {
+                analyticsData.serviceStats[service].recentLatencies.shift();
+            }
+
+            // Check for recovery from previous failure
+            if (analyticsData.serviceStats[service].lastFailure && !analyticsData.serviceStats[service].recoveryTime) {
+                const recoveryTime = (new Date() - analyticsData.serviceStats[service].lastFailure) / 1000;
+                analyticsData.serviceStats[service].recoveryTime = recoveryTime;
+            }
+        }
+    }
+
+    // Add to performance history
+    analyticsData.performanceHistory.push({
+        timestamp: requestLog.timestamp,
+        avgLatency: latency
+    });
+
+    // Keep only last 50 requests in performance history
+    if (analyticsData.performanceHistory.length > 50) {
+        analyticsData.performanceHistory.shift();
+    }
+
+    // Update performance trends
+    updatePerformanceTrends(success, latency);
+
+    // Update history table
+    updateHistoryTable(requestLog);
+
+    // Store analytics data
+    storeAnalyticsData();
+}
+
+// Log request to database for persistent storage
+async function logRequestToDatabase(service, success, latency, responseSize = 0, errorType = null, automated = false) {
+    try {
+        await axios.post('/api/log-request', {
+            service,
+            success,
+            latency,
+            responseSize,
+            errorType,
+            automated,
+            chaosActive: false,
+            circuitBreakerState: null
+        });
+    } catch (error) {
+        console.error('Failed to log request to database:', error);
+    }
+}
+
+// Track error patterns for leaderboard
+function trackErrorPattern(errorType) {
+    if (!errorType || errorType === 'null') errorType = 'Unknown Error';
+
+    if (!analyticsData.errorPatterns[errorType]) {
+        analyticsData.errorPatterns[errorType] = 0;
+    }
+    analyticsData.errorPatterns[errorType]++;
+}
+
+// Update performance trends analysis
+function updatePerformanceTrends(success, latency) {
+    const now = Date.now();
+
+    // Add current data point
+    analyticsData.performanceTrends.latencyTrend.push({ time: now, value: latency });
+    analyticsData.performanceTrends.successRateTrend.push({ time: now, success: success });
+
+    // Keep only last 20 data points for trend analysis
+    if (analyticsData.performanceTrends.latencyTrend.length > 20) {
+        analyticsData.performanceTrends.latencyTrend.shift();
+    }
+    if (analyticsData.performanceTrends.successRateTrend.length > 20) {
+        analyticsData.performanceTrends.successRateTrend.shift();
+    }
+
+    // Analyze trends
+    analyzePerformanceTrends();
+}
+
+// Analyze performance trends
+function analyzePerformanceTrends() {
+    const latencyData = analyticsData.performanceTrends.latencyTrend;
+    const successData = analyticsData.performanceTrends.successRateTrend;
+
+    if (latencyData.length < 5) {
+        analyticsData.performanceTrends.trendAnalysis = 'insufficient_data';
+        return;
+    }
+
+    // Analyze latency trend
+    const recentLatency = latencyData.slice(-5).map(d => d.value);
+    const earlierLatency = latencyData.slice(-10, -5).map(d => d.value);
+
+    const recentAvg = recentLatency.reduce((a, b) => a + b, 0) / recentLatency.length;
+    const earlierAvg = earlierLatency.length > 0 ? 
+        earlierLatency.reduce((a, b) => a + b, 0) / earlierLatency.length : recentAvg;
+
+    const latencyTrend = recentAvg > earlierAvg * 1.2 ? 'degrading' : 
+                        recentAvg < earlierAvg * 0.8 ? 'improving' : 'stable';
+
+    // Analyze success rate trend
+    const recentSuccess = successData.slice(-5).filter(d => d.success).length / 5;
+    const earlierSuccess = successData.slice(-10, -5).filter(d => d.success).length / 5;
+
+    const successTrend = recentSuccess < earlierSuccess * 0.8 ? 'degrading' :
+                        recentSuccess > earlierSuccess * 1.2 ? 'improving' : 'stable';
+
+    // Overall assessment
+    if (latencyTrend === 'degrading' || successTrend === 'degrading') {
+        analyticsData.performanceTrends.trendAnalysis = 'degrading';
+    } else if (latencyTrend === 'improving' && successTrend === 'improving') {
+        analyticsData.performanceTrends.trendAnalysis = 'improving';
+    } else {
+        analyticsData.performanceTrends.trendAnalysis = 'stable';
+    }
+}
+
+// Update analytics displays
+function updateAnalytics(metricsData) {
+    updateCharts();
+    updateInsights(metricsData);
+}
+
+// Update all charts with current data
+function updateCharts() {
+    // Update performance chart
+    if (charts.performance && analyticsData.performanceHistory.length > 0) {
+        const labels = analyticsData.performanceHistory.map(d => 
+            d.timestamp.toLocaleTimeString()
+        );
+        const data = analyticsData.performanceHistory.map(d => d.avgLatency);
+
+        charts.performance.data.labels = labels;
+        charts.performance.data.datasets[0].data = data;
+        charts.performance.update('none');
+    }
+
+    // Update response time trends
+    if (charts.latency) {
+        const services = ['gemini', 'cohere', 'huggingface'];
+
+        // Collect all timestamps from all services
+        const allTimestamps = new Set();
+        services.forEach(service => {
+            const recentLatencies = analyticsData.serviceStats[service].recentLatencies || [];
+            recentLatencies.forEach(entry => {
+                if (entry && entry.timestamp) {
+                    // Convert timestamp to Date if it's a string
+                    const timestamp = entry.timestamp instanceof Date ? entry.timestamp : new Date(entry.timestamp);
+                    allTimestamps.add(timestamp.getTime());
+                }
+            });
+        });
+
+        // Sort timestamps and take last 15
+        const sortedTimestamps = Array.from(allTimestamps).sort((a, b) => a - b).slice(-15);
+
+        // Create labels from timestamps (show time only)
+        const labels = sortedTimestamps.map(ts => {
+            const date = new Date(ts);
+            return date.toLocaleTimeString('en-US', { 
+                hour: '2-digit', 
+                minute: '2-digit', 
+                second: '2-digit',
+                hour12: false 
+            });
+        });
+
+        charts.latency.data.labels = labels;
+
+        // Update each service's dataset
+        services.forEach((service, index) => {
+            const recentLatencies = analyticsData.serviceStats[service].recentLatencies || [];
+
+            // Map latencies to timestamps
+            const dataPoints = sortedTimestamps.map(ts => {
+                const entry = recentLatencies.find(e => {
+                    if (e && e.timestamp) {
+                        // Convert timestamp to Date if it's a string
+                        const timestamp = e.timestamp instanceof Date ? e.timestamp : new Date(e.timestamp);
+                        return timestamp.getTime() === ts;
+                    }
+                    return false;
+                });
+                return entry ? entry.latency : null;
+            });
+
+            charts.latency.data.datasets[index].data = dataPoints;
+        });
+
+        charts.latency.update('none');
+    }
+
+    // Update health dashboard
+    updateHealthDashboard();
+}
+
+// Update service performance leaderboard
+function updateHealthDashboard() {
+    const services = [
+        { name: 'gemini', displayName: 'Google Gemini', icon: '💎' },
+        { name: 'cohere', displayName: 'Cohere', icon: '🧠' },
+        { name: 'huggingface', displayName: 'Hugging Face', icon: '🤗' }
+    ];
+
+    // Calculate performance metrics for each service
+    const servicePerformance = services.map(service => {
+        const stats = analyticsData.serviceStats[service.name];
+
+        const successRate = stats.requests > 0 ? 
+            ((stats.requests - stats.failures) / stats.requests) * 100 : 100;
+
+        const avgSpeed = stats.requests > 0 && (stats.requests - stats.failures) > 0 ? 
+            stats.totalLatency / (stats.requests - stats.failures) : 0;
+
+        return {
+            ...service,
+            requests: stats.requests,
+            failures: stats.failures,
+            successRate: successRate,
+            avgSpeed: avgSpeed,
+            score: (successRate * 0.6) + (avgSpeed > 0 ? Math.max(0, 100 - avgSpeed / 30) : 0) * 0.4
+        };
+    });
+
+    // Sort by score (highest first)
+    servicePerformance.sort((a, b) => b.score - a.score);
+
+    // Update leaderboard UI
+    const leaderboardContainer = document.getElementById('serviceLeaderboard');
+    if (!leaderboardContainer) return;
+
+    const medals = ['🥇', '🥈', '🥉'];
+    const rankClasses = ['rank-1', 'rank-2', 'rank-3'];
+
+    leaderboardContainer.innerHTML = servicePerformance.map((service, index) => {
+        const performanceLabel = service.successRate >= 95 && service.avgSpeed < 2000 ? 'excellent' :
+                                service.successRate >= 80 && service.avgSpeed < 3000 ? 'good' : 'poor';
+        const performanceText = performanceLabel.charAt(0).toUpperCase() + performanceLabel.slice(1);
+
+        return `
+            <div class="leaderboard-item ${rankClasses[index]}">
+                <div class="rank-badge">${medals[index]}</div>
+                <div class="service-info">
+                    <div class="service-name-rank">
+                        <span class="service-icon-rank">${service.icon}</span>
+                        ${service.displayName}
+                    </div>
+                    <div class="service-stats-rank">
+                        <div class="stat-item-rank">
+                            <span class="stat-label-rank">Requests</span>
+                            <span class="stat-value-rank">${service.requests}</span>
+                        </div>
+                        <div class="stat-item-rank">
+                            <span class="stat-label-rank">Success Rate</span>
+                            <span class="stat-value-rank ${service.successRate >= 90 ? 'success' : service.successRate >= 70 ? 'warning' : 'error'}">
+                                ${service.successRate.toFixed(1)}%
+                            </span>
+                        </div>
+                        <div class="stat-item-rank">
+                            <span class="stat-label-rank">Avg Speed</span>
+                            <span class="stat-value-rank ${service.avgSpeed < 2000 ? 'success' : service.avgSpeed < 3000 ? 'warning' : 'error'}">
+                                ${Math.round(service.avgSpeed)}ms
+                            </span>
+                        </div>
+                        <div class="stat-item-rank">
+                            <span class="stat-label-rank">Failures</span>
+                            <span class="stat-value-rank ${service.failures === 0 ? 'success' : 'error'}">
+                                ${service.failures}
+                            </span>
+                        </div>
+                    </div>
+                </div>
+                <div class="performance-badge ${performanceLabel}">${performanceText}</div>
+            </div>
+        `;
+    }).join('');
+}
+
+// Update key insights
+function updateInsights(metricsData) {
+    // Prefer live backend metrics when available, otherwise fall back to local analyticsData
+    const hasBackendMetrics = metricsData && metricsData.aiServices;
+
+    // Most reliable service (prefer backend successRate)
+    if (hasBackendMetrics) {
+        let best = null;
+        let bestRate = -1;
+        for (const s in metricsData.aiServices) {
+            const svc = metricsData.aiServices[s];
+            const sr = parseFloat(svc.successRate);
+            if (!isNaN(sr) && sr > bestRate) {
+                bestRate = sr;
+                best = s;
+            }
+        }
+        document.getElementById('mostReliable').textContent = best ? (best.charAt(0).toUpperCase() + best.slice(1)) : 'See Health Dashboard';
+    } else {
+        document.getElementById('mostReliable').textContent = 'See Health Dashboard';
+    }
+
+    // Fastest service
+    let fastestService = 'N/A';
+    let lowestLatency = Infinity;
+
+    if (hasBackendMetrics) {
+        for (const service in metricsData.aiServices) {
+            const svc = metricsData.aiServices[service];
+            const avgLatency = parseFloat(svc.avgLatency);
+            const successRate = parseFloat(svc.successRate) || 0;
+            if (!isNaN(avgLatency) && successRate > 0) {
+                if (avgLatency < lowestLatency) {
+                    lowestLatency = avgLatency;
+                    fastestService = service.charAt(0).toUpperCase() + service.slice(1);
+                }
+            }
+        }
+    } else {
+        // Fallback to analytics data
+        const services = Object.keys(analyticsData.serviceStats);
+        services.forEach(service => {
+            const stats = analyticsData.serviceStats[service];
+            const successfulRequests = stats.requests - stats.failures;
+            if (successfulRequests > 0) {
+                const avgLatency = stats.totalLatency / successfulRequests;
+                if (avgLatency < lowestLatency) {
+                    lowestLatency = avgLatency;
+                    fastestService = service.charAt(0).toUpperCase() + service.slice(1);
+                }
+            }
+        });
+    }
+
+    document.getElementById('fastestService').textContent = 
+        fastestService !== 'N/A' ? `${fastestService} (${lowestLatency.toFixed(0)}ms)` : fastestService;
+
+    // Peak performance time (use local performance history if available)
+    if (analyticsData.performanceHistory.length > 0) {
+        const bestPerformance = analyticsData.performanceHistory.reduce((best, current) => 
+            (current.avgLatency < best.avgLatency ? current : best)
+        );
+        // defensive: ensure timestamp is a Date
+        const ts = bestPerformance.timestamp instanceof Date ? bestPerformance.timestamp : new Date(bestPerformance.timestamp);
+        document.getElementById('peakTime').textContent = ts.toLocaleTimeString();
+    } else {
+        document.getElementById('peakTime').textContent = 'Calculating...';
+    }
+
+    // Average uptime: prefer backend uptime if provided, otherwise compute from uptimeStart
+    let uptimeHours = 'N/A';
+    if (hasBackendMetrics && typeof metricsData.uptime !== 'undefined') {
+        // metricsData.uptime may be seconds or milliseconds; infer units
+        let uptimeMs = null;
+        const u = Number(metricsData.uptime);
+        if (!isNaN(u)) {
+            if (u > 1e6) uptimeMs = u; // assume milliseconds
+            else uptimeMs = u * 1000; // assume seconds
+        }
+        if (uptimeMs !== null) {
+            uptimeHours = (uptimeMs / (1000 * 60 * 60)).toFixed(1);
+            document.getElementById('avgUptime').textContent = `${uptimeHours}h`;
+        }
+    }
+
+    if (uptimeHours === 'N/A') {
+        // fallback: compute from analyticsData.uptimeStart values
+        const now = Date.now();
+        const services = Object.keys(analyticsData.serviceStats);
+        if (services.length > 0) {
+            const avgUptime = services.reduce((sum, service) => {
+                return sum + (now - analyticsData.serviceStats[service].uptimeStart);
+            }, 0) / services.length;
+            const computedHours = (avgUptime / (1000 * 60 * 60)).toFixed(1);
+            document.getElementById('avgUptime').textContent = `${computedHours}h`;
+        } else {
+            document.getElementById('avgUptime').textContent = 'N/A';
+        }
+    }
+
+    // Request volume and error trends
+    if (analyticsData.requests.length > 0) {
+        const recentRequests = analyticsData.requests.filter(r => 
+            (Date.now() - new Date(r.timestamp).getTime()) < 300000 // Last 5 minutes
+        ).length;
+        const requestRate = (recentRequests / 5).toFixed(1); // Requests per minute
+        document.getElementById('volumeTrend').textContent = `${requestRate}/min`;
+
+        const recentErrors = analyticsData.requests.filter(r => 
+            (!r.success) && ((Date.now() - new Date(r.timestamp).getTime()) < 300000)
+        ).length;
+        const errorRate = recentRequests > 0 ? ((recentErrors / recentRequests) * 100).toFixed(1) : 0;
+        document.getElementById('errorTrend').textContent = `${errorRate}%`;
+    } else if (hasBackendMetrics) {
+        // Use backend totals as a simple snapshot when no local analytics exist
+        const total = Number(metricsData.totalRequests) || 0;
+        const failed = Number(metricsData.failedRequests) || 0;
+        document.getElementById('volumeTrend').textContent = `${total} total`;
+        const errPct = total > 0 ? ((failed / total) * 100).toFixed(1) : 0;
+        document.getElementById('errorTrend').textContent = `${errPct}%`;
+    } else {
+        document.getElementById('volumeTrend').textContent = '0.0/min';
+        document.getElementById('errorTrend').textContent = '0%';
+    }
+
+    // Update advanced analytics
+    updateFailureRecovery();
+    updateErrorLeaderboard();
+    updatePerformanceTrendsDisplay();
+}
+
+// Circuit Breaker Functions
+async function updateCircuitBreakerStatus(prefetched) {
+    try {
+        const cbData = prefetched || (await axios.get('/circuit-breaker/status')).data;
+
+        const container = document.getElementById('circuitBreakerStatus');
+        if (!container) return;
+
+        const serviceNames = {
+            gemini: { name: 'Gemini', icon: '🟢' },
+            cohere: { name: 'Cohere', icon: '🔵' },
+            huggingface: { name: 'Hugging Face', icon: '🟡' }
+        };
+
+        const stateIcons = {
+            'CLOSED': '✅',
+            'OPEN': '⛔',
+            'HALF_OPEN': '⚠️'
+        };
+
+        container.innerHTML = Object.keys(cbData).map(service => {
+            const cb = cbData[service];
+            const svcInfo = serviceNames[service] || { name: service, icon: '⚪' };
+            const stateClass = cb.state.toLowerCase().replace('_', '-');
+
+            const timeInStateMs = cb.timeInCurrentState || 0;
+            const timeInStateSec = Math.round(timeInStateMs / 1000);
+
+            return `
+                <div class="circuit-breaker-item state-${stateClass}">
+                    <div class="cb-left">
+                        <div class="cb-service">
+                            <span class="cb-service-icon">${svcInfo.icon}</span>
+                            ${svcInfo.name}
+                        </div>
+                        <div class="cb-state ${cb.state}">
+                            ${stateIcons[cb.state] || '●'} ${cb.state.replace('_', '-')}
+                        </div>
+                        <div class="cb-metrics">
+                            <div class="cb-metric">
+                                <span class="cb-metric-label">Failures</span>
+                                <span class="cb-metric-value">${cb.failureCount}/${cb.failureThreshold}</span>
+                            </div>
+                            <div class="cb-metric">
+                                <span class="cb-metric-label">Success Rate</span>
+                                <span class="cb-metric-value">${cb.metrics.successRate}%</span>
+                            </div>
+                            <div class="cb-metric">
+                                <span class="cb-metric-label">Time in State</span>
+                                <span class="cb-metric-value">${timeInStateSec}s</span>
+                            </div>
+                        </div>
+                    </div>
+                    <div class="cb-actions">
+                        <button class="cb-reset-btn" onclick="resetCircuitBreaker('${service}')">
+                            🔄 Reset
+                        </button>
+                    </div>
+                </div>
+            `;
+        }).join('');
+
+    } catch (error) {
+        console.error('Error fetching circuit breaker status:', error);
+        const container = document.getElementById('circuitBreakerStatus');
+        if (container) {
+            container.innerHTML = `
+                <div class="circuit-breaker-item">
+                    <div class="cb-service">❌ Unable to fetch circuit breaker status</div>
+                </div>
+            `;
+        }
+    }
+}
+
+async function resetCircuitBreaker(service) {
+    try {
+        const response = await axios.post('/circuit-breaker/reset', { service });
+        console.log(`✅ Circuit breaker for ${service} reset:`, response.data);
+
+        // Immediately update the display
+        await updateCircuitBreakerStatus();
+
+        // Show success notification
+        showNotification(`Circuit breaker for ${service} has been reset`, 'success');
+    } catch (error) {
+        console.error(`Error resetting circuit breaker for ${service}:`, error);
+        showNotification(`Failed to reset circuit breaker for ${service}`, 'error');
+    }
+}
+
+async function resetAllCircuitBreakers() {
+    try {
+        const response = await axios.post('/circuit-breaker/reset', {});
+        console.log('✅ All circuit breakers reset:', response.data);
+
+        // Immediately update the display
+        await updateCircuitBreakerStatus();
+
+        // Show success notification
+        showNotification('All circuit breakers have been reset', 'success');
+    } catch (error) {
+        console.error('Error resetting all circuit breakers:', error);
+        showNotification('Failed to reset circuit breakers', 'error');
+    }
+}
+
+function showNotification(message, type = 'info') {
+    // Simple notification (you can enhance this with a proper toast library)
+    const notification = document.createElement('div');
+    notification.style.cssText = `
+        position: fixed;
+        top: 20px;
+        right: 20px;
+        padding: 16px 24px;
+        background: ${type === 'success' ? 'var(--success-green)' : type === 'error' ? 'var(--error-red)' : 'var(--primary-blue)'};
+        color: white;
+        border-radius: 8px;
+        box-shadow: 0 4px 12px rgba(0,0,0,0.3);
+        z-index: 10000;
+        font-weight: 600;
+        animation: slideIn 0.3s ease-out;
+    `;
+    notification.textContent = message;
+    document.body.appendChild(notification);
+
+    setTimeout(() => {
+        notification.style.animation = 'slideOut 0.3s ease-in';
+        setTimeout(() => notification.remove(), 300);
+    }, 3000);
+}
+
+// Update failure recovery display
+function updateFailureRecovery() {
+    const services = Object.keys(analyticsData.serviceStats);
+    const serviceNames = {
+        gemini: 'Gemini',
+        cohere: 'Cohere',
+        huggingface: 'Hugging Face'
+    };
+
+    services.forEach(service => {
+        const stats = analyticsData.serviceStats[service];
+        const recoveryEl = document.getElementById(`${service}-recovery`);
+        const timeEl = document.getElementById(`${service}-recovery-time`);
+
+        if (recoveryEl && timeEl) {
+            if (stats.failures === 0) {
+                recoveryEl.innerHTML = `<strong>No failures</strong>`;
+                recoveryEl.style.color = 'var(--success-green)';
+                timeEl.textContent = '-';
+            } else if (stats.recoveryTime !== null && stats.lastFailure) {
+                // Service recovered
+                const failureDate = new Date(stats.lastFailure);
+                const failureTime = failureDate.toLocaleTimeString();
+                const failureReason = stats.lastFailureReason || 'Unknown';
+
+                recoveryEl.innerHTML = `<strong>Recovered</strong><br><small style="color: var(--text-secondary);">Reason: ${failureReason}</small>`;
+                recoveryEl.style.color = 'var(--warning-yellow)';
+                timeEl.innerHTML = `Last failed at ${failureTime}<br>Recovered in ${stats.recoveryTime.toFixed(1)}s`;
+            } else if (stats.lastFailure) {
+                // Service currently failing
+                const failureDate = new Date(stats.lastFailure);
+                const failureTime = failureDate.toLocaleTimeString();
+                const timeSinceFailure = (Date.now() - stats.lastFailure) / 1000;
+                const failureReason = stats.lastFailureReason || 'Unknown';
+
+                recoveryEl.innerHTML = `<strong>Failed</strong><br><small style="color: var(--text-secondary);">Reason: ${failureReason}</small>`;
+                recoveryEl.style.color = 'var(--error-red)';
+                timeEl.innerHTML = `Failed at ${failureTime}<br>${timeSinceFailure.toFixed(0)}s ago`;
+            }
+        }
+    });
+}
+
+// Update error patterns leaderboard
+function updateErrorLeaderboard() {
+    const leaderboardEl = document.getElementById('errorLeaderboard');
+    if (!leaderboardEl) return;
+
+    // Sort errors by count
+    const sortedErrors = Object.entries(analyticsData.errorPatterns)
+        .sort(([,a], [,b]) => b - a)
+        .slice(0, 5); // Top 5 errors
+
+    if (sortedErrors.length === 0) {
+        leaderboardEl.innerHTML = `
+            <div class="error-item">
+                <span class="error-rank">#1</span>
+                <span class="error-type">No errors yet</span>
+                <span class="error-count">0</span>
+            </div>
+        `;
+        return;
+    }
+
+    leaderboardEl.innerHTML = sortedErrors.map(([errorType, count], index) => `
+        <div class="error-item">
+            <span class="error-rank">#${index + 1}</span>
+            <span class="error-type">${errorType}</span>
+            <span class="error-count">${count}</span>
+        </div>
+    `).join('');
+}
+
+// Update performance trends display
+function updatePerformanceTrendsDisplay() {
+    const trends = analyticsData.performanceTrends;
+
+    // Latency trend
+    const latencyTrendEl = document.getElementById('latencyTrend');
+    const latencyIndicatorEl = document.getElementById('latencyIndicator');
+
+    if (!trends.latencyTrend || trends.latencyTrend.length < 5) {
+        if (latencyTrendEl) {
+            latencyTrendEl.textContent = 'Collecting data...';
+            latencyTrendEl.style.color = 'var(--text-secondary)';
+        }
+        if (latencyIndicatorEl) {
+            latencyIndicatorEl.textContent = '⏳';
+            latencyIndicatorEl.style.color = 'var(--text-secondary)';
+        }
+    } else {
+        const recentLatency = trends.latencyTrend.slice(-5).map(d => Number(d.value)).filter(v => !isNaN(v));
+        const earlierLatency = trends.latencyTrend.slice(-10, -5).map(d => Number(d.value)).filter(v => !isNaN(v));
+
+        if (recentLatency.length >= 3 && earlierLatency.length >= 3) {
+            const recentAvg = recentLatency.reduce((a, b) => a + b, 0) / recentLatency.length;
+            const earlierAvg = earlierLatency.reduce((a, b) => a + b, 0) / earlierLatency.length;
+
+            const changePercent = ((recentAvg - earlierAvg) / earlierAvg * 100).toFixed(1);
+
+            if (recentAvg > earlierAvg * 1.2) {
+                if (latencyTrendEl) {
+                    latencyTrendEl.innerHTML = `<strong>Getting Slower</strong><br><small>(+${changePercent}%)</small>`;
+                    latencyTrendEl.style.color = 'var(--error-red)';
+                }
+                if (latencyIndicatorEl) {
+                    latencyIndicatorEl.textContent = '📈';
+                    latencyIndicatorEl.style.color = 'var(--error-red)';
+                }
+            } else if (recentAvg < earlierAvg * 0.8) {
+                if (latencyTrendEl) {
+                    latencyTrendEl.innerHTML = `<strong>Getting Faster</strong><br><small>(${changePercent}%)</small>`;
+                    latencyTrendEl.style.color = 'var(--success-green)';
+                }
+                if (latencyIndicatorEl) {
+                    latencyIndicatorEl.textContent = '📉';
+                    latencyIndicatorEl.style.color = 'var(--success-green)';
+                }
+            } else {
+                if (latencyTrendEl) {
+                    latencyTrendEl.innerHTML = `<strong>Stable</strong><br><small>Avg: ${recentAvg.toFixed(0)}ms</small>`;
+                    latencyTrendEl.style.color = 'var(--text-primary)';
+                }
+                if (latencyIndicatorEl) {
+                    latencyIndicatorEl.textContent = '→';
+                    latencyIndicatorEl.style.color = 'var(--text-primary)';
+                }
+            }
+        } else {
+            if (latencyTrendEl) {
+                latencyTrendEl.textContent = 'Insufficient data';
+                latencyTrendEl.style.color = 'var(--text-secondary)';
+            }
+            if (latencyIndicatorEl) {
+                latencyIndicatorEl.textContent = '⏳';
+                latencyIndicatorEl.style.color = 'var(--text-secondary)';
+            }
+        }
+    }
+
+    // Success rate trend
+    const successTrendEl = document.getElementById('successTrend');
+    const successIndicatorEl = document.getElementById('successIndicator');
+
+    if (!trends.successRateTrend || trends.successRateTrend.length < 5) {
+        if (successTrendEl) {
+            successTrendEl.textContent = 'Collecting data...';
+            successTrendEl.style.color = 'var(--text-secondary)';
+        }
+        if (successIndicatorEl) {
+            successIndicatorEl.textContent = '⏳';
+            successIndicatorEl.style.color = 'var(--text-secondary)';
+        }
+    } else {
+        const recent = trends.successRateTrend.slice(-5);
+        const earlier = trends.successRateTrend.slice(-10, -5);
+
+        if (recent.length >= 3 && earlier.length >= 3) {
+            const recentSuccess = recent.filter(d => d.success).length / recent.length;
+            const earlierSuccess = earlier.filter(d => d.success).length / earlier.length;
+
+            const recentPct = (recentSuccess * 100).toFixed(1);
+            const earlierPct = (earlierSuccess * 100).toFixed(1);
+
+            if (recentSuccess < earlierSuccess * 0.8 && earlierSuccess > 0) {
+                if (successTrendEl) {
+                    successTrendEl.innerHTML = `<strong>Declining</strong><br><small>${recentPct}% (was ${earlierPct}%)</small>`;
+                    successTrendEl.style.color = 'var(--error-red)';
+                }
+                if (successIndicatorEl) {
+                    successIndicatorEl.textContent = '📉';
+                    successIndicatorEl.style.color = 'var(--error-red)';
+                }
+            } else if (recentSuccess > earlierSuccess * 1.1 || (earlierSuccess === 0 && recentSuccess > 0)) {
+                if (successTrendEl) {
+                    successTrendEl.innerHTML = `<strong>Improving</strong><br><small>${recentPct}% (was ${earlierPct}%)</small>`;
+                    successTrendEl.style.color = 'var(--success-green)';
+                }
+                if (successIndicatorEl) {
+                    successIndicatorEl.textContent = '📈';
+                    successIndicatorEl.style.color = 'var(--success-green)';
+                }
+            } else {
+                if (successTrendEl) {
+                    successTrendEl.innerHTML = `<strong>Stable</strong><br><small>${recentPct}% success</small>`;
+                    successTrendEl.style.color = 'var(--text-primary)';
+                }
+                if (successIndicatorEl) {
+                    successIndicatorEl.textContent = '→';
+                    successIndicatorEl.style.color = 'var(--text-primary)';
+                }
+            }
+        } else {
+            if (successTrendEl) {
+                successTrendEl.textContent = 'Insufficient data';
+                successTrendEl.style.color = 'var(--text-secondary)';
+            }
+            if (successIndicatorEl) {
+                successIndicatorEl.textContent = '⏳';
+                successIndicatorEl.style.color = 'var(--text-secondary)';
+            }
+        }
+    }
+}
+
+// Update history table
+function updateHistoryTable(requestLog) {
+    const tableBody = document.getElementById('historyTableBody');
+
+    // Remove "no data" row if it exists
+    const noDataRow = tableBody.querySelector('.no-data');
+    if (noDataRow) {
+        noDataRow.remove();
+    }
+
+    // Create new row
+    const row = document.createElement('tr');
+    row.innerHTML = `
+        <td>${requestLog.timestamp.toLocaleString()}</td>
+        <td>${requestLog.service.charAt(0).toUpperCase() + requestLog.service.slice(1)}</td>
+        <td class="${requestLog.success ? 'status-success' : 'status-failed'}">
+            ${requestLog.success ? '✅ Success' : '❌ Failed'}
+        </td>
+        <td>${requestLog.latency}ms</td>
+        <td>${requestLog.responseSize} chars</td>
+        <td>${requestLog.errorType || '-'}</td>
+    `;
+
+    // Insert at the beginning
+    tableBody.insertBefore(row, tableBody.firstChild);
+
+    // Keep only last 100 rows
+    const rows = tableBody.querySelectorAll('tr');
+    if (rows.length > 100) {
+        tableBody.removeChild(rows[rows.length - 1]);
+    }
+}
+
+// Update automation counter
+function updateAutomationCounter() {
+    document.getElementById('automationCounter').textContent = 
+        `${automationState.requestCount} requests sent`;
+}
+
+// Clear all charts
+function clearCharts() {
+    analyticsData.performanceHistory = [];
+    Object.keys(analyticsData.serviceStats).forEach(service => {
+        analyticsData.serviceStats[service] = {
+            requests: 0, failures: 0, totalLatency: 0, uptimeStart: Date.now()
+        };
+    });
+
+    updateCharts();
+    updateInsights({});
+}
+
+// Clear latency trends chart only
+function clearLatencyChart() {
+    if (charts.latency) {
+        charts.latency.data.labels = [];
+        charts.latency.data.datasets.forEach(dataset => {
+            dataset.data = [];
+        });
+        charts.latency.update();
+    }
+}
+
+// Export analytics data as CSV
+function exportAnalyticsData() {
+    const csvContent = [
+        ['Timestamp', 'Service', 'Success', 'Latency (ms)', 'Response Size', 'Error Type', 'Automated'].join(','),
+        ...analyticsData.requests.map(r => [
+            r.timestamp.toISOString(),
+            r.service,
+            r.success,
+            r.latency,
+            r.responseSize,
+            r.errorType || '',
+            r.isAutomated || false
+        ].join(','))
+    ].join('\\n');
+
+    const blob = new Blob([csvContent], { type: 'text/csv' });
+    const url = window.URL.createObjectURL(blob);
+    const a = document.createElement('a');
+    a.href = url;
+    a.download = `ai-resilience-data-${new Date().toISOString().split('T')[0]}.csv`;
+    a.click();
+    window.URL.revokeObjectURL(url);
+}
+
+// Clear analytics history
+function clearAnalyticsHistory() {
+    if (confirm('Are you sure you want to clear all analytics history?')) {
+        analyticsData.requests = [];
+        analyticsData.performanceHistory = [];
+
+        const tableBody = document.getElementById('historyTableBody');
+        tableBody.innerHTML = '<tr><td colspan="6" class="no-data">No data collected yet. Start automation to begin analysis.</td></tr>';
+
+        clearCharts();
+        localStorage.removeItem('aiResilienceAnalytics');
+    }
+}
+
+// Clear ALL data - both client-side and server-side
+async function clearAllData() {
+    if (confirm('⚠️ This will permanently delete ALL data including:\n\n• Service Performance Leaderboard\n• Key Insights\n• Advanced Analysis\n• Historical Reports\n• All Metrics and Charts\n• Server-side Data\n\nAre you absolutely sure?')) {
+        try {
+            console.log('🗑️ Clearing all data...');
+
+            // 1. Clear client-side analytics data
+            analyticsData.requests = [];
+            analyticsData.performanceHistory = [];
+            analyticsData.errorPatterns = {};
+            analyticsData.performanceTrends = {
+                latencyTrend: [],
+                successRateTrend: [],
+                trendAnalysis: 'stable'
+            };
+
+            // 2. Reset service stats
+            Object.keys(analyticsData.serviceStats).forEach(service => {
+                analyticsData.serviceStats[service] = {
+                    requests: 0,
+                    failures: 0,
+                    totalLatency: 0,
+                    recentLatencies: [],
+                    uptimeStart: Date.now(),
+                    lastFailure: null,
+                    lastFailureReason: null,
+                    recoveryTime: null
+                };
+            });
+
+            // 3. Reset automation state
+            automationState.requestCount = 0;
+            updateAutomationCounter();
+
+            // 4. Clear localStorage
+            localStorage.removeItem('aiResilienceAnalytics');
+
+            // 5. Clear history table
+            const tableBody = document.getElementById('historyTableBody');
+            if (tableBody) {
+                tableBody.innerHTML = '<tr><td colspan="6" class="no-data">No data collected yet. Start automation to begin analysis.</td></tr>';
+            }
+
+            // 6. Clear error leaderboard
+            const errorLeaderboard = document.getElementById('errorLeaderboard');
+            if (errorLeaderboard) {
+                errorLeaderboard.innerHTML = '<div class="error-item"><div class="error-type">No errors recorded yet</div><div class="error-count">0</div></div>';
+            }
+
+            // 7. Reset insights
+            document.getElementById('mostReliable').textContent = 'No data yet';
+            document.getElementById('fastestService').textContent = 'No data yet';
+            document.getElementById('peakTime').textContent = 'No data yet';
+            document.getElementById('avgUptime').textContent = 'No data yet';
+            document.getElementById('volumeTrend').textContent = 'No data yet';
+            document.getElementById('errorTrend').textContent = 'No data yet';
+
+            // 8. Clear charts
+            clearCharts();
+
+            // 9. Call backend to reset server-side metrics
+            try {
+                const response = await axios.post('http://localhost:3000/metrics/reset');
+                if (response.data.success) {
+                    console.log('✅ Server-side data cleared successfully');
+                }
+            } catch (error) {
+                console.error('⚠️ Failed to clear server-side data:', error);
+            }
+
+            // 10. Reload metrics to show fresh state
+            await fetchMetrics();
+
+            alert('✅ All data has been cleared successfully!');
+            console.log('✅ All data cleared');
+
+        } catch (error) {
+            console.error('❌ Error clearing data:', error);
+            alert('❌ Error clearing data. Please check console for details.');
+        }
+    }
+}
+
+// Store analytics data in localStorage
+function storeAnalyticsData() {
+    try {
+        // Keep only essential data for storage
+        const dataToStore = {
+            requests: analyticsData.requests.slice(-500), // Last 500 requests
+            serviceStats: analyticsData.serviceStats,
+            automationCount: automationState.requestCount
+        };
+        localStorage.setItem('aiResilienceAnalytics', JSON.stringify(dataToStore));
+    } catch (error) {
+        console.warn('Could not store analytics data:', error);
+    }
+}
+
+// Load stored analytics data
+function loadStoredAnalytics() {
+    try {
+        const stored = localStorage.getItem('aiResilienceAnalytics');
+        if (stored) {
+            const data = JSON.parse(stored);
+
+            // Restore requests (convert timestamp strings back to Date objects)
+            if (data.requests) {
+                analyticsData.requests = data.requests.map(r => ({
+                    ...r,
+                    timestamp: new Date(r.timestamp)
+                }));
+
+                // Rebuild history table
+                analyticsData.requests.forEach(updateHistoryTable);
+            }
+
+            // Restore service stats
+            if (data.serviceStats) {
+                analyticsData.serviceStats = { ...analyticsData.serviceStats, ...data.serviceStats };
+
+                // Ensure recentLatencies array exists for all services (migration for new feature)
+                ['gemini', 'cohere', 'huggingface'].forEach(service => {
+                    if (!analyticsData.serviceStats[service].recentLatencies) {
+                        analyticsData.serviceStats[service].recentLatencies = [];
+                    } else {
+                        // Migrate old format (just numbers) to new format (objects with timestamp)
+                        analyticsData.serviceStats[service].recentLatencies = 
+                            analyticsData.serviceStats[service].recentLatencies.map(entry => {
+                                if (typeof entry === 'number') {
+                                    // Old format: just latency number
+                                    return { latency: entry, timestamp: new Date() };
+                                }
+                                // Convert timestamp string to Date object
+                                if (entry.timestamp && !(entry.timestamp instanceof Date)) {
+                                    entry.timestamp = new Date(entry.timestamp);
+                                }
+                                return entry; // Already new format
+                            });
+                    }
+                });
+            }
+
+            // Restore automation count
+            if (data.automationCount) {
+                automationState.requestCount = data.automationCount;
+                updateAutomationCounter();
+            }
+        }
+    } catch (error) {
+        console.warn('Could not load stored analytics data:', error);
+    }
+}
+
+// ========================================
+// Long-Term Chaos Testing Functions
+// ========================================
+
+let chaosTestPollingInterval = null;
+
+// Start chaos testing
+async function startChaosTest(mode) {
+    try {
+        const response = await axios.post('http://localhost:3000/chaos-testing/start', {
+            mode: mode,
+            duration: mode === 'continuous' ? 24 : 0.5, // 24 hours for continuous, ~30 min for validation
+            outputDir: 'chaos-test-results'
+        });
+
+        if (response.data.success) {
+            updateChaosTestUI(true, mode);
+            alert(`✅ ${mode === 'validation' ? 'Validation Suite' : 'Continuous Testing'} started successfully!`);
+
+            // Start polling for updates
+            startChaosTestPolling();
+        } else {
+            alert(`⚠️ ${response.data.message}`);
+        }
+    } catch (error) {
+        console.error('Error starting chaos test:', error);
+        alert('❌ Failed to start chaos testing. Make sure the backend is running.');
+    }
+}
+
+// Stop chaos testing
+async function stopChaosTest() {
+    try {
+        const response = await axios.post('http://localhost:3000/chaos-testing/stop');
+
+        if (response.data.success) {
+            updateChaosTestUI(false);
+            alert('✅ Chaos testing stopped successfully!');
+            stopChaosTestPolling();
+
+            // Refresh results to show final output
+            setTimeout(() => refreshChaosResults(), 2000);
+        } else {
+            alert(`⚠️ ${response.data.message}`);
+        }
+    } catch (error) {
+        console.error('Error stopping chaos test:', error);
+        alert('❌ Failed to stop chaos testing.');
+    }
+}
+
+// Update UI based on testing status
+function updateChaosTestUI(running, mode = null) {
+    const statusDot = document.getElementById('chaosTestDot');
+    const statusText = document.getElementById('chaosTestStatusText');
+    const modeEl = document.getElementById('chaosTestMode');
+    const startValidationBtn = document.getElementById('startValidationBtn');
+    const startContinuousBtn = document.getElementById('startContinuousBtn');
+    const stopBtn = document.getElementById('stopChaosBtn');
+
+    if (running) {
+        statusDot.className = 'status-dot bg-success';
+        statusText.textContent = 'Running';
+        modeEl.textContent = mode === 'validation' ? 'Validation Suite' : 'Continuous Testing';
+        startValidationBtn.disabled = true;
+        startContinuousBtn.disabled = true;
+        stopBtn.disabled = false;
+    } else {
+        statusDot.className = 'status-dot bg-neutral';
+        statusText.textContent = 'Not Running';
+        modeEl.textContent = '—';
+        startValidationBtn.disabled = false;
+        startContinuousBtn.disabled = false;
+        stopBtn.disabled = true;
+    }
+}
+
+// Start polling for chaos test updates
+function startChaosTestPolling() {
+    if (chaosTestPollingInterval) {
+        clearInterval(chaosTestPollingInterval);
+    }
+
+    // Poll every 5 seconds
+    chaosTestPollingInterval = setInterval(async () => {
+        try {
+            const response = await axios.get('http://localhost:3000/chaos-testing/status');
+
+            if (response.data.success) {
+                const status = response.data.status;
+
+                // Update status display
+                if (status.running) {
+                    updateChaosTestDuration(status.startTime);
+
+                    // Update output
+                    if (status.outputLines && status.outputLines.length > 0) {
+                        updateChaosTestOutput(status.outputLines);
+                    }
+                } else {
+                    // Test stopped
+                    stopChaosTestPolling();
+                    updateChaosTestUI(false);
+                }
+            }
+        } catch (error) {
+            console.error('Error polling chaos test status:', error);
+        }
+    }, 5000);
+}
+
+// Stop polling
+function stopChaosTestPolling() {
+    if (chaosTestPollingInterval) {
+        clearInterval(chaosTestPollingInterval);
+        chaosTestPollingInterval = null;
+    }
+}
+
+// Update duration display
+function updateChaosTestDuration(startTime) {
+    if (!startTime) return;
+
+    const start = new Date(startTime);
+    const now = new Date();
+    const duration = Math.floor((now - start) / 1000); // seconds
+
+    const hours = Math.floor(duration / 3600);
+    const minutes = Math.floor((duration % 3600) / 60);
+    const seconds = duration % 60;
+
+    const durationText = `${hours}h ${minutes}m ${seconds}s`;
+    document.getElementById('chaosTestDuration').textContent = durationText;
+}
+
+// Update output terminal
+function updateChaosTestOutput(outputLines) {
+    const terminal = document.getElementById('chaosTestOutput');
+
+    // Clear and add new lines
+    terminal.innerHTML = '';
+
+    outputLines.slice(-50).forEach(line => {
+        const div = document.createElement('div');
+        div.className = 'terminal-line';
+
+        if (line.error) {
+            div.classList.add('error');
+        } else if (line.message.includes('SUCCESS') || line.message.includes('✅')) {
+            div.classList.add('success');
+        } else if (line.message.includes('WARNING') || line.message.includes('⚠️')) {
+            div.classList.add('warning');
+        }
+
+        div.textContent = `[${new Date(line.timestamp).toLocaleTimeString()}] ${line.message}`;
+        terminal.appendChild(div);
+    });
+
+    // Auto-scroll to bottom
+    terminal.scrollTop = terminal.scrollHeight;
+}
+
+// Clear output terminal
+function clearChaosOutput() {
+    const terminal = document.getElementById('chaosTestOutput');
+    terminal.innerHTML = '<div class="terminal-line">Output cleared...</div>';
+}
+
+// Refresh chaos test results
+async function refreshChaosResults() {
+    try {
+        const response = await axios.get('http://localhost:3000/chaos-testing/results');
+
+        if (response.data.success) {
+            const results = response.data.results;
+            const resultsList = document.getElementById('chaosResultsList');
+
+            if (results.length === 0) {
+                resultsList.innerHTML = '<div class="results-empty">No test results yet</div>';
+            } else {
+                resultsList.innerHTML = results.map(result => `
+                    <div class="result-item" onclick="viewResult('${result.filename}')">
+                        <div>
+                            <div class="result-filename">📄 ${result.filename}</div>
+                            <div class="result-meta">
+                                <span>${new Date(result.modified).toLocaleString()}</span>
+                                <span>${(result.size / 1024).toFixed(2)} KB</span>
+                            </div>
+                        </div>
+                    </div>
+                `).join('');
+            }
+        }
+    } catch (error) {
+        console.error('Error refreshing results:', error);
+    }
+}
+
+// View specific result file
+async function viewResult(filename) {
+    try {
+        const response = await axios.get(`http://localhost:3000/chaos-testing/results/${filename}`);
+
+        if (response.data.success) {
+            const content = response.data.content;
+
+            // Show in a modal or new window
+            const win = window.open('', '_blank');
+            win.document.write(`
+                <html>
+                <head>
+                    <title>${filename}</title>
+                    <style>
+                        body { 
+                            background: #1e293b; 
+                            color: #f1f5f9; 
+                            font-family: 'Courier New', monospace; 
+                            padding: 20px;
+                            line-height: 1.6;
+                        }
+                        pre { white-space: pre-wrap; }
+                    </style>
+                </head>
+                <body>
+                    <h2>${filename}</h2>
+                    <pre>${content}</pre>
+                </body>
+                </html>
+            `);
+        }
+    } catch (error) {
+        console.error('Error viewing result:', error);
+        alert('❌ Failed to load result file');
+    }
+}
+
+// Check chaos testing status on page load
+async function checkChaosTestingStatus() {
+    try {
+        const response = await axios.get('http://localhost:3000/chaos-testing/status');
+
+        if (response.data.success) {
+            const status = response.data.status;
+
+            if (status.running) {
+                // Resume UI state
+                updateChaosTestUI(true, status.mode);
+                startChaosTestPolling();
+
+                // Update display with existing status
+                if (status.startTime) {
+                    updateChaosTestDuration(status.startTime);
+                }
+            } else {
+                updateChaosTestUI(false);
+            }
+        }
+    } catch (error) {
+        console.error('Error checking chaos testing status:', error);
+    }
+}
+
+// ========================================
+// Chaos Engineering Functions
+// ========================================
+
+// Toggle chaos panel visibility
+function toggleChaosPanel() {
+    const panel = document.getElementById('chaosPanel');
+    const toggle = document.getElementById('chaosToggle');
+
+    if (panel.classList.contains('collapsed')) {
+        panel.classList.remove('collapsed');
+        toggle.classList.remove('collapsed');
+        toggle.textContent = '▼';
+    } else {
+        panel.classList.add('collapsed');
+        toggle.classList.add('collapsed');
+        toggle.textContent = '▶';
+    }
+}
+
+// Update intensity display based on chaos type
+function updateIntensityDisplay() {
+    const intensity = document.getElementById('chaosIntensity').value;
+    const chaosType = document.getElementById('chaosType').value;
+    const intensityValue = document.getElementById('intensityValue');
+    const intensityUnit = document.getElementById('intensityUnit');
+    const intensityHelp = document.getElementById('intensityHelp');
+
+    intensityValue.textContent = intensity;
+
+    // Adjust display based on chaos type
+    switch(chaosType) {
+        case 'latency':
+            intensityUnit.textContent = 'ms';
+            intensityHelp.textContent = `Will add ${intensity}ms delay to each request`;
+            // Scale slider for latency (0-10000ms)
+            document.getElementById('chaosIntensity').max = 10000;
+            document.getElementById('chaosIntensity').value = Math.min(intensity, 10000);
+            break;
+        case 'failure':
+        case 'intermittent':
+            intensityUnit.textContent = '%';
+            intensityHelp.textContent = `${intensity}% chance of request failure`;
+            document.getElementById('chaosIntensity').max = 100;
+            break;
+        case 'timeout':
+            intensityUnit.textContent = 'x100ms';
+            intensityHelp.textContent = `Requests will hang for ${intensity * 100}ms then fail`;
+            document.getElementById('chaosIntensity').max = 300;
+            break;
+        case 'unavailable':
+            intensityUnit.textContent = '';
+            intensityHelp.textContent = 'Service will be completely unavailable (intensity ignored)';
+            break;
+        case 'corruption':
+            intensityUnit.textContent = '';
+            intensityHelp.textContent = 'Responses will be corrupted/malformed (intensity ignored)';
+            break;
+        default:
+            intensityUnit.textContent = '%';
+            intensityHelp.textContent = 'Intensity setting';
+    }
+}
+
+// Update intensity display when chaos type changes
+document.getElementById('chaosType')?.addEventListener('change', updateIntensityDisplay);
+
+// Inject chaos experiment
+async function injectChaos() {
+    const service = document.getElementById('chaosService').value;
+    const type = document.getElementById('chaosType').value;
+    const intensity = parseInt(document.getElementById('chaosIntensity').value);
+    const duration = parseInt(document.getElementById('chaosDuration').value);
+
+    const btn = document.getElementById('injectChaosBtn');
+    btn.disabled = true;
+    btn.textContent = '⏳ Injecting...';
+
+    try {
+        const response = await fetch(`${BACKEND_URL}/chaos/inject`, {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({ service, type, intensity, duration })
+        });
+
+        const data = await response.json();
+
+        if (data.success) {
+            console.log('🔥 Chaos injected:', data.experiment);
+            showNotification(`Chaos injected: ${type} on ${service} for ${duration}s`, 'success');
+
+            // Mark service card as under chaos
+            markServiceUnderChaos(service, type);
+
+            // Fetch and update active experiments
+            updateActiveExperiments();
+        } else {
+            showNotification(`Failed to inject chaos: ${data.error}`, 'error');
+        }
+    } catch (error) {
+        console.error('Chaos inject error:', error);
+        showNotification(`Error injecting chaos: ${error.message}`, 'error');
+    } finally {
+        btn.disabled = false;
+        btn.textContent = '🔥 Inject Chaos';
+    }
+}
+
+// Stop all chaos experiments
+async function stopAllChaos() {
+    const btn = document.getElementById('stopAllChaosBtn');
+    btn.disabled = true;
+    btn.textContent = '⏳ Stopping...';
+
+    try {
+        const response = await fetch(`${BACKEND_URL}/chaos/stop`, {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({ service: 'all' })
+        });
+
+        const data = await response.json();
+
+        if (data.success) {
+            console.log('🔵 All chaos stopped');
+            showNotification('All chaos experiments stopped', 'success');
+            clearAllChaosMarkers();
+            updateActiveExperiments();
+        } else {
+            showNotification(`Failed to stop chaos: ${data.error}`, 'error');
+        }
+    } catch (error) {
+        console.error('Chaos stop error:', error);
+        showNotification(`Error stopping chaos: ${error.message}`, 'error');
+    } finally {
+        btn.disabled = false;
+        btn.textContent = '⏹️ Stop All';
+    }
+}
+
+// Stop individual chaos experiment
+async function stopChaosExperiment(service) {
+    try {
+        const response = await fetch(`${BACKEND_URL}/chaos/stop`, {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({ service })
+        });
+
+        const data = await response.json();
+
+        if (data.success) {
+            console.log(`🔵 Chaos stopped for ${service}`);
+            showNotification(`Chaos stopped for ${service}`, 'success');
+            clearServiceChaosMarker(service);
+            updateActiveExperiments();
+        }
+    } catch (error) {
+        console.error('Chaos stop error:', error);
+        showNotification(`Error stopping chaos: ${error.message}`, 'error');
+    }
+}
+
+// Update active experiments display
+async function updateActiveExperiments(prefetched) {
+    try {
+        const data = prefetched || await (await fetch(`${BACKEND_URL}/chaos/status`)).json();
+
+        const listContainer = document.getElementById('activeExperimentsList');
+
+        if (data.active && data.active.length > 0) {
+            listContainer.innerHTML = data.active.map(exp => `
+                <div class="experiment-item">
+                    <div class="experiment-info">
+                        <div class="experiment-service">
+                            🔥 ${capitalizeService(exp.service)} - ${getChaoEmoji(exp.type)} ${exp.type}
+                        </div>
+                        <div class="experiment-details">
+                            Intensity: ${exp.intensity}${getIntensityUnit(exp.type)} | Duration: ${exp.remainingSeconds}s remaining
+                        </div>
+                    </div>
+                    <div class="experiment-timer">⏱️ ${exp.remainingSeconds}s</div>
+                    <button class="experiment-stop-btn" onclick="stopChaosExperiment('${exp.service}')">
+                        Stop
+                    </button>
+                </div>
+            `).join('');
+
+            // Ensure service cards are marked
+            data.active.forEach(exp => {
+                markServiceUnderChaos(exp.service, exp.type);
+            });
+        } else {
+            listContainer.innerHTML = '<div class="no-experiments">No active chaos experiments</div>';
+            clearAllChaosMarkers();
+        }
+    } catch (error) {
+        console.error('Error fetching chaos status:', error);
+    }
+}
+
+// Helper functions
+function capitalizeService(service) {
+    const names = {
+        'gemini': 'Gemini',
+        'cohere': 'Cohere',
+        'huggingface': 'Hugging Face'
+    };
+    return names[service] || service;
+}
+
+function getChaoEmoji(type) {
+    const emojis = {
+        'latency': '🐌',
+        'failure': '❌',
+        'timeout': '⏱️',
+        'intermittent': '🎲',
+        'unavailable': '🚫',
+        'corruption': '🔀'
+    };
+    return emojis[type] || '🔥';
+}
+
+function getIntensityUnit(type) {
+    switch(type) {
+        case 'latency': return 'ms';
+        case 'failure':
+        case 'intermittent': return '%';
+        case 'timeout': return 'x100ms';
+        default: return '';
+    }
+}
+
+function markServiceUnderChaos(service, type) {
+    const serviceCard = document.querySelector(`#${service}-status`)?.closest('.service-card');
+    if (serviceCard) {
+        serviceCard.classList.add('chaos-active');
+
+        // Add chaos badge if not present
+        const serviceName = serviceCard.querySelector('.service-name');
+        if (serviceName && !serviceName.querySelector('.chaos-badge')) {
+            const badge = document.createElement('span');
+            badge.className = 'chaos-badge';
+            badge.textContent = `🔥 ${type}`;
+            serviceName.appendChild(badge);
+        }
+    }
+}
+
+function clearServiceChaosMarker(service) {
+    const serviceCard = document.querySelector(`#${service}-status`)?.closest('.service-card');
+    if (serviceCard) {
+        serviceCard.classList.remove('chaos-active');
+        const badge = serviceCard.querySelector('.chaos-badge');
+        if (badge) badge.remove();
+    }
+}
+
+function clearAllChaosMarkers() {
+    document.querySelectorAll('.service-card').forEach(card => {
+        card.classList.remove('chaos-active');
+    });
+    document.querySelectorAll('.chaos-badge').forEach(badge => {
+        badge.remove();
+    });
+}
+
+function showNotification(message, type = 'info') {
+    // Create notification element
+    const notification = document.createElement('div');
+    notification.className = `notification notification-${type}`;
+    notification.style.cssText = `
+        position: fixed;
+        top: 20px;
+        right: 20px;
+        padding: 16px 20px;
+        background: ${type === 'success' ? 'var(--success-green)' : type === 'error' ? 'var(--error-red)' : 'var(--primary-blue)'};
+        color: white;
+        border-radius: 8px;
+        box-shadow: 0 4px 12px rgba(0,0,0,0.3);
+        z-index: 10000;
+        font-weight: 500;
+        animation: slideIn 0.3s ease;
+    `;
+    notification.textContent = message;
+
+    document.body.appendChild(notification);
+
+    // Auto-remove after 4 seconds
+    setTimeout(() => {
+        notification.style.animation = 'slideOut 0.3s ease';
+        setTimeout(() => notification.remove(), 300);
+    }, 4000);
+}
+
+// Poll chaos status every 2 seconds when dashboard is active
+let chaosPollingInterval = null;
+function startChaosPolling() {
+    updateActiveExperiments(); // Initial fetch
+    chaosPollingInterval = setInterval(() => updateActiveExperiments(), 2000);
+}
+
+function stopChaosPolling() {
+    if (chaosPollingInterval) {
+        clearInterval(chaosPollingInterval);
+        chaosPollingInterval = null;
+    }
+}
+
+// Start chaos polling when dashboard loads
+document.addEventListener('DOMContentLoaded', () => {
+    startChaosPolling();
+    updateIntensityDisplay(); // Set initial intensity display
+});